@@ -30,6 +30,7 @@ const DEFAULT_CONFIG: StackConfig = {
     https_port: null,
     dashboard: false,
     additional_args: [],
+    key_algorithm: 'ec',
   },
   services: {
     qbittorrent: {
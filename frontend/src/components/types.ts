@@ -70,6 +70,7 @@ export interface ProxyConfig {
   https_port: number | null
   dashboard: boolean
   additional_args: string[]
+  key_algorithm: 'ec' | 'rsa'
 }
 
 export interface UIConfig {
@@ -1,4 +1,15 @@
 """NAS orchestrator package initialization."""
-from .app import app
 
 __all__ = ["app"]
+
+
+def __getattr__(name: str):
+    # Import the API app on first access so processes that only need part of
+    # the package (e.g. ``python -m orchestrator.pipeline.runner``) skip it.
+    if name == "app":
+        from .app import app
+
+        # Importing the submodule bound ``app`` to it; rebind to the FastAPI app
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
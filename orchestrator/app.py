@@ -15,7 +15,7 @@ from uuid import uuid4
 from typing import List, Optional
 
 from fastapi import FastAPI, HTTPException, Request, Depends
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from sse_starlette.sse import EventSourceResponse
 from pydantic import BaseModel, Field, ConfigDict, ValidationError
@@ -61,6 +61,7 @@ from .models import (
     SweepScanResponse,
     SweepStartResponse,
     SweepStatusResponse,
+    validate_as,
 )
 from .system import scan_volumes, validate_path
 from .auth import (
@@ -139,11 +140,20 @@ async def startup_event():
     if not auth_manager.has_users():
         logger.info("No users found. Setup wizard will handle admin creation.")
 
+    await verifier.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks and close pooled connections."""
+    await verifier.stop()
+
 
 repo = ConfigRepository(CONFIG_ROOT)
 renderer = ComposeRenderer(ROOT_DIR / "templates")
 services = ServiceConfigurator(repo=repo)
 runner = ApplyRunner(repo=repo, renderer=renderer, services=services)
+verifier = VerificationEngine()
 
 # Only mount static files if the directory exists (not in dev mode with separate frontend)
 if UI_DIR.exists():
@@ -367,8 +377,20 @@ def validate_config(config: StackConfig) -> ValidationResult:
     return run_validation(config)
 
 
+def _model_response(model: BaseModel) -> Response:
+    """Serialize a response model once, skipping FastAPI's dump/re-validate pass.
+
+    Used by the polling endpoints; ``response_model`` on the route still
+    documents the schema.
+    """
+    return Response(
+        content=model.model_dump_json(by_alias=True),
+        media_type="application/json",
+    )
+
+
 @app.get("/api/status", response_model=StatusResponse)
-def get_status() -> StatusResponse:
+def get_status() -> Response:
     """Return a placeholder status summary for the managed services."""
     cfg = repo.load_stack()
     services = []
@@ -381,7 +403,7 @@ def get_status() -> StatusResponse:
                 message=None if enabled else "service disabled in configuration",
             )
         )
-    return StatusResponse(services=services)
+    return _model_response(StatusResponse(services=services))
 
 
 def _check_port(host: str, port: int, timeout: float = 2.0) -> bool:
@@ -398,15 +420,17 @@ _SERVICE_INTERNAL_PORTS = INTERNAL_PORTS
 
 
 @app.get("/api/health", response_model=HealthResponse)
-def get_health() -> HealthResponse:
+def get_health() -> Response:
     """Return health status with actual port connectivity checks."""
     try:
         cfg = repo.load_stack()
     except Exception:
         # Configuration invalid (fresh install) - return minimal health response
-        return HealthResponse(
-            status="unhealthy",
-            services=[],
+        return _model_response(
+            HealthResponse(
+                status="unhealthy",
+                services=[],
+            )
         )
     checks: List[HealthCheck] = []
     healthy_count = 0
@@ -502,7 +526,7 @@ def get_health() -> HealthResponse:
     else:
         overall = "unhealthy"
 
-    return HealthResponse(status=overall, services=checks)
+    return _model_response(HealthResponse(status=overall, services=checks))
 
 
 @app.get("/api/secrets", response_model=ServiceCredentialsResponse)
@@ -521,8 +545,12 @@ def update_qbittorrent_credentials(
         raise HTTPException(status_code=400, detail="Username is required")
 
     config = repo.load_stack()
-    config.services.qbittorrent.username = username
-    config.services.qbittorrent.password = payload.password
+    qbittorrent = config.services.qbittorrent.model_copy(
+        update={"username": username, "password": payload.password}
+    )
+    config = config.model_copy(
+        update={"services": config.services.model_copy(update={"qbittorrent": qbittorrent})}
+    )
     repo.save_stack(config)
 
     state = repo.load_state()
@@ -568,7 +596,7 @@ prowlarr_client = ProwlarrClient(repo)
 
 
 @app.get("/api/indexers/available", response_model=AvailableIndexersResponse)
-def get_available_indexers() -> AvailableIndexersResponse:
+def get_available_indexers() -> Response:
     """Get list of available public indexers that can be added."""
     try:
         config = repo.load_stack()
@@ -579,11 +607,11 @@ def get_available_indexers() -> AvailableIndexersResponse:
         raise HTTPException(status_code=400, detail="Prowlarr is not enabled")
 
     indexers = prowlarr_client.get_available_indexers(config)
-    return AvailableIndexersResponse(indexers=indexers)
+    return _model_response(AvailableIndexersResponse(indexers=indexers))
 
 
 @app.get("/api/indexers", response_model=ConfiguredIndexersResponse)
-def get_configured_indexers() -> ConfiguredIndexersResponse:
+def get_configured_indexers() -> Response:
     """Get list of currently configured indexers in Prowlarr."""
     try:
         config = repo.load_stack()
@@ -594,7 +622,7 @@ def get_configured_indexers() -> ConfiguredIndexersResponse:
         raise HTTPException(status_code=400, detail="Prowlarr is not enabled")
 
     indexers = prowlarr_client.get_configured_indexers(config)
-    return ConfiguredIndexersResponse(indexers=indexers)
+    return _model_response(ConfiguredIndexersResponse(indexers=indexers))
 
 
 class AddIndexersResponse(BaseModel):
@@ -1057,7 +1085,7 @@ async def stream_run_events(run_id: str, session: Session = Depends(require_auth
 def get_volumes() -> VolumesResponse:
     """Get list of available mounted volumes."""
     volumes_data = scan_volumes()
-    volumes = [VolumeInfo.model_validate(v) for v in volumes_data]
+    volumes = [validate_as(VolumeInfo, v) for v in volumes_data]
     return VolumesResponse(volumes=volumes)
 
 
@@ -1145,10 +1173,7 @@ async def verify_configuration(request: dict) -> dict:
         partial = request.get("partial", False)
         skip_service_checks = request.get("skip_service_checks", False)
 
-        # Initialize verification engine
-        verifier = VerificationEngine()
-
-        # Run verification
+        # Run verification (repeat requests for the same config are cached)
         result = await verifier.verify_configuration(
             config=config, partial=partial, skip_service_checks=skip_service_checks
         )
@@ -1235,10 +1260,14 @@ def initialize_system(request: InitializeRequest) -> InitializeResponse:
 
         # Apply service selections from wizard (if provided)
         if request.enabled_services is not None:
-            all_service_names = list(services.model_fields.keys())
-            for name in all_service_names:
-                svc = getattr(services, name)
-                svc.enabled = name in request.enabled_services
+            services = services.model_copy(
+                update={
+                    name: getattr(services, name).model_copy(
+                        update={"enabled": name in request.enabled_services}
+                    )
+                    for name in ServicesConfig.model_fields
+                }
+            )
 
         initial_config = StackConfig(
             version=1,
@@ -19,6 +19,7 @@ from .models import (
     SessionResponse,
     User,
     UserRole,
+    validate_as,
 )
 
 logger = logging.getLogger(__name__)
@@ -132,7 +133,7 @@ class AuthManager:
         }
         users.append(user_data)
 
-        return User.model_validate(user_data)
+        return validate_as(User, user_data)
 
     def authenticate(self, username: str, password: str) -> Optional[Session]:
         """Authenticate a user and create a session.
@@ -165,7 +166,7 @@ class AuthManager:
                         "sudo_expires_at": None,
                     }
                     self.state["auth"]["sessions"].append(session_data)
-                    return Session.model_validate(session_data)
+                    return validate_as(Session, session_data)
                 else:
                     return None
 
@@ -180,7 +181,7 @@ class AuthManager:
             if session_data["token"] == token:
                 expires_at = datetime.fromisoformat(session_data["expires_at"])
                 if expires_at > now:
-                    return Session.model_validate(session_data)
+                    return validate_as(Session, session_data)
                 else:
                     # Clean up expired session
                     sessions.remove(session_data)
@@ -238,13 +239,13 @@ class AuthManager:
         users = self.state["auth"]["users"]
         for user_data in users:
             if user_data["username"] == username:
-                return User.model_validate(user_data)
+                return validate_as(User, user_data)
         return None
 
     def list_users(self) -> list[User]:
         """List all users."""
         users = self.state["auth"]["users"]
-        return [User.model_validate(u) for u in users]
+        return [validate_as(User, u) for u in users]
 
     def delete_user(self, username: str) -> bool:
         """Delete a user."""
@@ -0,0 +1,111 @@
+"""Pydantic models for authentication, sessions and user management.
+
+Loaded on first use through ``orchestrator.models``; import from there.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from .models import UserRole
+
+
+class User(BaseModel):
+    """User account for authentication."""
+
+    username: str
+    password_hash: str
+    role: UserRole = UserRole.ADMIN
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    class Config:
+        json_encoders = {datetime: lambda v: v.isoformat()}
+
+
+class Session(BaseModel):
+    """Active user session."""
+
+    token: str
+    username: str
+    role: UserRole
+    created_at: datetime
+    expires_at: datetime
+    sudo_expires_at: Optional[datetime] = None
+
+    class Config:
+        json_encoders = {datetime: lambda v: v.isoformat()}
+
+
+class AuthConfig(BaseModel):
+    """Authentication configuration."""
+
+    version: int = 1
+    session_timeout_hours: int = 24
+    sudo_timeout_minutes: int = 10
+
+
+class LoginRequest(BaseModel):
+    """Request to authenticate."""
+
+    username: str
+    password: str
+
+
+class LoginResponse(BaseModel):
+    """Response after successful authentication."""
+
+    success: bool
+    token: Optional[str] = None
+    username: Optional[str] = None
+    role: Optional[UserRole] = None
+    expires_at: Optional[datetime] = None
+    message: Optional[str] = None
+
+    class Config:
+        json_encoders = {datetime: lambda v: v.isoformat()}
+
+
+class SessionResponse(BaseModel):
+    """Response with session info."""
+
+    valid: bool
+    username: Optional[str] = None
+    role: Optional[UserRole] = None
+    sudo_active: bool = False
+
+
+class SudoVerifyRequest(BaseModel):
+    """Request to verify password for sudo mode."""
+
+    password: str
+
+
+class SudoVerifyResponse(BaseModel):
+    """Response after sudo verification."""
+
+    success: bool
+    message: str
+
+
+class ChangePasswordRequest(BaseModel):
+    """Request to change password."""
+
+    current_password: str
+    new_password: str
+
+
+class CreateUserRequest(BaseModel):
+    """Request to create a new user."""
+
+    username: str
+    password: str
+    role: UserRole = UserRole.VIEWER
+
+
+class UserListResponse(BaseModel):
+    """Response with list of users."""
+
+    users: List[dict] = Field(default_factory=list)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 import secrets
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import httpx
 
@@ -519,7 +519,7 @@ class SonarrClient(ServiceClient):
         return int(candidates[0].get("id", 1))
 
     def _select_language_profile_id(
-        self, profiles: List[Dict[str, object]], preferred: List[str]
+        self, profiles: List[Dict[str, object]], preferred: Sequence[str]
     ) -> int:
         if not profiles:
             return 1
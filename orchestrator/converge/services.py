@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Set
+from typing import ClassVar, Dict, Iterator, List, Set, Tuple
 
 from ..clients.base import EnsureOutcome, ServiceClient
 from ..clients.bazarr import BazarrClient
@@ -43,6 +43,9 @@ class ServiceConfigurator:
     that depend on it are automatically skipped with a clear message.
     """
 
+    # Frozen once at import so ensure()/verify() share one ordering.
+    _ORDER: ClassVar[Tuple[str, ...]] = tuple(SERVICE_DEPENDENCY_ORDER)
+
     def __init__(self, repo: ConfigRepository) -> None:
         self.repo = repo
         self.clients: Dict[str, ServiceClient] = {
@@ -62,21 +65,9 @@ class ServiceConfigurator:
         with a descriptive message about which dependency failed.
         """
         events: List[StageEvent] = []
-        service_map = config.services.model_dump(mode="python")
         failed_services: Set[str] = set()
 
-        for name in SERVICE_DEPENDENCY_ORDER:
-            settings = service_map.get(name, {})
-            is_enabled = settings.get("enabled", True)
-            stage_name = f"configure.{name}"
-
-            # Skip disabled services
-            if not is_enabled:
-                events.append(
-                    StageEvent(stage=stage_name, status="ok", detail="skipped (disabled)")
-                )
-                continue
-
+        for name, stage_name in self._enabled_stages(config, "configure", events):
             # Check if any dependencies failed
             blocked_by = self._get_blocked_dependencies(name, failed_services)
             if blocked_by:
@@ -108,13 +99,11 @@ class ServiceConfigurator:
 
             # Run ensure and track failures
             outcome = self._safe_ensure(client, config)
-            status = "ok" if outcome.success else "failed"
-            detail = outcome.detail or ""
-            events.append(StageEvent(stage=stage_name, status=status, detail=detail))
+            events.append(self._outcome_event(stage_name, outcome))
 
             if not outcome.success:
                 failed_services.add(name)
-                logger.warning(f"Service {name} failed to configure: {detail}")
+                logger.warning(f"Service {name} failed to configure: {outcome.detail}")
 
         return events
 
@@ -125,19 +114,8 @@ class ServiceConfigurator:
         we want to see the full picture of what's healthy and what's not.
         """
         events: List[StageEvent] = []
-        service_map = config.services.model_dump(mode="python")
-
-        for name in SERVICE_DEPENDENCY_ORDER:
-            settings = service_map.get(name, {})
-            is_enabled = settings.get("enabled", True)
-            stage_name = f"verify.{name}"
-
-            if not is_enabled:
-                events.append(
-                    StageEvent(stage=stage_name, status="ok", detail="skipped (disabled)")
-                )
-                continue
 
+        for name, stage_name in self._enabled_stages(config, "verify", events):
             client = self.clients.get(name)
             if client is None:
                 events.append(
@@ -152,13 +130,33 @@ class ServiceConfigurator:
                 )
                 continue
 
-            outcome = verify(config)
-            status = "ok" if outcome.success else "failed"
-            detail = outcome.detail or ""
-            events.append(StageEvent(stage=stage_name, status=status, detail=detail))
+            events.append(self._outcome_event(stage_name, verify(config)))
 
         return events
 
+    def _enabled_stages(
+        self, config: StackConfig, stage_prefix: str, events: List[StageEvent]
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield ``(service, stage_name)`` for enabled services in order.
+
+        Disabled services are recorded as skipped in ``events`` and not
+        yielded, so callers only handle the services they must act on.
+        """
+        service_map = config.services.model_dump(mode="python")
+        for name in self._ORDER:
+            stage_name = f"{stage_prefix}.{name}"
+            if not service_map.get(name, {}).get("enabled", True):
+                events.append(
+                    StageEvent(stage=stage_name, status="ok", detail="skipped (disabled)")
+                )
+                continue
+            yield name, stage_name
+
+    @staticmethod
+    def _outcome_event(stage_name: str, outcome: EnsureOutcome) -> StageEvent:
+        status = "ok" if outcome.success else "failed"
+        return StageEvent(stage=stage_name, status=status, detail=outcome.detail or "")
+
     def _get_blocked_dependencies(
         self, service: str, failed_services: Set[str]
     ) -> Set[str]:
@@ -1,9 +1,11 @@
 import os
 import stat
 import shutil
-from pathlib import Path
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from typing import List, Dict, Optional, Any
-from datetime import datetime
 
 from orchestrator.converge.verification_models import (
     ValidationResult,
@@ -12,6 +14,48 @@ from orchestrator.converge.verification_models import (
     create_validation_error,
 )
 
+# Pre-bound factories for the path error codes raised below
+_ERR_REQUIRED = partial(create_validation_error, "PATH_REQUIRED")
+_ERR_NOT_FOUND = partial(create_validation_error, "PATH_NOT_FOUND")
+_ERR_NOT_DIRECTORY = partial(create_validation_error, "PATH_NOT_DIRECTORY")
+_ERR_NO_READ_PERMISSION = partial(create_validation_error, "PATH_NO_READ_PERMISSION")
+_ERR_NO_WRITE_PERMISSION = partial(create_validation_error, "PATH_NO_WRITE_PERMISSION")
+
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """Stat a path once, returning None if it does not exist"""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+# Top-level path fields probed up front, before the validation logic runs
+_PROBED_PATH_KEYS = ("media_path", "downloads_path", "appdata_path", "scratch_path")
+
+
+@dataclass(slots=True)
+class _PathProbe:
+    """Filesystem metadata collected for one configured path"""
+
+    stat: Optional[os.stat_result]
+    readable: bool = False
+    writable: bool = False
+    disk_usage: Optional[Any] = None
+    disk_usage_error: Optional[Exception] = None
+
+
+def _probe_path(path: str) -> _PathProbe:
+    """Collect every syscall result the validators need for a path"""
+    probe = _PathProbe(stat=_stat_or_none(path))
+    probe.readable = os.access(path, os.R_OK)
+    probe.writable = os.access(path, os.W_OK)
+    try:
+        probe.disk_usage = shutil.disk_usage(path)
+    except Exception as e:
+        probe.disk_usage_error = e
+    return probe
+
 
 class PathValidator:
     """Validates filesystem paths for configuration"""
@@ -19,10 +63,20 @@ class PathValidator:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.results = ValidationResult(success=True, duration_ms=0.0)
+        self._probes: Dict[str, _PathProbe] = {}
+
+    def update_config(self, config: Dict[str, Any]):
+        """Rebind to a new config and start a fresh result"""
+        self.config = config
+        self.results = ValidationResult(success=True, duration_ms=0.0)
+        self._probes = {}
 
     def validate_all_paths(self) -> ValidationResult:
         """Validate all paths in the configuration"""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
+
+        # Probe all paths concurrently so slow (e.g. NFS) mounts overlap
+        self._probes = self._probe_paths()
 
         # Validate main paths
         self._validate_media_path()
@@ -41,42 +95,46 @@ class PathValidator:
         self._add_path_validation_rules()
 
         # Calculate duration
-        self.results.duration_ms = (
-            datetime.utcnow() - start_time
-        ).total_seconds() * 1000
+        self.results.duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         return self.results
 
+    def _probe_paths(self) -> Dict[str, _PathProbe]:
+        """Stat the top-level paths in parallel, keyed by config field"""
+        paths = [
+            (key, self.config[key]) for key in _PROBED_PATH_KEYS if self.config.get(key)
+        ]
+        if not paths:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            probes = executor.map(lambda item: _probe_path(item[1]), paths)
+            return {key: probe for (key, _), probe in zip(paths, probes)}
+
     def _validate_media_path(self):
         """Validate media library path"""
         media_path = self.config.get("media_path")
         if not media_path:
             self.results.errors.append(
-                create_validation_error(
-                    "PATH_REQUIRED", "media_path", {"field": "Media Library Path"}
-                )
+                _ERR_REQUIRED("media_path", {"field": "Media Library Path"})
             )
             self.results.success = False
             return
 
-        path_obj = Path(media_path)
+        path_stat = self._probes["media_path"].stat
 
         # Check if path exists
-        if not path_obj.exists():
+        if path_stat is None:
             self.results.errors.append(
-                create_validation_error(
-                    "PATH_NOT_FOUND", "media_path", {"path": media_path}
-                )
+                _ERR_NOT_FOUND("media_path", {"path": media_path})
             )
             self.results.success = False
             return
 
         # Check if it's a directory
-        if not path_obj.is_dir():
+        if not stat.S_ISDIR(path_stat.st_mode):
             self.results.errors.append(
-                create_validation_error(
-                    "PATH_NOT_DIRECTORY", "media_path", {"path": media_path}
-                )
+                _ERR_NOT_DIRECTORY("media_path", {"path": media_path})
             )
             self.results.success = False
             return
@@ -86,29 +144,23 @@ class PathValidator:
         downloads_path = self.config.get("downloads_path")
         if not downloads_path:
             self.results.errors.append(
-                create_validation_error(
-                    "PATH_REQUIRED", "downloads_path", {"field": "Downloads Path"}
-                )
+                _ERR_REQUIRED("downloads_path", {"field": "Downloads Path"})
             )
             self.results.success = False
             return
 
-        path_obj = Path(downloads_path)
+        path_stat = self._probes["downloads_path"].stat
 
-        if not path_obj.exists():
+        if path_stat is None:
             self.results.errors.append(
-                create_validation_error(
-                    "PATH_NOT_FOUND", "downloads_path", {"path": downloads_path}
-                )
+                _ERR_NOT_FOUND("downloads_path", {"path": downloads_path})
             )
             self.results.success = False
             return
 
-        if not path_obj.is_dir():
+        if not stat.S_ISDIR(path_stat.st_mode):
             self.results.errors.append(
-                create_validation_error(
-                    "PATH_NOT_DIRECTORY", "downloads_path", {"path": downloads_path}
-                )
+                _ERR_NOT_DIRECTORY("downloads_path", {"path": downloads_path})
             )
             self.results.success = False
             return
@@ -118,29 +170,23 @@ class PathValidator:
         appdata_path = self.config.get("appdata_path")
         if not appdata_path:
             self.results.errors.append(
-                create_validation_error(
-                    "PATH_REQUIRED", "appdata_path", {"field": "App Data Path"}
-                )
+                _ERR_REQUIRED("appdata_path", {"field": "App Data Path"})
             )
             self.results.success = False
             return
 
-        path_obj = Path(appdata_path)
+        path_stat = self._probes["appdata_path"].stat
 
-        if not path_obj.exists():
+        if path_stat is None:
             self.results.errors.append(
-                create_validation_error(
-                    "PATH_NOT_FOUND", "appdata_path", {"path": appdata_path}
-                )
+                _ERR_NOT_FOUND("appdata_path", {"path": appdata_path})
             )
             self.results.success = False
             return
 
-        if not path_obj.is_dir():
+        if not stat.S_ISDIR(path_stat.st_mode):
             self.results.errors.append(
-                create_validation_error(
-                    "PATH_NOT_DIRECTORY", "appdata_path", {"path": appdata_path}
-                )
+                _ERR_NOT_DIRECTORY("appdata_path", {"path": appdata_path})
             )
             self.results.success = False
             return
@@ -149,22 +195,18 @@ class PathValidator:
         """Validate optional scratch path"""
         scratch_path = self.config.get("scratch_path")
         if scratch_path:
-            path_obj = Path(scratch_path)
+            path_stat = self._probes["scratch_path"].stat
 
-            if not path_obj.exists():
+            if path_stat is None:
                 self.results.errors.append(
-                    create_validation_error(
-                        "PATH_NOT_FOUND", "scratch_path", {"path": scratch_path}
-                    )
+                    _ERR_NOT_FOUND("scratch_path", {"path": scratch_path})
                 )
                 self.results.success = False
                 return
 
-            if not path_obj.is_dir():
+            if not stat.S_ISDIR(path_stat.st_mode):
                 self.results.errors.append(
-                    create_validation_error(
-                        "PATH_NOT_DIRECTORY", "scratch_path", {"path": scratch_path}
-                    )
+                    _ERR_NOT_DIRECTORY("scratch_path", {"path": scratch_path})
                 )
                 self.results.success = False
                 return
@@ -178,11 +220,9 @@ class PathValidator:
             # Validate download directory
             qb_download_dir = qb_config.get("download_dir")
             if qb_download_dir:
-                path_obj = Path(qb_download_dir)
-                if not path_obj.exists():
+                if not os.path.exists(qb_download_dir):
                     self.results.errors.append(
-                        create_validation_error(
-                            "PATH_NOT_FOUND",
+                        _ERR_NOT_FOUND(
                             "qbittorrent.download_dir",
                             {"path": qb_download_dir},
                         )
@@ -197,11 +237,9 @@ class PathValidator:
                 # Validate root folder path
                 root_folder = service_config.get("root_folder")
                 if root_folder:
-                    path_obj = Path(root_folder)
-                    if not path_obj.exists():
+                    if not os.path.exists(root_folder):
                         self.results.errors.append(
-                            create_validation_error(
-                                "PATH_NOT_FOUND",
+                            _ERR_NOT_FOUND(
                                 f"{service}.root_folder",
                                 {"path": root_folder},
                             )
@@ -219,13 +257,12 @@ class PathValidator:
         for config_key, description in paths_to_check:
             path_value = self.config.get(config_key)
             if path_value:
-                path_obj = Path(path_value)
+                probe = self._probes[config_key]
 
                 # Check read permission
-                if not os.access(path_obj, os.R_OK):
+                if not probe.readable:
                     self.results.errors.append(
-                        create_validation_error(
-                            "PATH_NO_READ_PERMISSION",
+                        _ERR_NO_READ_PERMISSION(
                             config_key,
                             {"path": path_value, "description": description},
                         )
@@ -233,10 +270,9 @@ class PathValidator:
                     self.results.success = False
 
                 # Check write permission
-                if not os.access(path_obj, os.W_OK):
+                if not probe.writable:
                     self.results.errors.append(
-                        create_validation_error(
-                            "PATH_NO_WRITE_PERMISSION",
+                        _ERR_NO_WRITE_PERMISSION(
                             config_key,
                             {"path": path_value, "description": description},
                         )
@@ -254,11 +290,13 @@ class PathValidator:
         for config_key, min_space in paths_to_check:
             path_value = self.config.get(config_key)
             if path_value:
-                path_obj = Path(path_value)
+                probe = self._probes[config_key]
 
                 try:
                     # Get disk usage
-                    total, used, free = shutil.disk_usage(path_obj)
+                    if probe.disk_usage_error is not None:
+                        raise probe.disk_usage_error
+                    total, used, free = probe.disk_usage
                     free_gb = free / (1024**3)
 
                     # Convert min_space to GB
@@ -298,54 +336,25 @@ class PathValidator:
 
     def _add_path_validation_rules(self):
         """Add client-side validation rules for paths"""
-        self.results.client_side_rules.update(
-            {
-                "media_path": ClientValidationRule(
-                    field="media_path",
-                    type="string",
-                    required=True,
-                    min_length=3,
-                    max_length=255,
-                    pattern=None,
-                    min_value=None,
-                    max_value=None,
-                    custom_rules=[],
-                ),
-                "downloads_path": ClientValidationRule(
-                    field="downloads_path",
-                    type="string",
-                    required=True,
-                    min_length=3,
-                    max_length=255,
-                    pattern=None,
-                    min_value=None,
-                    max_value=None,
-                    custom_rules=[],
-                ),
-                "appdata_path": ClientValidationRule(
-                    field="appdata_path",
-                    type="string",
-                    required=True,
-                    min_length=3,
-                    max_length=255,
-                    pattern=None,
-                    min_value=None,
-                    max_value=None,
-                    custom_rules=[],
-                ),
-                "scratch_path": ClientValidationRule(
-                    field="scratch_path",
-                    type="string",
-                    required=False,
-                    min_length=3,
-                    max_length=255,
-                    pattern=None,
-                    min_value=None,
-                    max_value=None,
-                    custom_rules=[],
-                ),
-            }
-        )
+        self.results.client_side_rules.update(_PATH_CLIENT_RULES)
+
+
+# Client-side rules for path fields; independent of config, so built once
+_PATH_CLIENT_RULES: Dict[str, ClientValidationRule] = {
+    field: ClientValidationRule(
+        field=field,
+        type="string",
+        required=required,
+        min_length=3,
+        max_length=255,
+    )
+    for field, required in (
+        ("media_path", True),
+        ("downloads_path", True),
+        ("appdata_path", True),
+        ("scratch_path", False),
+    )
+}
 
 
 def get_mount_points() -> List[str]:
@@ -366,19 +375,20 @@ def get_mount_points() -> List[str]:
 
 def is_path_mounted(path: str) -> bool:
     """Check if a path is mounted"""
-    path_obj = Path(path).resolve()
+    real_path = os.path.realpath(path)
 
     try:
-        stat_info = os.stat(path_obj)
+        stat_info = os.stat(real_path)
         stat_dev = stat_info.st_dev
 
         # Check parent directories
-        parent = path_obj.parent
-        while parent != path_obj:
+        current = real_path
+        parent = os.path.dirname(current)
+        while parent != current:
             parent_stat = os.stat(parent)
             if parent_stat.st_dev != stat_dev:
                 return True
-            parent = parent.parent
+            current, parent = parent, os.path.dirname(parent)
 
         return False
     except FileNotFoundError:
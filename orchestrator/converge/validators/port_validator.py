@@ -1,6 +1,7 @@
 import socket
+import time
+from collections import defaultdict
 from typing import List, Dict, Optional, Any, Tuple
-from datetime import datetime
 
 from orchestrator.converge.verification_models import (
     ValidationResult,
@@ -9,6 +10,16 @@ from orchestrator.converge.verification_models import (
     create_validation_error,
 )
 
+# Services whose ports are checked for conflicts and exposed as client rules
+_PORT_SERVICES = (
+    "qbittorrent",
+    "prowlarr",
+    "radarr",
+    "sonarr",
+    "jellyfin",
+    "jellyseerr",
+)
+
 
 class PortValidator:
     """Validates network ports for configuration"""
@@ -17,9 +28,14 @@ class PortValidator:
         self.config = config
         self.results = ValidationResult(success=True, duration_ms=0.0)
 
+    def update_config(self, config: Dict[str, Any]):
+        """Rebind to a new config and start a fresh result"""
+        self.config = config
+        self.results = ValidationResult(success=True, duration_ms=0.0)
+
     def validate_all_ports(self) -> ValidationResult:
         """Validate all ports in the configuration"""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
         # Get available network interfaces
         self._validate_network_interfaces()
@@ -34,9 +50,7 @@ class PortValidator:
         self._add_port_validation_rules()
 
         # Calculate duration
-        self.results.duration_ms = (
-            datetime.utcnow() - start_time
-        ).total_seconds() * 1000
+        self.results.duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         return self.results
 
@@ -118,22 +132,12 @@ class PortValidator:
 
     def _check_port_conflicts(self):
         """Check for conflicts between service ports"""
-        service_ports = {}
+        service_ports: Dict[int, List[str]] = defaultdict(list)
 
         # Collect all service ports
-        services = [
-            "qbittorrent",
-            "prowlarr",
-            "radarr",
-            "sonarr",
-            "jellyfin",
-            "jellyseerr",
-        ]
-        for service in services:
+        for service in _PORT_SERVICES:
             port = self.config.get(service, {}).get("port")
             if port:
-                if port not in service_ports:
-                    service_ports[port] = []
                 service_ports[port].append(service)
 
         # Check for conflicts
@@ -165,29 +169,23 @@ class PortValidator:
 
     def _add_port_validation_rules(self):
         """Add client-side validation rules for ports"""
-        port_rule = ClientValidationRule(
-            field="port",
-            type="number",
-            required=True,
-            min_value=1,
-            max_value=65535,
-            pattern=None,
-            min_length=None,
-            max_length=None,
-            custom_rules=["port_available", "unique_port"],
-        )
+        self.results.client_side_rules.update(_PORT_CLIENT_RULES)
+
+
+def _build_port_rules() -> Dict[str, ClientValidationRule]:
+    """Client-side rules for service ports; they do not depend on config"""
+    port_rule = ClientValidationRule(
+        field="port",
+        type="number",
+        required=True,
+        min_value=1,
+        max_value=65535,
+        custom_rules=("port_available", "unique_port"),
+    )
+    return {f"{service}.port": port_rule for service in _PORT_SERVICES}
+
 
-        # Add port validation rules for each service
-        services = [
-            "qbittorrent",
-            "prowlarr",
-            "radarr",
-            "sonarr",
-            "jellyfin",
-            "jellyseerr",
-        ]
-        for service in services:
-            self.results.client_side_rules[f"{service}.port"] = port_rule
+_PORT_CLIENT_RULES: Dict[str, ClientValidationRule] = _build_port_rules()
 
 
 def get_available_ports(start_port: int = 8000, end_port: int = 9000) -> List[int]:
@@ -1,7 +1,11 @@
 import httpx
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime
+import random
+import shutil
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import ClassVar, Dict, List, Optional, Any, Tuple
 from urllib.parse import urlparse
 
 from orchestrator.converge.verification_models import (
@@ -12,25 +16,295 @@ from orchestrator.converge.verification_models import (
 )
 
 
+# Fail fast on hosts with no listener; a healthy service answers well within read
+PROBE_TIMEOUT = httpx.Timeout(connect=0.5, read=2.0, write=1.0, pool=0.5)
+
+# Upper bound on probes in flight at once for a single validator
+MAX_CONCURRENT_PROBES = 16
+
+# Transient gateway statuses worth a single jittered retry
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+@dataclass(frozen=True)
+class ServiceSpec:
+    """How to probe one HTTP service for connectivity"""
+
+    key: str
+    label: str
+    default_port: int
+    path: str
+    missing_suggestions: Tuple[str, ...]
+    port_field: str = "port"
+    uses_api_key: bool = False
+    # Unreachable web UIs are only warnings; unreachable APIs are errors
+    unreachable_is_error: bool = True
+    warn_if_unauthenticated: bool = False
+    # Only the status code matters; HEAD skips the body where the service allows it
+    method: str = "GET"
+
+
+# HTTP services in priority order; the remux agent is checked separately
+SERVICE_SPECS: Tuple[ServiceSpec, ...] = (
+    ServiceSpec(
+        key="qbittorrent",
+        label="qBittorrent",
+        default_port=8080,
+        path="/api/v2/app/version",
+        method="HEAD",
+        port_field="web_port",
+        warn_if_unauthenticated=True,
+        missing_suggestions=(
+            "Configure qBittorrent for download management",
+            "qBittorrent is required for the media pipeline",
+        ),
+    ),
+    ServiceSpec(
+        key="prowlarr",
+        label="Prowlarr",
+        default_port=9696,
+        path="/api/v1/status",
+        uses_api_key=True,
+        missing_suggestions=(
+            "Configure Prowlarr for indexer management",
+            "Prowlarr provides automatic indexers for Radarr/Sonarr",
+        ),
+    ),
+    ServiceSpec(
+        key="radarr",
+        label="Radarr",
+        default_port=7878,
+        path="/api/v3/status",
+        uses_api_key=True,
+        missing_suggestions=(
+            "Configure Radarr for movie management",
+            "Radarr manages movie downloads and library",
+        ),
+    ),
+    ServiceSpec(
+        key="sonarr",
+        label="Sonarr",
+        default_port=8989,
+        path="/api/v3/status",
+        uses_api_key=True,
+        missing_suggestions=(
+            "Configure Sonarr for TV show management",
+            "Sonarr manages TV show downloads and library",
+        ),
+    ),
+    ServiceSpec(
+        key="jellyfin",
+        label="Jellyfin",
+        default_port=8096,
+        path="/web/index.html",
+        method="HEAD",
+        unreachable_is_error=False,
+        missing_suggestions=(
+            "Configure Jellyfin for media serving",
+            "Jellyfin provides media streaming and library management",
+        ),
+    ),
+    ServiceSpec(
+        key="jellyseerr",
+        label="Jellyseerr",
+        default_port=5055,
+        path="",
+        method="HEAD",
+        unreachable_is_error=False,
+        missing_suggestions=(
+            "Configure Jellyseerr for request management",
+            "Jellyseerr provides user-friendly media request interface",
+        ),
+    ),
+)
+
+SERVICE_SPECS_BY_KEY: Dict[str, ServiceSpec] = {
+    spec.key: spec for spec in SERVICE_SPECS
+}
+
+# (message, suggestions) for the warning raised when a service is not configured
+_MISSING_SUGGESTIONS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    **{
+        spec.key: (f"{spec.label} configuration is missing", spec.missing_suggestions)
+        for spec in SERVICE_SPECS
+    },
+    "remux_agent": (
+        "Remux Agent configuration is missing",
+        (
+            "Configure Remux Agent for media processing",
+            "Remux Agent converts media to optimal formats",
+        ),
+    ),
+}
+
+
+def _missing_service_warning(key: str) -> ValidationError:
+    """SERVICE_NOT_CONFIGURED warning for a service absent from the config"""
+    message, suggestions = _MISSING_SUGGESTIONS[key]
+    return ValidationError(
+        field=key,
+        message=message,
+        severity="warning",
+        suggestions=list(suggestions),
+        code="SERVICE_NOT_CONFIGURED",
+    )
+
+
+def _build_static_rules() -> Dict[str, ClientValidationRule]:
+    """Client-side rules for service fields; they do not depend on config"""
+    rules: Dict[str, ClientValidationRule] = {}
+
+    # API key validation rule, shared by every service that needs a key
+    api_key_rule = ClientValidationRule(
+        field="api_key",
+        type="string",
+        required=True,
+        min_length=20,
+        max_length=100,
+        custom_rules=("api_key_format",),
+    )
+
+    for spec in SERVICE_SPECS:
+        if not spec.uses_api_key:
+            continue
+        rules[f"{spec.key}.api_key"] = api_key_rule
+        rules[f"{spec.key}.host"] = ClientValidationRule(
+            field=f"{spec.key}.host",
+            type="string",
+            required=True,
+            min_length=3,
+            max_length=255,
+            custom_rules=("hostname_format",),
+        )
+
+    # Special rules for remux agent
+    rules["remux_agent.ffmpeg_path"] = ClientValidationRule(
+        field="ffmpeg_path",
+        type="string",
+        required=True,
+        min_length=4,
+        max_length=255,
+        custom_rules=("executable_path",),
+    )
+    return rules
+
+
+# Built once at import; the rules are frozen, so results can share them
+_STATIC_CLIENT_RULES: Dict[str, ClientValidationRule] = _build_static_rules()
+
+
+class CircuitBreaker:
+    """Stops probing an endpoint that keeps failing, for a cooldown window
+
+    CLOSED probes normally. After ``failure_threshold`` consecutive
+    failures the breaker is OPEN and callers replay ``last_findings``
+    instead of waiting on another timeout. Once ``reset_timeout`` has
+    passed it is HALF_OPEN: one more probe is allowed, and a failure
+    re-opens it immediately while a success closes it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_findings: Optional[ValidationResult] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow_request(self) -> bool:
+        return self.state != self.OPEN or self.last_findings is None
+
+    def record(self, findings: ValidationResult, reachable: bool):
+        """Update the breaker with the outcome of a real probe"""
+        self.last_findings = findings
+        if reachable:
+            self.failures = 0
+            self.opened_at = None
+            return
+
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
 class ServiceValidator:
     """Validates service endpoints and configurations"""
 
+    # Shared across instances so failure history survives between requests
+    breakers: ClassVar[Dict[str, CircuitBreaker]] = {}
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.results = ValidationResult(success=True, duration_ms=0.0)
+        # Created inside the running loop by open() and dropped by aclose(),
+        # so a validator built at import time can be opened and closed again
+        self._client: Optional[httpx.AsyncClient] = None
+        self._probe_sem: Optional[asyncio.Semaphore] = None
+
+    def update_config(self, config: Dict[str, Any]):
+        """Rebind to a new config and start a fresh result"""
+        self.config = config
+        self.results = ValidationResult(success=True, duration_ms=0.0)
+
+    def open(self) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """Create the pooled client and probe semaphore if not already open
+
+        Must be called from the event loop the probes will run on. Returns
+        the (client, semaphore) pair.
+        """
+        if self._client is None:
+            # One pooled client for every probe so connections are kept alive
+            self._client = httpx.AsyncClient(
+                timeout=PROBE_TIMEOUT,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+        if self._probe_sem is None:
+            # Bulkhead: cap in-flight probes however many services are configured
+            self._probe_sem = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+        return self._client, self._probe_sem
+
+    async def aclose(self):
+        """Close the shared HTTP client; the next probe opens a fresh one"""
+        client, self._client = self._client, None
+        self._probe_sem = None
+        if client is not None:
+            await client.aclose()
 
     async def validate_all_services(self) -> ValidationResult:
         """Validate all services in the configuration"""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
+
+        # Each check records into its own result so the merged output keeps
+        # a stable, priority-ordered layout regardless of completion order
+        partials = [
+            ValidationResult(success=True) for _ in range(len(SERVICE_SPECS) + 1)
+        ]
+
+        # Distinct origins are probed concurrently; probes that share an
+        # origin run back to back so they reuse one keep-alive connection
+        by_origin: Dict[str, List[Tuple[ServiceSpec, ValidationResult]]] = defaultdict(
+            list
+        )
+        for spec, partial in zip(SERVICE_SPECS, partials):
+            by_origin[self._origin(spec)].append((spec, partial))
 
-        # Validate services in priority order
-        await self._validate_qbittorrent()
-        await self._validate_prowlarr()
-        await self._validate_radarr()
-        await self._validate_sonarr()
-        await self._validate_jellyfin()
-        await self._validate_jellyseerr()
-        await self._validate_remux_agent()
+        await asyncio.gather(
+            *(self._probe_origin(group) for group in by_origin.values()),
+            self._validate_remux_agent(partials[-1]),
+        )
+        for partial in partials:
+            self._merge(self.results, partial)
 
         # Validate service dependencies
         await self._validate_service_dependencies()
@@ -39,387 +313,206 @@ class ServiceValidator:
         self._add_service_validation_rules()
 
         # Calculate duration
-        self.results.duration_ms = (
-            datetime.utcnow() - start_time
-        ).total_seconds() * 1000
+        self.results.duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         return self.results
 
-    async def _validate_qbittorrent(self):
-        """Validate qBittorrent configuration"""
-        qb_config = self.config.get("qbittorrent", {})
-        if not qb_config:
-            self.results.warnings.append(
-                ValidationError(
-                    field="qbittorrent",
-                    message="qBittorrent configuration is missing",
-                    severity="warning",
-                    suggestions=[
-                        "Configure qBittorrent for download management",
-                        "qBittorrent is required for the media pipeline",
-                    ],
-                    code="SERVICE_NOT_CONFIGURED",
-                )
-            )
-            return
-
-        # Validate host and port
-        host = qb_config.get("host", "localhost")
-        port = qb_config.get("web_port", 8080)
-
-        # Test API connectivity
-        endpoint = f"http://{host}:{port}/api/v2/app/version"
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(endpoint)
-                if response.status_code == 200:
-                    self.results.warnings.append(
-                        ValidationError(
-                            field="qbittorrent.connectivity",
-                            message="qBittorrent API is accessible without authentication",
-                            severity="info",
-                            suggestions=[
-                                "Configure authentication for production use",
-                                "qBittorrent should be protected in production",
-                            ],
-                            code="SERVICE_AUTHENTICATION_RECOMMENDED",
-                        )
-                    )
-                else:
-                    self.results.errors.append(
-                        create_validation_error(
-                            "SERVICE_UNREACHABLE",
-                            "qbittorrent.endpoint",
-                            {"service": "qBittorrent", "endpoint": endpoint},
-                        )
-                    )
-                    self.results.success = False
-        except httpx.RequestError:
-            # Expected - service not running yet
-            pass
-
-        # Validate download directory
-        download_dir = qb_config.get("download_dir")
-        if download_dir:
-            # This will be validated by the path validator
-            pass
+    @staticmethod
+    def _merge(target: ValidationResult, partial: ValidationResult):
+        """Fold a single service's findings into a larger result"""
+        target.errors.extend(partial.errors)
+        target.warnings.extend(partial.warnings)
+        target.configured_service_count += partial.configured_service_count
+        if not partial.success:
+            target.success = False
+
+    async def validate_service(self, service: str) -> ValidationResult:
+        """Validate a single service by key into ``self.results``"""
+        if service == "remux_agent":
+            await self._validate_remux_agent()
+        elif service in SERVICE_SPECS_BY_KEY:
+            await self._probe_service(SERVICE_SPECS_BY_KEY[service])
+        return self.results
 
-    async def _validate_prowlarr(self):
-        """Validate Prowlarr configuration"""
-        prow_config = self.config.get("prowlarr", {})
-        if not prow_config:
-            self.results.warnings.append(
-                ValidationError(
-                    field="prowlarr",
-                    message="Prowlarr configuration is missing",
-                    severity="warning",
-                    suggestions=[
-                        "Configure Prowlarr for indexer management",
-                        "Prowlarr provides automatic indexers for Radarr/Sonarr",
-                    ],
-                    code="SERVICE_NOT_CONFIGURED",
-                )
-            )
+    def _origin(self, spec: ServiceSpec) -> str:
+        """``host:port`` a spec will be probed on (its key if unconfigured)"""
+        service_config = self.config.get(spec.key, {})
+        if not service_config:
+            return spec.key
+        host = service_config.get("host", "localhost")
+        port = service_config.get(spec.port_field, spec.default_port)
+        return f"{host}:{port}"
+
+    async def _probe_origin(self, group: List[Tuple[ServiceSpec, ValidationResult]]):
+        """Probe every service behind one origin sequentially"""
+        for spec, results in group:
+            await self._probe_service(spec, results)
+
+    async def _probe_service(
+        self, spec: ServiceSpec, results: Optional[ValidationResult] = None
+    ):
+        """Check that a configured HTTP service answers on its endpoint"""
+        results = self.results if results is None else results
+        service_config = self.config.get(spec.key, {})
+        if not service_config:
+            results.warnings.append(_missing_service_warning(spec.key))
             return
+        results.configured_service_count += 1
 
         # Validate host and port
-        host = prow_config.get("host", "localhost")
-        port = prow_config.get("port", 9696)
-        api_key = prow_config.get("api_key")
-
-        # Test API connectivity
-        endpoint = f"http://{host}:{port}/api/v1/status"
-        try:
-            headers = {"X-Api-Key": api_key} if api_key else {}
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(endpoint, headers=headers)
-                if response.status_code == 401:
-                    self.results.errors.append(
-                        create_validation_error(
-                            "SERVICE_AUTHENTICATION_FAILED",
-                            "prowlarr.api_key",
-                            {"service": "Prowlarr"},
-                        )
-                    )
-                    self.results.success = False
-                elif response.status_code == 200:
-                    # API is working
-                    pass
-                else:
-                    self.results.errors.append(
-                        create_validation_error(
-                            "SERVICE_UNREACHABLE",
-                            "prowlarr.endpoint",
-                            {"service": "Prowlarr", "endpoint": endpoint},
-                        )
-                    )
-                    self.results.success = False
-        except httpx.RequestError:
-            # Expected - service not running yet
-            pass
-
-    async def _validate_radarr(self):
-        """Validate Radarr configuration"""
-        radarr_config = self.config.get("radarr", {})
-        if not radarr_config:
-            self.results.warnings.append(
-                ValidationError(
-                    field="radarr",
-                    message="Radarr configuration is missing",
-                    severity="warning",
-                    suggestions=[
-                        "Configure Radarr for movie management",
-                        "Radarr manages movie downloads and library",
-                    ],
-                    code="SERVICE_NOT_CONFIGURED",
+        endpoint = f"http://{self._origin(spec)}{spec.path}"
+
+        headers = {}
+        if spec.uses_api_key:
+            api_key = service_config.get("api_key")
+            if api_key:
+                headers["X-Api-Key"] = api_key
+
+        breaker = self.breakers.setdefault(endpoint, CircuitBreaker())
+        if breaker.allow_request() or breaker.last_findings is None:
+            _, probe_sem = self.open()
+            async with probe_sem:
+                findings, reachable = await self._probe_endpoint(
+                    spec, endpoint, headers
                 )
-            )
-            return
+            breaker.record(findings, reachable)
+        else:
+            # Endpoint keeps failing; report what it said last time
+            findings = breaker.last_findings.model_copy(deep=True)
 
-        # Validate host and port
-        host = radarr_config.get("host", "localhost")
-        port = radarr_config.get("port", 7878)
-        api_key = radarr_config.get("api_key")
+        self._merge(results, findings)
 
-        # Test API connectivity
-        endpoint = f"http://{host}:{port}/api/v3/status"
-        try:
-            headers = {"X-Api-Key": api_key} if api_key else {}
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(endpoint, headers=headers)
-                if response.status_code == 401:
-                    self.results.errors.append(
-                        create_validation_error(
-                            "SERVICE_AUTHENTICATION_FAILED",
-                            "radarr.api_key",
-                            {"service": "Radarr"},
-                        )
-                    )
-                    self.results.success = False
-                elif response.status_code == 200:
-                    # API is working
-                    pass
-                else:
-                    self.results.errors.append(
-                        create_validation_error(
-                            "SERVICE_UNREACHABLE",
-                            "radarr.endpoint",
-                            {"service": "Radarr", "endpoint": endpoint},
-                        )
-                    )
-                    self.results.success = False
-        except httpx.RequestError:
-            # Expected - service not running yet
-            pass
-
-        # Validate root folder
-        root_folder = radarr_config.get("root_folder")
-        if root_folder:
-            # This will be validated by the path validator
-            pass
-
-    async def _validate_sonarr(self):
-        """Validate Sonarr configuration"""
-        sonarr_config = self.config.get("sonarr", {})
-        if not sonarr_config:
-            self.results.warnings.append(
-                ValidationError(
-                    field="sonarr",
-                    message="Sonarr configuration is missing",
-                    severity="warning",
-                    suggestions=[
-                        "Configure Sonarr for TV show management",
-                        "Sonarr manages TV show downloads and library",
-                    ],
-                    code="SERVICE_NOT_CONFIGURED",
-                )
-            )
-            return
-
-        # Validate host and port
-        host = sonarr_config.get("host", "localhost")
-        port = sonarr_config.get("port", 8989)
-        api_key = sonarr_config.get("api_key")
+    async def _probe_endpoint(
+        self, spec: ServiceSpec, endpoint: str, headers: Dict[str, str]
+    ) -> Tuple[ValidationResult, bool]:
+        """Probe an endpoint, returning its findings and whether it answered"""
+        results = ValidationResult(success=True)
 
         # Test API connectivity
-        endpoint = f"http://{host}:{port}/api/v3/status"
         try:
-            headers = {"X-Api-Key": api_key} if api_key else {}
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(endpoint, headers=headers)
-                if response.status_code == 401:
-                    self.results.errors.append(
-                        create_validation_error(
-                            "SERVICE_AUTHENTICATION_FAILED",
-                            "sonarr.api_key",
-                            {"service": "Sonarr"},
-                        )
-                    )
-                    self.results.success = False
-                elif response.status_code == 200:
-                    # API is working
-                    pass
-                else:
-                    self.results.errors.append(
-                        create_validation_error(
-                            "SERVICE_UNREACHABLE",
-                            "sonarr.endpoint",
-                            {"service": "Sonarr", "endpoint": endpoint},
-                        )
-                    )
-                    self.results.success = False
+            status = await self._status_with_retry(spec.method, endpoint, headers)
         except httpx.RequestError:
             # Expected - service not running yet
-            pass
+            return results, False
 
-        # Validate root folder
-        root_folder = sonarr_config.get("root_folder")
-        if root_folder:
-            # This will be validated by the path validator
-            pass
-
-    async def _validate_jellyfin(self):
-        """Validate Jellyfin configuration"""
-        jellyfin_config = self.config.get("jellyfin", {})
-        if not jellyfin_config:
-            self.results.warnings.append(
-                ValidationError(
-                    field="jellyfin",
-                    message="Jellyfin configuration is missing",
-                    severity="warning",
-                    suggestions=[
-                        "Configure Jellyfin for media serving",
-                        "Jellyfin provides media streaming and library management",
-                    ],
-                    code="SERVICE_NOT_CONFIGURED",
+        if status == 401 and spec.uses_api_key:
+            results.errors.append(
+                create_validation_error(
+                    "SERVICE_AUTHENTICATION_FAILED",
+                    f"{spec.key}.api_key",
+                    {"service": spec.label},
                 )
             )
-            return
-
-        # Validate host and port
-        host = jellyfin_config.get("host", "localhost")
-        port = jellyfin_config.get("port", 8096)
-
-        # Test web interface connectivity
-        endpoint = f"http://{host}:{port}/web/index.html"
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(endpoint)
-                if response.status_code == 200:
-                    # Web interface is accessible
-                    pass
-                else:
-                    self.results.warnings.append(
-                        create_validation_error(
-                            "SERVICE_UNREACHABLE",
-                            "jellyfin.endpoint",
-                            {"service": "Jellyfin", "endpoint": endpoint},
-                        )
+            results.success = False
+        elif status == 200:
+            if spec.warn_if_unauthenticated:
+                results.warnings.append(
+                    ValidationError(
+                        field=f"{spec.key}.connectivity",
+                        message=f"{spec.label} API is accessible without authentication",
+                        severity="info",
+                        suggestions=[
+                            "Configure authentication for production use",
+                            f"{spec.label} should be protected in production",
+                        ],
+                        code="SERVICE_AUTHENTICATION_RECOMMENDED",
                     )
-        except httpx.RequestError:
-            # Expected - service not running yet
-            pass
-
-        # Validate media paths
-        media_paths = jellyfin_config.get("media_paths", [])
-        for media_path in media_paths:
-            # This will be validated by the path validator
-            pass
-
-    async def _validate_jellyseerr(self):
-        """Validate Jellyseerr configuration"""
-        jellyseerr_config = self.config.get("jellyseerr", {})
-        if not jellyseerr_config:
-            self.results.warnings.append(
-                ValidationError(
-                    field="jellyseerr",
-                    message="Jellyseerr configuration is missing",
-                    severity="warning",
-                    suggestions=[
-                        "Configure Jellyseerr for request management",
-                        "Jellyseerr provides user-friendly media request interface",
-                    ],
-                    code="SERVICE_NOT_CONFIGURED",
                 )
+        else:
+            unreachable = create_validation_error(
+                "SERVICE_UNREACHABLE",
+                f"{spec.key}.endpoint",
+                {"service": spec.label, "endpoint": endpoint},
             )
-            return
-
-        # Validate host and port
-        host = jellyseerr_config.get("host", "localhost")
-        port = jellyseerr_config.get("port", 5055)
-
-        # Test web interface connectivity
-        endpoint = f"http://{host}:{port}"
+            if spec.unreachable_is_error:
+                results.errors.append(unreachable)
+                results.success = False
+            else:
+                results.warnings.append(unreachable)
+
+        return results, status < 500
+
+    async def _status_with_retry(
+        self, method: str, url: str, headers: Dict[str, str], attempts: int = 2
+    ) -> int:
+        """Status code of a request, retried once on refused connections and 502-504
+
+        Responses are streamed and closed unread, so no body is downloaded.
+        At least one request is always made; the last one's outcome is final.
+        """
+        for _ in range(attempts - 1):
+            try:
+                status = await self._head_or_get(method, url, headers)
+            except httpx.ConnectError:
+                pass
+            else:
+                if status not in _RETRY_STATUSES:
+                    return status
+            await asyncio.sleep(random.uniform(0.05, 0.15))
+        return await self._head_or_get(method, url, headers)
+
+    async def _head_or_get(self, method: str, url: str, headers: Dict[str, str]) -> int:
+        """Status code of a request, repeating a refused HEAD as a GET"""
+        status = await self._fetch_status(method, url, headers)
+        if status == 405 and method == "HEAD":
+            status = await self._fetch_status("GET", url, headers)
+        return status
+
+    async def _fetch_status(
+        self, method: str, url: str, headers: Dict[str, str]
+    ) -> int:
+        client, _ = self.open()
+        async with client.stream(method, url, headers=headers) as response:
+            return response.status_code
+
+    @staticmethod
+    async def _run_version_check(binary: str, timeout: float = 2.0) -> int:
+        """Run ``binary -version`` and return its exit code, killing it on timeout"""
+        if shutil.which(binary) is None:
+            raise FileNotFoundError(binary)
+
+        proc = await asyncio.create_subprocess_exec(
+            binary,
+            "-version",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(endpoint)
-                if response.status_code == 200:
-                    # Web interface is accessible
-                    pass
-                else:
-                    self.results.warnings.append(
-                        create_validation_error(
-                            "SERVICE_UNREACHABLE",
-                            "jellyseerr.endpoint",
-                            {"service": "Jellyseerr", "endpoint": endpoint},
-                        )
-                    )
-        except httpx.RequestError:
-            # Expected - service not running yet
-            pass
+            return await asyncio.wait_for(proc.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
 
-    async def _validate_remux_agent(self):
+    async def _validate_remux_agent(self, results: Optional[ValidationResult] = None):
         """Validate Remux Agent configuration"""
+        results = self.results if results is None else results
         remux_config = self.config.get("remux_agent", {})
         if not remux_config:
-            self.results.warnings.append(
-                ValidationError(
-                    field="remux_agent",
-                    message="Remux Agent configuration is missing",
-                    severity="warning",
-                    suggestions=[
-                        "Configure Remux Agent for media processing",
-                        "Remux Agent converts media to optimal formats",
-                    ],
-                    code="SERVICE_NOT_CONFIGURED",
-                )
-            )
+            results.warnings.append(_missing_service_warning("remux_agent"))
             return
 
         # Validate FFmpeg availability
         ffmpeg_path = remux_config.get("ffmpeg_path", "ffmpeg")
         try:
-            proc = await asyncio.create_subprocess_exec(
-                ffmpeg_path,
-                "-version",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await proc.wait()
+            returncode = await self._run_version_check(ffmpeg_path)
+        except (FileNotFoundError, OSError, asyncio.TimeoutError):
+            returncode = None
 
-            if proc.returncode != 0:
-                self.results.errors.append(
-                    create_validation_error(
-                        "DEPENDENCY_NOT_FOUND",
-                        "remux_agent.ffmpeg_path",
-                        {"dependency": "FFmpeg"},
-                    )
-                )
-                self.results.success = False
-        except (FileNotFoundError, Exception):
-            self.results.errors.append(
+        if returncode != 0:
+            results.errors.append(
                 create_validation_error(
                     "DEPENDENCY_NOT_FOUND",
                     "remux_agent.ffmpeg_path",
                     {"dependency": "FFmpeg"},
                 )
             )
-            self.results.success = False
+            results.success = False
 
         # Validate language filters
         language_filters = remux_config.get("language_filters", {})
         if not language_filters:
-            self.results.warnings.append(
+            results.warnings.append(
                 ValidationError(
                     field="remux_agent.language_filters",
                     message="No language filters configured",
@@ -493,59 +586,4 @@ class ServiceValidator:
 
     def _add_service_validation_rules(self):
         """Add client-side validation rules for services"""
-        # API key validation rule
-        api_key_rule = ClientValidationRule(
-            field="api_key",
-            type="string",
-            required=True,
-            min_length=20,
-            max_length=100,
-            pattern=None,
-            min_value=None,
-            max_value=None,
-            custom_rules=["api_key_format"],
-        )
-
-        # URL/endpoint validation rule
-        endpoint_rule = ClientValidationRule(
-            field="endpoint",
-            type="url",
-            required=False,
-            min_length=10,
-            max_length=255,
-            pattern=None,
-            min_value=None,
-            max_value=None,
-            custom_rules=["url_format"],
-        )
-
-        # Apply rules to services
-        services_with_api_keys = ["prowlarr", "radarr", "sonarr"]
-        for service in services_with_api_keys:
-            self.results.client_side_rules[f"{service}.api_key"] = api_key_rule
-            self.results.client_side_rules[f"{service}.host"] = ClientValidationRule(
-                field=f"{service}.host",
-                type="string",
-                required=True,
-                min_length=3,
-                max_length=255,
-                pattern=None,
-                min_value=None,
-                max_value=None,
-                custom_rules=["hostname_format"],
-            )
-
-        # Special rules for remux agent
-        self.results.client_side_rules["remux_agent.ffmpeg_path"] = (
-            ClientValidationRule(
-                field="ffmpeg_path",
-                type="string",
-                required=True,
-                min_length=4,
-                max_length=255,
-                pattern=None,
-                min_value=None,
-                max_value=None,
-                custom_rules=["executable_path"],
-            )
-        )
+        self.results.client_side_rules.update(_STATIC_CLIENT_RULES)
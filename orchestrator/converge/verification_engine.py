@@ -1,6 +1,10 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import asyncio
-from datetime import datetime
+import contextlib
+import hashlib
+import json
+import logging
+import time
 
 from orchestrator.converge.verification_models import (
     ValidationResult,
@@ -8,19 +12,77 @@ from orchestrator.converge.verification_models import (
     ValidationRequest,
     ValidationResponse,
     ValidationSummary,
+    validation_clock,
+    validation_now,
 )
 from orchestrator.converge.validators.path_validator import PathValidator
 from orchestrator.converge.validators.port_validator import PortValidator
-from orchestrator.converge.validators.service_validator import ServiceValidator
+from orchestrator.converge.validators.service_validator import (
+    SERVICE_SPECS,
+    ServiceValidator,
+)
+
+logger = logging.getLogger(__name__)
+
+# Extra next step suggested when an error with the given code is present
+_CODE_TO_HINT: Dict[str, str] = {
+    "PATH_NOT_FOUND": "Create missing directories or select existing paths",
+    "PORT_IN_USE": "Stop conflicting services or choose different ports",
+    "SERVICE_UNREACHABLE": "Start services before applying configuration",
+    "DEPENDENCY_NOT_FOUND": "Install missing system dependencies",
+}
 
 
 class VerificationEngine:
     """Main verification engine that coordinates all validators"""
 
-    def __init__(self):
-        self.path_validator = None
-        self.port_validator = None
-        self.service_validator = None
+    def __init__(self, cache_ttl: float = 10.0):
+        # Long-lived so the service validator's connection pool and
+        # breakers carry over between calls; each run rebinds the config
+        self.path_validator = PathValidator({})
+        self.port_validator = PortValidator({})
+        self.service_validator = ServiceValidator({})
+        # Validators hold per-run state, so runs on one engine are serialized
+        self._lock = asyncio.Lock()
+        # Recent results keyed by a hash of the request, so repeated polls
+        # of an unchanged config don't re-probe every service
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_ttl = cache_ttl
+        # Background refresh of service status (see start()). The snapshot
+        # is (taken_at, config digest, result); the watched config is the
+        # one most recently verified, with the time it was requested.
+        self.refresh_interval = 10.0
+        self.refresh_idle_timeout = 300.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._service_snapshot: Optional[Tuple[float, str, ValidationResult]] = None
+        self._watched: Optional[Tuple[float, str, Dict[str, Any]]] = None
+
+    @staticmethod
+    def _cache_key(*parts: Any) -> str:
+        """Stable digest of the arguments that determine a result"""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Return a copy of a cached result if it is still fresh"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self._cache_ttl:
+            del self._cache[key]
+            return None
+        return value.model_copy(deep=True)
+
+    def _cache_put(self, key: str, value: Any):
+        """Store a result, evicting any entries that have expired"""
+        now = time.monotonic()
+        self._cache = {
+            k: entry
+            for k, entry in self._cache.items()
+            if now - entry[0] < self._cache_ttl
+        }
+        self._cache[key] = (now, value.model_copy(deep=True))
 
     async def verify_configuration(
         self,
@@ -39,21 +101,43 @@ class VerificationEngine:
         Returns:
             ValidationResponse with detailed results
         """
-        start_time = datetime.utcnow()
+        cache_key = self._cache_key("config", config, partial, skip_service_checks)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        async with self._lock:
+            with validation_clock():
+                response = await self._run_verification(
+                    config, partial, skip_service_checks
+                )
+
+        self._cache_put(cache_key, response)
+        return response
 
-        # Initialize validators
-        self.path_validator = PathValidator(config)
-        self.port_validator = PortValidator(config)
-        self.service_validator = ServiceValidator(config)
+    async def _run_verification(
+        self, config: Dict[str, Any], partial: bool, skip_service_checks: bool
+    ) -> ValidationResponse:
+        """Run every validator against ``config`` and build the response"""
+        start_ns = time.perf_counter_ns()
 
-        # Run all validations
-        path_result = self.path_validator.validate_all_paths()
-        port_result = self.port_validator.validate_all_ports()
+        # Point the validators at this config
+        self.path_validator.update_config(config)
+        self.port_validator.update_config(config)
+        self.service_validator.update_config(config)
 
+        # Run all validations; the blocking path/port checks go to worker
+        # threads so their syscalls overlap with the HTTP service probes
         if skip_service_checks:
-            service_result = ValidationResult(success=True, duration_ms=0.0)
+            service_check = self._skipped_service_checks(config)
         else:
-            service_result = await self.service_validator.validate_all_services()
+            service_check = self._service_status(config)
+
+        path_result, port_result, service_result = await asyncio.gather(
+            asyncio.to_thread(self.path_validator.validate_all_paths),
+            asyncio.to_thread(self.port_validator.validate_all_ports),
+            service_check,
+        )
 
         # Combine results
         combined_result = self._combine_validation_results(
@@ -86,8 +170,7 @@ class VerificationEngine:
             )
 
         # Calculate total duration
-        total_duration = (datetime.utcnow() - start_time).total_seconds() * 1000
-        combined_result.duration_ms = total_duration
+        combined_result.duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         # Generate next steps
         next_steps = self._generate_next_steps(combined_result)
@@ -99,6 +182,89 @@ class VerificationEngine:
             result=combined_result, next_steps=next_steps, estimated_time=estimated_time
         )
 
+    @staticmethod
+    async def _skipped_service_checks(config: Dict[str, Any]) -> ValidationResult:
+        # Nothing is probed, but the setup estimate still needs the count
+        return ValidationResult(
+            success=True,
+            duration_ms=0.0,
+            configured_service_count=sum(
+                1 for spec in SERVICE_SPECS if config.get(spec.key)
+            ),
+        )
+
+    async def _service_status(self, config: Dict[str, Any]) -> ValidationResult:
+        """Service results for ``config``, from the background snapshot if fresh
+
+        Falls back to probing on demand when there is no snapshot for this
+        config or it is older than two refresh intervals. Callers must hold
+        ``self._lock`` and have pointed the service validator at ``config``.
+        """
+        key = self._cache_key("services", config)
+        now = time.monotonic()
+        self._watched = (now, key, config)
+
+        snapshot = self._service_snapshot
+        if snapshot is not None:
+            taken_at, snapshot_key, result = snapshot
+            if snapshot_key == key and now - taken_at < 2 * self.refresh_interval:
+                return result.model_copy(deep=True)
+
+        result = await self.service_validator.validate_all_services()
+        self._service_snapshot = (time.monotonic(), key, result.model_copy(deep=True))
+        return result
+
+    async def start(self, interval_s: float = 10.0):
+        """Refresh service status in the background every ``interval_s``
+
+        Only the most recently verified config is refreshed, and only while
+        it keeps being requested; after ``refresh_idle_timeout`` seconds
+        without a request the loop idles until the next verification.
+        A stopped engine can be started again, e.g. by a second app lifespan
+        in the same process.
+        """
+        if self._refresh_task is not None:
+            return
+        # Bind loop-owned resources to the loop this lifespan runs on
+        self._lock = asyncio.Lock()
+        self.service_validator.open()
+        self.refresh_interval = interval_s
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """Cancel the background refresh and release pooled connections"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresh_task
+            self._refresh_task = None
+        await self.aclose()
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            watched = self._watched
+            if watched is None:
+                continue
+            requested_at, key, config = watched
+            if time.monotonic() - requested_at > self.refresh_idle_timeout:
+                continue
+
+            try:
+                async with self._lock:
+                    self.service_validator.update_config(config)
+                    result = await self.service_validator.validate_all_services()
+                self._service_snapshot = (time.monotonic(), key, result)
+            except Exception:
+                logger.exception("Background service status refresh failed")
+
+    async def aclose(self):
+        """Release the service validator's connection pool
+
+        The next probe (or start()) opens a fresh pool.
+        """
+        await self.service_validator.aclose()
+
     def _combine_validation_results(
         self, results: List[ValidationResult]
     ) -> ValidationResult:
@@ -108,7 +274,7 @@ class VerificationEngine:
             errors=[],
             warnings=[],
             client_side_rules={},
-            timestamp=datetime.utcnow(),
+            timestamp=validation_now(),
             duration_ms=0.0,
         )
 
@@ -121,6 +287,7 @@ class VerificationEngine:
             combined.errors.extend(result.errors)
             combined.warnings.extend(result.warnings)
             combined.client_side_rules.update(result.client_side_rules)
+            combined.configured_service_count += result.configured_service_count
             total_duration += result.duration_ms or 0.0
 
         combined.duration_ms = total_duration
@@ -140,21 +307,11 @@ class VerificationEngine:
             next_steps.append("Configuration is valid and ready to apply")
             next_steps.append("You can proceed with service deployment")
 
-        # Specific next steps based on error types
-        error_codes = [error.code for error in result.errors]
-        warning_codes = [warning.code for warning in result.warnings]
-
-        if "PATH_NOT_FOUND" in error_codes:
-            next_steps.append("Create missing directories or select existing paths")
-
-        if "PORT_IN_USE" in error_codes:
-            next_steps.append("Stop conflicting services or choose different ports")
-
-        if "SERVICE_UNREACHABLE" in error_codes:
-            next_steps.append("Start services before applying configuration")
-
-        if "DEPENDENCY_NOT_FOUND" in error_codes:
-            next_steps.append("Install missing system dependencies")
+        # Specific next steps based on error types, in table order
+        error_codes = {error.code for error in result.errors}
+        next_steps.extend(
+            hint for code, hint in _CODE_TO_HINT.items() if code in error_codes
+        )
 
         return next_steps
 
@@ -165,26 +322,16 @@ class VerificationEngine:
         if result.has_errors():
             return "Depends on fixing errors"
 
-        # Count services to deploy
-        service_count = sum(
-            1
-            for service in [
-                "qbittorrent",
-                "prowlarr",
-                "radarr",
-                "sonarr",
-                "jellyfin",
-                "jellyseerr",
-                "traefik",
-            ]
-            if config.get(service)
-        )
+        # Count services to deploy; traefik is deployed but never probed
+        service_count = result.configured_service_count
+        if config.get("traefik"):
+            service_count += 1
 
         # Base time per service
         base_time = service_count * 2  # minutes
 
         # Add time for initial setup
-        if not any(config.get(service) for service in config):
+        if result.configured_service_count == 0:
             # Fresh setup
             estimated_minutes = base_time + 5
         else:
@@ -211,24 +358,18 @@ class VerificationEngine:
         self, service: str, config: Dict[str, Any]
     ) -> ValidationResult:
         """Validate only a specific service"""
-        validator = ServiceValidator(config)
-
-        if service == "qbittorrent":
-            await validator._validate_qbittorrent()
-        elif service == "prowlarr":
-            await validator._validate_prowlarr()
-        elif service == "radarr":
-            await validator._validate_radarr()
-        elif service == "sonarr":
-            await validator._validate_sonarr()
-        elif service == "jellyfin":
-            await validator._validate_jellyfin()
-        elif service == "jellyseerr":
-            await validator._validate_jellyseerr()
-        elif service == "remux_agent":
-            await validator._validate_remux_agent()
-
-        return validator.results
+        cache_key = self._cache_key("service", service, config)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        async with self._lock:
+            with validation_clock():
+                self.service_validator.update_config(config)
+                result = await self.service_validator.validate_service(service)
+
+        self._cache_put(cache_key, result)
+        return result
 
     def get_validation_summary(self, result: ValidationResult) -> ValidationSummary:
         """Get a summary of validation results"""
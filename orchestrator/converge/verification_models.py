@@ -1,6 +1,32 @@
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
-from datetime import datetime
+import string
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, List, Literal, Optional, Dict, Any, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from datetime import datetime, timezone
+
+
+# One timestamp shared by every result built during a verification run
+_validation_now: ContextVar[Optional[datetime]] = ContextVar(
+    "validation_now", default=None
+)
+
+
+def validation_now() -> datetime:
+    """Timestamp of the current verification run, or now outside of one"""
+    now = _validation_now.get()
+    return now if now is not None else datetime.now(timezone.utc)
+
+
+@contextmanager
+def validation_clock():
+    """Stamp every ValidationResult created inside the block with one time"""
+    token = _validation_now.set(datetime.now(timezone.utc))
+    try:
+        yield
+    finally:
+        _validation_now.reset(token)
 
 
 class ValidationError(BaseModel):
@@ -8,7 +34,9 @@ class ValidationError(BaseModel):
 
     field: str = Field(..., description="The field that caused the error")
     message: str = Field(..., description="Human-readable error message")
-    severity: str = Field(..., description="Error severity: 'error' or 'warning'")
+    severity: Literal["error", "warning", "info"] = Field(
+        ..., description="Error severity: 'error', 'warning' or 'info'"
+    )
     suggestions: List[str] = Field(
         default_factory=list, description="Suggested fixes for the error"
     )
@@ -18,6 +46,9 @@ class ValidationError(BaseModel):
 class ClientValidationRule(BaseModel):
     """Client-side validation rules for dynamic UI"""
 
+    # Rules are built once per module and shared between results
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(..., description="The field this rule applies to")
     type: str = Field(
         ..., description="Data type: 'string', 'number', 'email', 'url', etc."
@@ -28,11 +59,27 @@ class ClientValidationRule(BaseModel):
     pattern: Optional[str] = Field(None, description="Regex pattern for validation")
     min_value: Optional[float] = Field(None, description="Minimum value for numbers")
     max_value: Optional[float] = Field(None, description="Maximum value for numbers")
-    custom_rules: List[str] = Field(
-        default_factory=list, description="Custom validation rule names"
+    custom_rules: Tuple[str, ...] = Field(
+        default=(), description="Custom validation rule names"
     )
 
 
+# (indexed list, its length when built, field -> entries). Validators only
+# append, so the same list with the same length means the index is current
+_FieldIndex = Tuple[List[ValidationError], int, Dict[str, List[ValidationError]]]
+
+
+def _index_by_field(
+    entries: List[ValidationError], index: Optional[_FieldIndex]
+) -> _FieldIndex:
+    if index is not None and index[0] is entries and index[1] == len(entries):
+        return index
+    by_field: Dict[str, List[ValidationError]] = defaultdict(list)
+    for entry in entries:
+        by_field[entry.field].append(entry)
+    return entries, len(entries), by_field
+
+
 class ValidationResult(BaseModel):
     """Complete validation result for a configuration"""
 
@@ -47,11 +94,18 @@ class ValidationResult(BaseModel):
         default_factory=dict, description="Client-side validation rules"
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="When validation was performed"
+        default_factory=validation_now, description="When validation was performed"
     )
     duration_ms: Optional[float] = Field(
         None, description="Time taken for validation in milliseconds"
     )
+    configured_service_count: int = Field(
+        0, description="Number of HTTP services present in the configuration"
+    )
+
+    # Lazily built per-field lookups for get_field_errors/get_field_warnings
+    _errors_by_field: Optional[_FieldIndex] = PrivateAttr(default=None)
+    _warnings_by_field: Optional[_FieldIndex] = PrivateAttr(default=None)
 
     def has_errors(self) -> bool:
         """Check if there are any errors"""
@@ -63,16 +117,23 @@ class ValidationResult(BaseModel):
 
     def get_field_errors(self, field: str) -> List[ValidationError]:
         """Get all errors for a specific field"""
-        return [error for error in self.errors if error.field == field]
+        self._errors_by_field = _index_by_field(self.errors, self._errors_by_field)
+        return list(self._errors_by_field[2].get(field, ()))
 
     def get_field_warnings(self, field: str) -> List[ValidationError]:
         """Get all warnings for a specific field"""
-        return [warning for warning in self.warnings if warning.field == field]
+        self._warnings_by_field = _index_by_field(
+            self.warnings, self._warnings_by_field
+        )
+        return list(self._warnings_by_field[2].get(field, ()))
 
 
 class ValidationSummary(BaseModel):
     """Summary view of validation results"""
 
+    # Frozen so the shared empty summary below cannot be modified
+    model_config = ConfigDict(frozen=True)
+
     total_errors: int = Field(..., description="Total number of errors")
     total_warnings: int = Field(..., description="Total number of warnings")
     success_rate: float = Field(..., description="Percentage of successful validations")
@@ -82,10 +143,14 @@ class ValidationSummary(BaseModel):
     @classmethod
     def from_validation_result(cls, result: ValidationResult) -> "ValidationSummary":
         """Create summary from full validation result"""
+        if not result.errors and not result.warnings:
+            return _EMPTY_SUMMARY
+
         total = len(result.errors) + len(result.warnings)
-        success_rate = 100.0 if total == 0 else (len(result.warnings) / total) * 100
+        success_rate = (len(result.warnings) / total) * 100
 
-        return cls(
+        # Counts and flags derived from an already-validated result
+        return cls.model_construct(
             total_errors=len(result.errors),
             total_warnings=len(result.warnings),
             success_rate=success_rate,
@@ -94,6 +159,15 @@ class ValidationSummary(BaseModel):
         )
 
 
+_EMPTY_SUMMARY = ValidationSummary.model_construct(
+    total_errors=0,
+    total_warnings=0,
+    success_rate=100.0,
+    has_errors=False,
+    has_warnings=False,
+)
+
+
 class ValidationRequest(BaseModel):
     """Request payload for verification"""
 
@@ -189,40 +263,89 @@ STANDARD_ERROR_CODES = {
 }
 
 
-def create_validation_error(
-    code: str, field: str, context: Optional[Dict] = None
-) -> ValidationError:
-    """Create a ValidationError from a standard error code"""
-    if context is None:
-        context = {}
+# A template is either a plain string (no placeholders) or its parsed
+# (literal_text, field_name) parts, so rendering never re-parses it
+_Template = Union[str, Tuple[Tuple[str, Optional[str]], ...]]
+
+_FORMATTER = string.Formatter()
+
 
-    error_info = STANDARD_ERROR_CODES.get(
-        code,
-        {
-            "message": f"Unknown error: {code}",
-            "severity": "error",
-            "suggestions": ["Contact support for assistance"],
-        },
+def _compile_template(template: str) -> _Template:
+    parts = tuple((literal, name) for literal, name, _, _ in _FORMATTER.parse(template))
+    if all(name is None for _, name in parts):
+        return template
+    return parts
+
+
+def _render(template: _Template, context: Dict[str, Any]) -> str:
+    if isinstance(template, str):
+        return template
+    return "".join(
+        literal if name is None else literal + str(context.get(name, ""))
+        for literal, name in template
     )
 
-    message = error_info["message"].format(**context)
-    suggestions = [s.format(**context) for s in error_info["suggestions"]]
 
-    return ValidationError(
-        field=field,
-        message=message,
-        severity=error_info["severity"],
-        suggestions=suggestions,
-        code=code,
+_ErrorFactory = Callable[[str, Dict[str, Any]], ValidationError]
+
+
+def _make_error_factory(
+    code: str, message: str, severity: str, suggestions: List[str]
+) -> _ErrorFactory:
+    """Build the constructor for one error code from its templates"""
+    message_t = _compile_template(message)
+    suggestion_ts = tuple(_compile_template(s) for s in suggestions)
+
+    # Everything here is server-controlled, so skip pydantic validation; models
+    # built from external input (ValidationRequest and friends) still validate
+    if isinstance(message_t, str) and all(isinstance(s, str) for s in suggestion_ts):
+        # No placeholders anywhere: the text is fixed, only the field varies
+        def factory(field: str, context: Dict[str, Any]) -> ValidationError:
+            return ValidationError.model_construct(
+                field=field,
+                message=message_t,
+                severity=severity,
+                suggestions=list(suggestion_ts),
+                code=code,
+            )
+
+    else:
+
+        def factory(field: str, context: Dict[str, Any]) -> ValidationError:
+            return ValidationError.model_construct(
+                field=field,
+                message=_render(message_t, context),
+                severity=severity,
+                suggestions=[_render(s, context) for s in suggestion_ts],
+                code=code,
+            )
+
+    return factory
+
+
+_ERROR_FACTORIES: Dict[str, _ErrorFactory] = {
+    code: _make_error_factory(
+        code, info["message"], info["severity"], info["suggestions"]
     )
+    for code, info in STANDARD_ERROR_CODES.items()
+}
 
-    message = error_info["message"].format(**context)
-    suggestions = [s.format(**context) for s in error_info["suggestions"]]
 
-    return ValidationError(
+def _unknown_error(code: str, field: str) -> ValidationError:
+    return ValidationError.model_construct(
         field=field,
-        message=message,
-        severity=error_info["severity"],
-        suggestions=suggestions,
+        message=f"Unknown error: {code}",
+        severity="error",
+        suggestions=["Contact support for assistance"],
         code=code,
     )
+
+
+def create_validation_error(
+    code: str, field: str, context: Optional[Dict] = None
+) -> ValidationError:
+    """Create a ValidationError from a standard error code"""
+    factory = _ERROR_FACTORIES.get(code)
+    if factory is None:
+        return _unknown_error(code, field)
+    return factory(field, context or {})
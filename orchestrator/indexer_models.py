@@ -0,0 +1,59 @@
+"""Pydantic models for the Prowlarr indexer endpoints.
+
+Loaded on first use through ``orchestrator.models``; import from there.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from .models import _LazyModel
+
+
+class IndexerSchema(_LazyModel):
+    """Schema for an available indexer in Prowlarr."""
+
+    id: int
+    name: str
+    description: Optional[str] = None
+    encoding: Optional[str] = None
+    language: Optional[str] = None
+    privacy: Literal["public", "private", "semiprivate"]  # lowercased by the client
+    protocol: Literal["torrent", "usenet", "unknown"]
+    categories: List[Dict] = Field(default_factory=list)
+    supports_rss: bool = Field(default=False, alias="supportsRss")
+    supports_search: bool = Field(default=False, alias="supportsSearch")
+
+    class Config:
+        populate_by_name = True
+
+
+class IndexerInfo(_LazyModel):
+    """Information about a configured indexer."""
+
+    id: int
+    name: str
+    implementation: str
+    enable: bool = True
+    priority: int = 25
+    protocol: str = "torrent"
+
+
+class AvailableIndexersResponse(_LazyModel):
+    """Response containing available public indexers."""
+
+    indexers: List[IndexerSchema] = Field(default_factory=list)
+
+
+class ConfiguredIndexersResponse(_LazyModel):
+    """Response containing currently configured indexers."""
+
+    indexers: List[IndexerInfo] = Field(default_factory=list)
+
+
+class AddIndexersRequest(BaseModel):
+    """Request to add indexers by their definition names."""
+
+    indexers: List[str]  # List of indexer definition names (e.g., "1337x", "EZTV")
@@ -2,48 +2,102 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+import importlib
+from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Literal, Optional, Tuple, Type, TypeVar
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+from pydantic_core import SchemaValidator
+
+if TYPE_CHECKING:
+    from .auth_models import (
+        AuthConfig,
+        ChangePasswordRequest,
+        CreateUserRequest,
+        LoginRequest,
+        LoginResponse,
+        Session,
+        SessionResponse,
+        SudoVerifyRequest,
+        SudoVerifyResponse,
+        User,
+        UserListResponse,
+    )
+    from .indexer_models import (
+        AddIndexersRequest,
+        AvailableIndexersResponse,
+        ConfiguredIndexersResponse,
+        IndexerInfo,
+        IndexerSchema,
+    )
+
+
+# TCP port; one shared annotation instead of repeating the bounds per field
+Port = Annotated[int, Field(ge=1, le=65535)]
+
+
+def _ensure_absolute(value: Path) -> Path:
+    if not value.is_absolute():
+        raise ValueError("Paths must be absolute")
+    return value
+
+
+# Runs inside pydantic-core's pipeline after the Path conversion; Optional
+# fields skip it for None
+AbsolutePath = Annotated[Path, AfterValidator(_ensure_absolute)]
+
+
+class _ConfigModel(BaseModel):
+    """Base for stack configuration sections.
+
+    Instances are immutable; derive changed copies with ``model_copy(update=...)``.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
-from pydantic import BaseModel, Field, validator
 
+class _LazyModel(BaseModel):
+    """Base for API request/response models.
 
-class PathConfig(BaseModel):
-    pool: Path
-    scratch: Optional[Path] = None
-    appdata: Path
+    Schemas are built on first use rather than at import, so processes that
+    only load the stack config (e.g. the pipeline worker) never build them.
+    Request bodies stay on ``BaseModel``: FastAPI builds those when the route
+    is registered anyway.
+    """
+
+    model_config = ConfigDict(defer_build=True)
 
-    @validator("pool", "appdata")
-    def ensure_absolute(cls, value: Path) -> Path:
-        if not value.is_absolute():
-            raise ValueError("Paths must be absolute")
-        return value
 
-    @validator("scratch")
-    def ensure_absolute_optional(cls, value: Optional[Path]) -> Optional[Path]:
-        if value is not None and not value.is_absolute():
-            raise ValueError("Paths must be absolute")
-        return value
+class PathConfig(_ConfigModel):
+    pool: AbsolutePath
+    scratch: Optional[AbsolutePath] = None
+    appdata: AbsolutePath
 
 
-class DownloadCategories(BaseModel):
+class DownloadCategories(_ConfigModel):
     radarr: str = "movies"
     sonarr: str = "tv"
 
 
-class DownloadPolicy(BaseModel):
-    categories: DownloadCategories = Field(default_factory=DownloadCategories)
+# Config models are frozen, so every default instance can share one object
+_DEFAULT_CATEGORIES = DownloadCategories()
+
+
+class DownloadPolicy(_ConfigModel):
+    categories: DownloadCategories = Field(default_factory=lambda: _DEFAULT_CATEGORIES)
 
 
-class MediaPolicyEntry(BaseModel):
-    keep_audio: List[str] = Field(default_factory=lambda: ["eng", "und"])
-    keep_subs: List[str] = Field(default_factory=lambda: ["eng"])
+class MediaPolicyEntry(_ConfigModel):
+    keep_audio: Tuple[str, ...] = ("eng", "und")
+    keep_subs: Tuple[str, ...] = ("eng",)
 
 
-class MediaPolicy(BaseModel):
-    movies: MediaPolicyEntry = Field(default_factory=MediaPolicyEntry)
+_DEFAULT_MEDIA_POLICY_ENTRY = MediaPolicyEntry()
+
+
+class MediaPolicy(_ConfigModel):
+    movies: MediaPolicyEntry = Field(default_factory=lambda: _DEFAULT_MEDIA_POLICY_ENTRY)
 
 
 class QualityPreset(str, Enum):
@@ -59,78 +113,70 @@ class ResolutionPreset(str, Enum):
     p2160 = "2160p"
 
 
-class QualityConfig(BaseModel):
+class QualityConfig(_ConfigModel):
     preset: QualityPreset = QualityPreset.balanced
     target_resolution: Optional[ResolutionPreset] = None
     max_bitrate_mbps: Optional[int] = Field(default=None, ge=1)
     preferred_container: str = "mkv"
 
 
-class UIConfig(BaseModel):
-    port: int = Field(default=8443, ge=1, le=65535)
+class UIConfig(_ConfigModel):
+    port: Port = 8443
 
 
-class RuntimeConfig(BaseModel):
+class RuntimeConfig(_ConfigModel):
     user_id: int = Field(default=1000, ge=0)
     group_id: int = Field(default=1000, ge=0)
     timezone: str = "UTC"
 
 
-class ServiceBaseConfig(BaseModel):
+class ServiceBaseConfig(_ConfigModel):
     enabled: bool = True
-    port: Optional[int] = Field(default=None, ge=1, le=65535)
+    port: Optional[Port] = None
     proxy_url: Optional[str] = None
 
 
 class QbittorrentConfig(ServiceBaseConfig):
-    port: int = Field(default=8081, ge=1, le=65535)
-    proxy_url: Optional[str] = None
+    port: Port = 8081
     stop_after_download: bool = True
     username: str = "admin"
     password: str = ""  # Set during setup wizard, never hardcode defaults
 
 
 class RadarrConfig(ServiceBaseConfig):
-    port: int = Field(default=7878, ge=1, le=65535)
-    proxy_url: Optional[str] = None
+    port: Port = 7878
 
 
 class SonarrConfig(ServiceBaseConfig):
-    port: int = Field(default=8989, ge=1, le=65535)
-    proxy_url: Optional[str] = None
+    port: Port = 8989
 
 
 class ProwlarrConfig(ServiceBaseConfig):
-    port: int = Field(default=9696, ge=1, le=65535)
-    proxy_url: Optional[str] = None
+    port: Port = 9696
     # When True, only add indexers matching user's language preferences
     # When False, add all public indexers with Movies/TV categories
     language_filter: bool = Field(default=True)
 
 
 class JellyseerrConfig(ServiceBaseConfig):
-    port: int = Field(default=5055, ge=1, le=65535)
-    proxy_url: Optional[str] = None
+    port: Port = 5055
 
 
 class JellyfinConfig(ServiceBaseConfig):
-    port: int = Field(default=8096, ge=1, le=65535)
-    proxy_url: Optional[str] = None
+    port: Port = 8096
 
 
 class BazarrConfig(ServiceBaseConfig):
-    port: int = Field(default=6767, ge=1, le=65535)
-    proxy_url: Optional[str] = None
+    port: Port = 6767
 
 
 class FlareSolverrConfig(ServiceBaseConfig):
     """Headless browser proxy that solves CloudFlare challenges for Prowlarr."""
     enabled: bool = False
-    port: int = Field(default=8191, ge=1, le=65535)
-    proxy_url: Optional[str] = None
+    port: Port = 8191
 
 
-class BackfillConfig(BaseModel):
+class BackfillConfig(_ConfigModel):
     """Configuration for automatic backfill and download health monitoring."""
 
     enabled: bool = False
@@ -159,7 +205,7 @@ class BackfillConfig(BaseModel):
     prowlarr_fallback_min_age_hours: int = Field(default=6, ge=1)
 
 
-class EnrichmentConfig(BaseModel):
+class EnrichmentConfig(_ConfigModel):
     """Configuration for the media enrichment pipeline (audio cross-mux).
 
     When enabled, the enrichment engine scans the media library for files
@@ -229,8 +275,6 @@ class EnrichmentConfig(BaseModel):
 
 
 class PipelineConfig(ServiceBaseConfig):
-    port: Optional[int] = Field(default=None, ge=1, le=65535)
-    proxy_url: Optional[str] = None
     backfill: BackfillConfig = Field(default_factory=BackfillConfig)
     enrichment: EnrichmentConfig = Field(default_factory=EnrichmentConfig)
 
@@ -243,21 +287,22 @@ class GluetunConfig(ServiceBaseConfig):
     """VPN gateway container (Gluetun) for routing torrent traffic through WireGuard."""
 
     enabled: bool = False
-    port: Optional[int] = Field(default=None, ge=1, le=65535)
-    proxy_url: Optional[str] = None
     wireguard_config: str = ""
 
 
-class TraefikConfig(BaseModel):
+class TraefikConfig(_ConfigModel):
     enabled: bool = False
     image: str = "traefik:v3.1"
-    http_port: int = Field(default=80, ge=1, le=65535)
-    https_port: Optional[int] = Field(default=None, ge=1, le=65535)
+    http_port: Port = 80
+    https_port: Optional[Port] = None
     dashboard: bool = False
     additional_args: List[str] = Field(default_factory=list)
+    # Key type for the self-signed certificate; ECDSA P-256 generates in
+    # milliseconds, RSA-4096 takes seconds.
+    key_algorithm: Literal["ec", "rsa"] = "ec"
 
 
-class ServicesConfig(BaseModel):
+class ServicesConfig(_ConfigModel):
     qbittorrent: QbittorrentConfig = Field(default_factory=QbittorrentConfig)
     radarr: RadarrConfig = Field(default_factory=RadarrConfig)
     sonarr: SonarrConfig = Field(default_factory=SonarrConfig)
@@ -270,16 +315,21 @@ class ServicesConfig(BaseModel):
     gluetun: GluetunConfig = Field(default_factory=GluetunConfig)
 
 
-class UserEntry(BaseModel):
+# Built once; frozen, so every StackConfig without a services section shares it
+_DEFAULT_SERVICES = ServicesConfig()
+
+
+class UserEntry(_ConfigModel):
     username: str
     email: Optional[str] = None
-    role: str = "viewer"
+    # Roles accepted for users listed in stack.yaml (wider than the auth UserRole).
+    role: Literal["owner", "admin", "editor", "viewer"] = "viewer"
 
 
-class StackConfig(BaseModel):
+class StackConfig(_ConfigModel):
     version: int = 1
     paths: PathConfig
-    services: ServicesConfig = Field(default_factory=ServicesConfig)
+    services: ServicesConfig = Field(default_factory=lambda: _DEFAULT_SERVICES)
     proxy: TraefikConfig = Field(default_factory=TraefikConfig)
     download_policy: DownloadPolicy = Field(default_factory=DownloadPolicy)
     media_policy: MediaPolicy = Field(default_factory=MediaPolicy)
@@ -288,45 +338,39 @@ class StackConfig(BaseModel):
     runtime: RuntimeConfig = Field(default_factory=RuntimeConfig)
     users: List[UserEntry] = Field(default_factory=list)
 
-    @validator("users", each_item=True)
-    def validate_user_role(cls, value: UserEntry) -> UserEntry:
-        if value.role not in {"owner", "admin", "editor", "viewer"}:
-            raise ValueError("Unsupported role")
-        return value
-
 
-class ValidationResult(BaseModel):
+class ValidationResult(_LazyModel):
     ok: bool
     checks: Dict[str, str]
 
 
-class RenderResult(BaseModel):
+class RenderResult(_LazyModel):
     compose_path: Path
     env_path: Path
     secrets_dir: Optional[Path] = None
     secret_files: Dict[str, Path] = Field(default_factory=dict)
 
 
-class StageEvent(BaseModel):
+class StageEvent(_LazyModel):
     stage: str
     status: Literal["started", "ok", "failed"]
     detail: Optional[str] = None
 
 
-class ApplyResponse(BaseModel):
+class ApplyResponse(_LazyModel):
     ok: bool
     run_id: str
     events: List[StageEvent]
 
 
-class RunRecord(BaseModel):
+class RunRecord(_LazyModel):
     run_id: str
     ok: Optional[bool] = None
     events: List[StageEvent] = Field(default_factory=list)
     summary: Optional[str] = None
 
 
-class ServiceStatus(BaseModel):
+class ServiceStatus(_LazyModel):
     """Represents the reported status of a managed service for the UI."""
 
     name: str
@@ -334,13 +378,13 @@ class ServiceStatus(BaseModel):
     message: Optional[str] = None
 
 
-class StatusResponse(BaseModel):
+class StatusResponse(_LazyModel):
     """Wrapper returned from ``GET /api/status`` with the state of services."""
 
     services: List[ServiceStatus] = Field(default_factory=list)
 
 
-class HealthCheck(BaseModel):
+class HealthCheck(_LazyModel):
     """Health status of a single service."""
 
     name: str
@@ -349,61 +393,15 @@ class HealthCheck(BaseModel):
     message: Optional[str] = None
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(_LazyModel):
     """Wrapper returned from ``GET /api/health`` for container readiness checks."""
 
     status: Literal["healthy", "degraded", "unhealthy"]
     services: List[HealthCheck] = Field(default_factory=list)
 
 
-class IndexerSchema(BaseModel):
-    """Schema for an available indexer in Prowlarr."""
-
-    id: int
-    name: str
-    description: Optional[str] = None
-    encoding: Optional[str] = None
-    language: Optional[str] = None
-    privacy: str  # "public", "private", "semiPrivate"
-    protocol: str  # "torrent", "usenet"
-    categories: List[Dict] = Field(default_factory=list)
-    supports_rss: bool = Field(default=False, alias="supportsRss")
-    supports_search: bool = Field(default=False, alias="supportsSearch")
-
-    class Config:
-        populate_by_name = True
-
-
-class IndexerInfo(BaseModel):
-    """Information about a configured indexer."""
-
-    id: int
-    name: str
-    implementation: str
-    enable: bool = True
-    priority: int = 25
-    protocol: str = "torrent"
-
-
-class AvailableIndexersResponse(BaseModel):
-    """Response containing available public indexers."""
-
-    indexers: List[IndexerSchema] = Field(default_factory=list)
-
-
-class ConfiguredIndexersResponse(BaseModel):
-    """Response containing currently configured indexers."""
-
-    indexers: List[IndexerInfo] = Field(default_factory=list)
-
-
-class AddIndexersRequest(BaseModel):
-    """Request to add indexers by their definition names."""
-
-    indexers: List[str]  # List of indexer definition names (e.g., "1337x", "EZTV")
-
-
 # Authentication Models
+# The request/response models live in auth_models and load on first access.
 
 
 class UserRole(str, Enum):
@@ -413,105 +411,7 @@ class UserRole(str, Enum):
     VIEWER = "viewer"
 
 
-class User(BaseModel):
-    """User account for authentication."""
-
-    username: str
-    password_hash: str
-    role: UserRole = UserRole.ADMIN
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
-
-class Session(BaseModel):
-    """Active user session."""
-
-    token: str
-    username: str
-    role: UserRole
-    created_at: datetime
-    expires_at: datetime
-    sudo_expires_at: Optional[datetime] = None
-
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
-
-class AuthConfig(BaseModel):
-    """Authentication configuration."""
-
-    version: int = 1
-    session_timeout_hours: int = 24
-    sudo_timeout_minutes: int = 10
-
-
-class LoginRequest(BaseModel):
-    """Request to authenticate."""
-
-    username: str
-    password: str
-
-
-class LoginResponse(BaseModel):
-    """Response after successful authentication."""
-
-    success: bool
-    token: Optional[str] = None
-    username: Optional[str] = None
-    role: Optional[UserRole] = None
-    expires_at: Optional[datetime] = None
-    message: Optional[str] = None
-
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
-
-class SessionResponse(BaseModel):
-    """Response with session info."""
-
-    valid: bool
-    username: Optional[str] = None
-    role: Optional[UserRole] = None
-    sudo_active: bool = False
-
-
-class SudoVerifyRequest(BaseModel):
-    """Request to verify password for sudo mode."""
-
-    password: str
-
-
-class SudoVerifyResponse(BaseModel):
-    """Response after sudo verification."""
-
-    success: bool
-    message: str
-
-
-class ChangePasswordRequest(BaseModel):
-    """Request to change password."""
-
-    current_password: str
-    new_password: str
-
-
-class CreateUserRequest(BaseModel):
-    """Request to create a new user."""
-
-    username: str
-    password: str
-    role: UserRole = UserRole.VIEWER
-
-
-class UserListResponse(BaseModel):
-    """Response with list of users."""
-
-    users: List[dict] = Field(default_factory=list)
-
-
-class VolumeInfo(BaseModel):
+class VolumeInfo(_LazyModel):
     """Information about a mounted volume."""
 
     device: str
@@ -522,7 +422,7 @@ class VolumeInfo(BaseModel):
     suggested_paths: Dict[str, str]
 
 
-class VolumesResponse(BaseModel):
+class VolumesResponse(_LazyModel):
     """Response containing available volumes."""
 
     volumes: List[VolumeInfo] = Field(default_factory=list)
@@ -539,7 +439,7 @@ class InitializeRequest(BaseModel):
     enabled_services: Optional[List[str]] = None  # e.g. ["qbittorrent", "radarr"]
 
 
-class InitializeResponse(BaseModel):
+class InitializeResponse(_LazyModel):
     """Response from initialization."""
 
     success: bool
@@ -550,7 +450,7 @@ class InitializeResponse(BaseModel):
 # Library Sweep Models
 
 
-class SweepActionDetail(BaseModel):
+class SweepActionDetail(_LazyModel):
     """Detail about a single file that needs sweeping."""
 
     path: str
@@ -560,7 +460,7 @@ class SweepActionDetail(BaseModel):
     unwanted_subtitles: List[str]
 
 
-class SweepScanResponse(BaseModel):
+class SweepScanResponse(_LazyModel):
     """Result of a dry-run library sweep scan."""
 
     total_files_scanned: int
@@ -571,14 +471,14 @@ class SweepScanResponse(BaseModel):
     actions: List[SweepActionDetail] = Field(default_factory=list)
 
 
-class SweepStartResponse(BaseModel):
+class SweepStartResponse(_LazyModel):
     """Acknowledgement that a sweep has been started."""
 
     sweep_id: str
     total_files: int
 
 
-class SweepStatusResponse(BaseModel):
+class SweepStatusResponse(_LazyModel):
     """Current state of the sweep operation."""
 
     status: str  # "idle", "scanning", "running", "completed", "failed"
@@ -589,3 +489,64 @@ class SweepStatusResponse(BaseModel):
     succeeded: int = 0
     failed: int = 0
     errors: List[str] = Field(default_factory=list)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_VALIDATORS: Dict[Type[BaseModel], SchemaValidator] = {}
+
+
+def validate_as(model_cls: Type[ModelT], data: Any) -> ModelT:
+    """Validate ``data`` as ``model_cls`` via its cached core validator.
+
+    Equivalent to ``model_cls.model_validate(data)`` without the per-call
+    classmethod and keyword dispatch; used where many records are loaded.
+    """
+    validator_ = _VALIDATORS.get(model_cls)
+    if validator_ is None:
+        if not model_cls.__pydantic_complete__:
+            model_cls.model_rebuild()  # deferred schema (see _LazyModel)
+        validator_ = _VALIDATORS[model_cls] = model_cls.__pydantic_validator__
+    return validator_.validate_python(data)
+
+
+# Models only the API server needs. Building their schemas is deferred until
+# first access so processes like the pipeline worker never pay for them.
+_LAZY_MODELS = {
+    **dict.fromkeys(
+        (
+            "AuthConfig",
+            "ChangePasswordRequest",
+            "CreateUserRequest",
+            "LoginRequest",
+            "LoginResponse",
+            "Session",
+            "SessionResponse",
+            "SudoVerifyRequest",
+            "SudoVerifyResponse",
+            "User",
+            "UserListResponse",
+        ),
+        "auth_models",
+    ),
+    **dict.fromkeys(
+        (
+            "AddIndexersRequest",
+            "AvailableIndexersResponse",
+            "ConfiguredIndexersResponse",
+            "IndexerInfo",
+            "IndexerSchema",
+        ),
+        "indexer_models",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_MODELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __package__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,116 @@
+"""Persistent cache of ffprobe stream lists keyed by file identity.
+
+Entries are keyed by ``(resolved path, st_mtime_ns, st_size)`` so a file
+that is replaced or rewritten in place misses the cache automatically.
+Only the raw ffprobe ``streams`` list is stored; ``remux`` derives the
+StreamInfo summary from it.  Any sqlite failure degrades to a cache miss.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+log = logging.getLogger("pipeline")
+
+_Key = Tuple[str, int, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS probes (
+    path TEXT NOT NULL,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    json BLOB NOT NULL,
+    PRIMARY KEY (path, mtime, size)
+)
+"""
+
+
+class ProbeCache:
+    """Two-level (in-memory LRU + sqlite) cache of ffprobe stream lists."""
+
+    def __init__(self, db_path: Path, *, memory_size: int = 256) -> None:
+        self.db_path = db_path
+        self.memory_size = memory_size
+        self._memory: OrderedDict[_Key, List[dict]] = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disabled:
+            try:
+                self._conn = sqlite3.connect(str(self.db_path))
+                self._conn.execute(_SCHEMA)
+            except sqlite3.Error as exc:
+                log.warning("probe cache disabled (%s): %s", self.db_path, exc)
+                self._disabled = True
+                self._conn = None
+        return self._conn
+
+    @staticmethod
+    def _key(source: Path) -> Optional[_Key]:
+        try:
+            st = source.stat()
+        except OSError:
+            return None
+        return (str(source.resolve()), st.st_mtime_ns, st.st_size)
+
+    def _remember(self, key: _Key, streams: List[dict]) -> None:
+        self._memory[key] = streams
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, source: Path) -> Optional[List[dict]]:
+        """Return cached streams for *source*, or None on a miss."""
+        key = self._key(source)
+        if key is None:
+            return None
+        streams = self._memory.get(key)
+        if streams is not None:
+            self._memory.move_to_end(key)
+            return streams
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT json FROM probes WHERE path = ? AND mtime = ? AND size = ?",
+                key,
+            ).fetchone()
+        except sqlite3.Error as exc:
+            log.warning("probe cache read failed: %s", exc)
+            return None
+        if row is None:
+            return None
+        streams = json.loads(row[0])
+        self._remember(key, streams)
+        return streams
+
+    def put(self, source: Path, streams: List[dict]) -> None:
+        """Store the ffprobe streams for *source*."""
+        key = self._key(source)
+        if key is None:
+            return
+        self._remember(key, streams)
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            with conn:
+                # Older entries for this path can never match again
+                conn.execute("DELETE FROM probes WHERE path = ?", key[:1])
+                conn.execute(
+                    "INSERT INTO probes (path, mtime, size, json) VALUES (?, ?, ?, ?)",
+                    (*key, json.dumps(streams)),
+                )
+        except sqlite3.Error as exc:
+            log.warning("probe cache write failed: %s", exc)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
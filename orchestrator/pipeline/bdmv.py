@@ -28,7 +28,7 @@ _CLPI_TYPE_PGS_SUB = 0x90   # Presentation Graphics subtitles
 _CLPI_TYPE_TEXT_SUB = 0x92   # Text subtitles
 
 
-@dataclass
+@dataclass(slots=True)
 class ClpiStream:
     """A single stream entry extracted from a CLPI file."""
     stream_type: str   # "video", "audio", or "subtitle"
@@ -461,15 +461,17 @@ def map_clpi_to_ffprobe_indices(
     import json
     import subprocess
 
+    from .remux import FFPROBE
+
     try:
         result = subprocess.run(
             [
-                "ffprobe", "-v", "quiet",
+                FFPROBE, "-v", "quiet",
                 "-print_format", "json",
                 "-show_streams",
                 str(source),
             ],
-            capture_output=True, text=True, timeout=60,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=60,
         )
         if result.returncode != 0:
             return []
@@ -25,6 +25,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
+from .remux import FFMPEG
+
 log = logging.getLogger(__name__)
 
 # Default fpcalc sample rate: ~8.065 items/second (chromaprint internal).
@@ -136,7 +138,7 @@ def _fingerprint_via_ffmpeg(
     try:
         # Extract the specific audio stream to WAV
         ffmpeg_cmd = [
-            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            FFMPEG, "-y", "-hide_banner", "-loglevel", "error",
             "-t", str(duration),
             "-i", str(path),
             "-map", f"0:a:{stream_index}",
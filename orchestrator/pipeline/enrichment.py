@@ -31,6 +31,7 @@ from .backfill import ProwlarrResult
 from .chromaprint import validate_and_align
 from .languages import arr_language_to_iso
 from .remux import (
+    FFPROBE,
     RESOLUTION_TARGET_SCORES,
     VideoQuality,
     _normalize_lang,
@@ -43,7 +44,7 @@ from .remux import (
     probe_streams,
     probe_video_quality,
 )
-from .worker import VIDEO_EXTENSIONS, parse_tv_episode
+from .worker import VIDEO_EXTENSIONS, parse_tv_episode, resolve_pool_root
 
 log = logging.getLogger("pipeline")
 
@@ -250,10 +251,7 @@ class EnrichmentEngine:
         The config stores host paths (e.g. /mnt/pool/media), but inside the
         container the media is mounted at /data.  This method checks both.
         """
-        for candidate in (Path("/data"), Path(config.paths.pool)):
-            if candidate.exists():
-                return candidate
-        return Path(config.paths.pool)
+        return resolve_pool_root(config.paths.pool)
 
     # ------------------------------------------------------------------
     # Public API
@@ -1622,7 +1620,7 @@ class EnrichmentEngine:
         try:
             result = _sp.run(
                 [
-                    "ffprobe",
+                    FFPROBE,
                     "-v",
                     "quiet",
                     "-print_format",
@@ -1630,8 +1628,8 @@ class EnrichmentEngine:
                     "-show_format",
                     str(path),
                 ],
-                capture_output=True,
-                text=True,
+                stdout=_sp.PIPE,
+                stderr=_sp.DEVNULL,
                 timeout=15,
             )
             if result.returncode == 0:
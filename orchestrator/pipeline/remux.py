@@ -1,11 +1,29 @@
 """Utilities for building ffmpeg remux commands with language guardrails."""
 from __future__ import annotations
 
+import asyncio
 import json
+import shutil
 import subprocess
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ._probe_cache import ProbeCache
+
+try:  # orjson decodes large ffprobe payloads several times faster
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - falls back to the stdlib decoder
+    _json_loads = json.loads  # type: ignore[assignment]
+
+
+# Resolved once at import so each exec skips the PATH search.  Falls back to
+# the bare name so a missing binary still fails at exec time as before.
+FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+FFPROBE = shutil.which("ffprobe") or "ffprobe"
 
 
 @dataclass
@@ -62,6 +80,24 @@ def _normalize_lang(code: str) -> str:
     code = code.lower()
     return _ISO639_BT_PAIRS.get(code, code)
 
+
+@lru_cache(maxsize=64)
+def _language_sets(
+    audio: Tuple[str, ...], subtitles: Tuple[str, ...],
+) -> Tuple[FrozenSet[str], FrozenSet[str], bool]:
+    """Return normalised (audio, subtitle) allowlists and the forced-subs flag.
+
+    The media policy rarely changes, so the sets are built once per distinct
+    policy and shared by every remux.  Codes are interned because they are
+    compared against per-stream tags for every file.
+    """
+    keep_audio = frozenset(sys.intern(_normalize_lang(c)) for c in _normalized(audio))
+    keep_subs = {sys.intern(_normalize_lang(c)) for c in _normalized(subtitles)}
+    # "forced" is a special flag for subtitles, not a language
+    include_forced = "forced" in keep_subs
+    keep_subs.discard("forced")
+    return keep_audio, frozenset(keep_subs), include_forced
+
 # Audio codec quality ranking (higher = better).
 # Within the same channel count, prefer lossless > lossy high-bitrate > lossy.
 _AUDIO_CODEC_RANK: Dict[str, int] = {
@@ -91,7 +127,7 @@ _COMMENTARY_KEYWORDS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class _AudioTrack:
     """Parsed audio track metadata for ranking."""
     stream_index: str
@@ -146,8 +182,8 @@ def _parse_audio_track(stream: dict, lang_override: Optional[str] = None) -> Opt
         return None
 
     idx = str(stream.get("index", ""))
-    raw_lang = lang_override or stream.get("tags", {}).get("language", "und").lower()
-    lang = _normalize_lang(raw_lang)
+    # _normalize_lang lowercases, so the raw tag is passed straight through
+    lang = _normalize_lang(lang_override or stream.get("tags", {}).get("language", "und"))
     profile = stream.get("profile", "") or ""
     channels = int(stream.get("channels", 0))
     bit_rate = int(stream.get("bit_rate", 0) or 0)
@@ -378,7 +414,7 @@ RESOLUTION_TARGET_SCORES: Dict[str, int] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamInfo:
     """Information about streams in a media file."""
     audio_languages: Set[str]
@@ -387,6 +423,93 @@ class StreamInfo:
     audio_count: int
     subtitle_count: int
     original_language: Optional[str] = None  # Deprecated: use API lookup instead
+    raw_streams: List[dict] = field(default_factory=list)
+
+
+# Optional persistent probe cache, enabled by the pipeline worker
+_probe_cache: Optional[ProbeCache] = None
+
+
+def configure_probe_cache(db_path: Optional[Path]) -> None:
+    """Enable (or, with None, disable) the on-disk ffprobe result cache."""
+    global _probe_cache
+    if _probe_cache is not None:
+        _probe_cache.close()
+    _probe_cache = ProbeCache(db_path) if db_path is not None else None
+
+
+# Only the stream fields read by probe_streams() and _parse_audio_track();
+# a full -show_streams dump is several times larger (codec params, side data).
+_PROBE_STREAM_ENTRIES = (
+    "stream=index,codec_type,codec_name,profile,channels,bit_rate"
+    ":stream_disposition:stream_tags=language,title"
+)
+
+
+def _is_transport_stream(source: Path) -> bool:
+    return source.suffix.lower() in (".m2ts", ".ts")
+
+
+def _probe_command(source: Path) -> List[str]:
+    """Return the ffprobe argv used by ``probe_streams()``."""
+    probe_cmd = [FFPROBE, "-v", "quiet"]
+    # Transport streams need a deeper probe to report codec parameters
+    # (see the matching flags in build_ffmpeg_command).
+    if _is_transport_stream(source):
+        probe_cmd.extend(["-analyzeduration", "10M", "-probesize", "10M"])
+    probe_cmd.extend([
+        "-print_format", "json",
+        "-show_entries", _PROBE_STREAM_ENTRIES,
+        str(source),
+    ])
+    return probe_cmd
+
+
+def _probe_timeout(source: Path) -> int:
+    return 60 if _is_transport_stream(source) else 30
+
+
+def _streams_from_probe(source: Path, stdout: bytes | str) -> List[dict]:
+    """Decode ffprobe JSON output and remember it in the probe cache."""
+    streams = _json_loads(stdout).get("streams", [])
+    if _probe_cache is not None:
+        _probe_cache.put(source, streams)
+    return streams
+
+
+def _stream_info_from_streams(streams: List[dict]) -> StreamInfo:
+    """Summarise raw ffprobe stream dicts into a StreamInfo."""
+    audio_langs: Set[str] = set()
+    subtitle_langs: Set[str] = set()
+    has_video = False
+    audio_count = 0
+    subtitle_count = 0
+    first_audio_lang: Optional[str] = None
+
+    for stream in streams:
+        codec_type = stream.get("codec_type", "")
+        lang = stream.get("tags", {}).get("language", "und").lower()
+
+        if codec_type == "video":
+            has_video = True
+        elif codec_type == "audio":
+            audio_count += 1
+            audio_langs.add(lang)
+            if first_audio_lang is None:
+                first_audio_lang = lang
+        elif codec_type == "subtitle":
+            subtitle_count += 1
+            subtitle_langs.add(lang)
+
+    return StreamInfo(
+        audio_languages=audio_langs,
+        subtitle_languages=subtitle_langs,
+        has_video=has_video,
+        audio_count=audio_count,
+        subtitle_count=subtitle_count,
+        original_language=first_audio_lang,
+        raw_streams=streams,
+    )
 
 
 def probe_streams(source: Path) -> Optional[StreamInfo]:
@@ -399,58 +522,96 @@ def probe_streams(source: Path) -> Optional[StreamInfo]:
     first (e.g. Russian groups).  Callers should prefer the Radarr/Sonarr API
     lookup via ``languages.arr_language_to_iso()`` and pass the result as
     ``original_language`` to ``build_ffmpeg_command()``.
+
+    The raw ffprobe stream dicts are kept on ``raw_streams`` so that
+    ``build_ffmpeg_command()`` can select tracks without probing again.
+    Results are served from the probe cache when one is configured (see
+    ``configure_probe_cache()``) and the file is unchanged.
     """
     try:
+        cached = _probe_cache.get(source) if _probe_cache is not None else None
+        if cached is not None:
+            return _stream_info_from_streams(cached)
         result = subprocess.run(
-            [
-                "ffprobe",
-                "-v", "quiet",
-                "-print_format", "json",
-                "-show_streams",
-                str(source),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
+            _probe_command(source),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=_probe_timeout(source),
         )
         if result.returncode != 0:
             return None
+        return _stream_info_from_streams(_streams_from_probe(source, result.stdout))
+    except Exception:
+        return None
+
+
+async def _probe_streams_async(
+    source: Path, semaphore: asyncio.Semaphore,
+) -> Optional[StreamInfo]:
+    """Async twin of ``probe_streams()``, bounded by *semaphore*."""
+    async with semaphore:
+        try:
+            cached = _probe_cache.get(source) if _probe_cache is not None else None
+            if cached is not None:
+                return _stream_info_from_streams(cached)
+            cmd = _probe_command(source)
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(
+                    proc.communicate(), timeout=_probe_timeout(source),
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return None
+            if proc.returncode != 0:
+                return None
+            return _stream_info_from_streams(_streams_from_probe(source, stdout))
+        except Exception:
+            return None
 
-        data = json.loads(result.stdout)
-        streams = data.get("streams", [])
 
-        audio_langs: Set[str] = set()
-        subtitle_langs: Set[str] = set()
-        has_video = False
-        audio_count = 0
-        subtitle_count = 0
-        first_audio_lang: Optional[str] = None
+async def probe_streams_many(
+    sources: Iterable[Path], *, concurrency: int = 8,
+) -> Dict[Path, StreamInfo]:
+    """Probe several files concurrently.
 
-        for stream in streams:
-            codec_type = stream.get("codec_type", "")
-            lang = stream.get("tags", {}).get("language", "und").lower()
+    Returns a mapping of source path to StreamInfo; files that could not be
+    probed are omitted so callers fall back to ``probe_streams()``.
+    """
+    unique = list(dict.fromkeys(sources))
+    semaphore = asyncio.Semaphore(concurrency)
+    results = await asyncio.gather(
+        *(_probe_streams_async(source, semaphore) for source in unique)
+    )
+    return {
+        source: info for source, info in zip(unique, results) if info is not None
+    }
 
-            if codec_type == "video":
-                has_video = True
-            elif codec_type == "audio":
-                audio_count += 1
-                audio_langs.add(lang)
-                if first_audio_lang is None:
-                    first_audio_lang = lang
-            elif codec_type == "subtitle":
-                subtitle_count += 1
-                subtitle_langs.add(lang)
-
-        return StreamInfo(
-            audio_languages=audio_langs,
-            subtitle_languages=subtitle_langs,
-            has_video=has_video,
-            audio_count=audio_count,
-            subtitle_count=subtitle_count,
-            original_language=first_audio_lang,
-        )
-    except Exception:
-        return None
+
+def _keep_subtitle(
+    stream: dict,
+    clpi_map: Dict[str, str],
+    keep_langs: FrozenSet[str],
+    include_forced: bool,
+) -> bool:
+    """Return True if a subtitle stream passes the language/forced filter."""
+    if stream.get("codec_type") != "subtitle":
+        return False
+    if stream.get("codec_name", "").lower() in _MKV_INCOMPATIBLE_SUBTITLE_CODECS:
+        return False  # e.g. mov_text from MP4 can't go in MKV
+    idx = str(stream.get("index", ""))
+    if idx in clpi_map:
+        lang = _normalize_lang(clpi_map[idx])
+    else:
+        lang = _normalize_lang(stream.get("tags", {}).get("language", "und"))
+    if lang in keep_langs:
+        return True
+    return include_forced and stream.get("disposition", {}).get("forced", 0) == 1
 
 
 def build_ffmpeg_command(
@@ -460,6 +621,7 @@ def build_ffmpeg_command(
     *,
     original_language: Optional[str] = None,
     stream_languages: Optional[List[Dict[str, str]]] = None,
+    stream_info: Optional[StreamInfo] = None,
 ) -> List[str]:
     """Construct an ffmpeg command that remuxes while stripping unwanted tracks.
 
@@ -477,9 +639,11 @@ def build_ffmpeg_command(
             CLPI files contain the real language codes.  Each entry is a dict
             with keys ``type`` (``"audio"`` or ``"subtitle"``), ``lang``
             (ISO 639 code), and ``index`` (ffmpeg stream index as str).
+        stream_info: Result of an earlier ``probe_streams(source)`` call.
+            When omitted the source is probed here.
     """
     args: List[str] = [
-        "ffmpeg",
+        FFMPEG,
         "-hide_banner",
         "-y",
     ]
@@ -501,75 +665,63 @@ def build_ffmpeg_command(
     args.extend(["-map", "0:v:0?"])
 
     # Build language allowlists (normalise to bibliographic ISO 639-2 codes)
-    keep_audio_langs = {_normalize_lang(c) for c in _normalized(selection.audio)}
-    keep_sub_langs = {_normalize_lang(c) for c in _normalized(selection.subtitles)}
-
-    # Check if "forced" is specified for subtitles (it's a special flag, not a language)
-    include_forced_subs = "forced" in keep_sub_langs
-    if include_forced_subs:
-        keep_sub_langs.discard("forced")
+    keep_audio_langs, keep_sub_langs, include_forced_subs = _language_sets(
+        tuple(selection.audio), tuple(selection.subtitles),
+    )
 
     # Always include original language audio when known
     if original_language:
-        keep_audio_langs.add(_normalize_lang(original_language))
+        keep_audio_langs = keep_audio_langs | {_normalize_lang(original_language)}
 
-    # Probe the source to get stream layout
-    streams: list = []
-    try:
-        probe_cmd = ["ffprobe", "-v", "quiet"]
-        if source.suffix.lower() in (".m2ts", ".ts"):
-            probe_cmd.extend(["-analyzeduration", "10M", "-probesize", "10M"])
-        probe_cmd.extend(["-print_format", "json", "-show_streams", str(source)])
-        result = subprocess.run(
-            probe_cmd,
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-        if result.returncode != 0:
-            # Probe failed — copy everything as fallback
-            args.extend(["-map", "0:a?", "-map", "0:s?"])
-            args.extend(["-c", "copy", str(destination)])
-            return args
-
-        data = json.loads(result.stdout)
-        streams = data.get("streams", [])
+    # Probe the source to get stream layout (reusing the caller's probe)
+    if stream_info is None:
+        stream_info = probe_streams(source)
+    if stream_info is None:
+        # Probe failed — copy everything as fallback
+        args.extend(["-map", "0:a?", "-map", "0:s?"])
+        args.extend(["-c", "copy", str(destination)])
+        return args
 
+    streams = stream_info.raw_streams
+    try:
         # Build a per-stream language map, optionally overridden by CLPI data
         clpi_map: Dict[str, str] = {}  # stream_index -> lang
         if stream_languages:
             for entry in stream_languages:
                 clpi_map[str(entry.get("index", ""))] = entry.get("lang", "und")
 
-        # --- Audio filtering ---
+        # Single pass over the streams: parse audio tracks for scoring and
+        # apply the subtitle filter, keeping ffprobe order within each type.
         audio_maps: List[str] = []
         total_audio = 0
-        codec_filtered_indices: set = set()
-
-        # Parse all audio tracks with metadata
         all_audio_tracks: List[_AudioTrack] = []
+        sub_maps: List[str] = []
         for stream in streams:
-            if stream.get("codec_type") != "audio":
-                continue
-            total_audio += 1
-            idx = str(stream.get("index", ""))
-
-            # Prefer CLPI language data if available
-            lang_override = clpi_map.get(idx)
-            if lang_override:
-                lang_override = lang_override.lower()
-
-            track = _parse_audio_track(stream, lang_override=lang_override)
-            if track is None:
-                codec_name = stream.get("codec_name", "").lower()
-                print(
-                    f"[remux] skipping stream {idx}: codec '{codec_name}' "
-                    f"is not supported in MKV containers"
-                )
-                codec_filtered_indices.add(idx)
-                continue
-            all_audio_tracks.append(track)
-
+            codec_type = stream.get("codec_type")
+            if codec_type == "audio":
+                total_audio += 1
+                idx = str(stream.get("index", ""))
+
+                # Prefer CLPI language data if available
+                lang_override = clpi_map.get(idx)
+                if lang_override:
+                    lang_override = lang_override.lower()
+
+                track = _parse_audio_track(stream, lang_override=lang_override)
+                if track is None:
+                    codec_name = stream.get("codec_name", "").lower()
+                    print(
+                        f"[remux] skipping stream {idx}: codec '{codec_name}' "
+                        f"is not supported in MKV containers"
+                    )
+                    continue
+                all_audio_tracks.append(track)
+            elif codec_type == "subtitle" and _keep_subtitle(
+                stream, clpi_map, keep_sub_langs, include_forced_subs,
+            ):
+                sub_maps.append(f"0:{stream.get('index', '')}")
+
+        # --- Audio selection ---
         if all_audio_tracks:
             selected = _select_best_audio(
                 all_audio_tracks, original_language, keep_audio_langs,
@@ -599,38 +751,11 @@ def build_ffmpeg_command(
                 f"[remux] WARNING: all {total_audio} audio tracks would be "
                 f"removed — keeping language-filtered audio to avoid silent output"
             )
-            for stream in streams:
-                if stream.get("codec_type") == "audio":
-                    idx = str(stream.get("index", ""))
-                    if idx not in codec_filtered_indices:
-                        audio_maps.append(f"0:{idx}")
+            audio_maps = [f"0:{t.stream_index}" for t in all_audio_tracks]
 
-        for mapping in audio_maps:
-            args.extend(["-map", mapping])
-
-        # --- Subtitle filtering ---
-        for stream in streams:
-            if stream.get("codec_type") != "subtitle":
-                continue
-
-            sub_codec = stream.get("codec_name", "").lower()
-            if sub_codec in _MKV_INCOMPATIBLE_SUBTITLE_CODECS:
-                continue  # e.g. mov_text from MP4 can't go in MKV
-
-            idx = str(stream.get("index", ""))
-
-            if idx in clpi_map:
-                lang = _normalize_lang(clpi_map[idx])
-            else:
-                lang = _normalize_lang(
-                    stream.get("tags", {}).get("language", "und")
-                )
-
-            disposition = stream.get("disposition", {})
-            is_forced = disposition.get("forced", 0) == 1
-
-            if lang in keep_sub_langs or (is_forced and include_forced_subs):
-                args.extend(["-map", f"0:{idx}"])
+        args.extend(chain.from_iterable(
+            ("-map", m) for m in chain(audio_maps, sub_maps)
+        ))
 
     except Exception:
         # Fallback: copy all streams if filtering fails entirely
@@ -706,17 +831,42 @@ def build_ffmpeg_command(
     return args
 
 
+def build_ffmpeg_command_negative(
+    source: Path,
+    destination: Path,
+    drop_audio_langs: Iterable[str],
+    drop_sub_langs: Iterable[str],
+) -> List[str]:
+    """Construct an ffmpeg command that copies everything except given languages.
+
+    Uses negative stream maps (``-map -0:a:m:language:xxx``) so no ffprobe
+    pass is needed.  Unlike ``build_ffmpeg_command()`` there is no audio
+    scoring, no guard against dropping every audio track and no filtering of
+    MKV-incompatible codecs — callers must already know the stream layout
+    (e.g. from a sweep scan) and that the source is safe to copy as-is.
+    """
+    args: List[str] = [
+        FFMPEG,
+        "-hide_banner",
+        "-y",
+        "-i", str(source),
+        "-map", "0",
+        "-map", "-0:d",
+    ]
+    for lang in _normalized(drop_audio_langs):
+        args.extend(["-map", f"-0:a:m:language:{lang}"])
+    for lang in _normalized(drop_sub_langs):
+        args.extend(["-map", f"-0:s:m:language:{lang}"])
+    args.extend(["-c", "copy", str(destination)])
+    return args
+
+
 def _normalized(languages: Iterable[str]) -> List[str]:
     """Return ISO language codes in lowercase without duplicates."""
-    seen = set()
-    result: List[str] = []
-    for entry in languages:
-        code = entry.lower().strip()
-        if not code or code in seen:
-            continue
-        seen.add(code)
-        result.append(code)
-    return result
+    # dict.fromkeys de-duplicates while keeping first-seen order
+    return list(dict.fromkeys(
+        code for code in (entry.lower().strip() for entry in languages) if code
+    ))
 
 
 # ---------------------------------------------------------------------------
@@ -729,16 +879,16 @@ def probe_raw_streams(source: Path) -> Optional[List[dict]]:
     try:
         result = subprocess.run(
             [
-                "ffprobe", "-v", "quiet",
+                FFPROBE, "-v", "quiet",
                 "-print_format", "json",
                 "-show_streams", "-show_format",
                 str(source),
             ],
-            capture_output=True, text=True, timeout=30,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=30,
         )
         if result.returncode != 0:
             return None
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
         return data.get("streams", [])
     except Exception:
         return None
@@ -815,7 +965,7 @@ def find_all_enrichment_audio_tracks(
     return result
 
 
-@dataclass
+@dataclass(slots=True)
 class _SubtitleCandidate:
     """A subtitle stream from a candidate file worth cross-muxing."""
 
@@ -903,7 +1053,7 @@ def build_crossmux_command(
     Returns:
         Full ffmpeg command as a list of strings.
     """
-    args = ["ffmpeg", "-y", "-hide_banner"]
+    args = [FFMPEG, "-y", "-hide_banner"]
 
     # Input 0: library file (video + existing audio + subtitles)
     args.extend(["-i", str(library)])
@@ -998,7 +1148,7 @@ def build_video_upgrade_command(
             (languages the library is missing).
         extra_subs: Additional subtitle tracks from candidate to include.
     """
-    args = ["ffmpeg", "-y", "-hide_banner"]
+    args = [FFMPEG, "-y", "-hide_banner"]
 
     # Input 0: candidate file (provides video)
     args.extend(["-i", str(candidate)])
@@ -1,6 +1,8 @@
 """Pipeline worker loop to remux completed torrents."""
 from __future__ import annotations
 
+import asyncio
+import atexit
 import hashlib
 import json
 import logging
@@ -8,19 +10,35 @@ import os
 import re
 import shutil
 import subprocess
+import threading
 import time
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 import httpx
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    from watchfiles import Change, watch
+except ImportError:  # pragma: no cover - falls back to fixed-interval polling
+    watch = None  # type: ignore[assignment]
 
 from ..models import StackConfig
 from ..storage import ConfigRepository
 from .backfill import BackfillEngine
 from .health import DownloadHealthMonitor
 from .languages import arr_language_to_iso
-from .worker import PipelineWorker, TorrentInfo, parse_movie_name, parse_tv_episode
+from .remux import FFPROBE, StreamInfo, configure_probe_cache, probe_streams_many
+from .worker import (
+    VIDEO_EXTENSIONS,
+    PipelineWorker,
+    TorrentInfo,
+    find_pool_root,
+    parse_movie_name,
+    parse_tv_episode,
+)
 
 log = logging.getLogger("pipeline")
 
@@ -34,7 +52,7 @@ if not log.handlers:
     log.setLevel(logging.DEBUG)
 
 
-@dataclass
+@dataclass(slots=True)
 class TorrentRecord:
     hash: str
     name: str
@@ -45,6 +63,21 @@ class TorrentRecord:
     completion_on: int = 0  # unix timestamp when torrent finished downloading
 
 
+class _QbTorrent(BaseModel):
+    """The subset of a qBittorrent ``/torrents/info`` row we read."""
+    hash: str = ""
+    name: str = ""
+    category: Optional[str] = None
+    save_path: Optional[str] = None
+    content_path: Optional[str] = None
+    size: Optional[int] = None
+    completion_on: Optional[int] = None
+
+
+# Parses and validates the response body in one pass (no intermediate dicts)
+_QB_TORRENT_LIST = TypeAdapter(Optional[List[_QbTorrent]])
+
+
 @dataclass
 class ArrMetadata:
     """Metadata fetched from Radarr/Sonarr for a matched torrent."""
@@ -73,6 +106,40 @@ _TORRENT_JUNK = re.compile(
 )
 
 
+# Payload files the pipeline can turn into library output (ISOs are mounted)
+_REMUXABLE_EXTENSIONS = frozenset(VIDEO_EXTENSIONS | {".iso"})
+
+# Service suffixes Sonarr/Radarr may append to a download category
+_ARR_SUFFIXES = ("-sonarr", "-radarr")
+
+
+def _is_new_download(change: "Change", path: str) -> bool:
+    """watchfiles filter: wake the runner only for new entries in complete/.
+
+    Ignores in-progress qBittorrent files (``.!qB``) and hidden entries such
+    as staging files and ``.trash-*`` dirs so the runner's own cleanup and
+    downloads still being written don't trigger ticks.
+    """
+    name = os.path.basename(path)
+    return (
+        change == Change.added
+        and not name.startswith(".")
+        and not name.endswith(".!qB")
+    )
+
+
+def _move_into_place(src: Path, dst: Path) -> None:
+    """Move a finished remux to its library path.
+
+    Staging normally sits next to the final output, so this is one atomic
+    rename; cross-device layouts fall back to ``shutil.move``'s copy.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(str(src), str(dst))
+
+
 def _clean_torrent_name(name: str) -> str:
     """Strip release group tags, codec/quality markers, and torrent junk.
 
@@ -174,10 +241,18 @@ def _match_torrent_to_arr(torrent_name: str, items: list) -> Optional[dict]:
 
 
 class QbittorrentAPI:
+    """Thin qBittorrent Web API client.
+
+    The underlying ``httpx.Client`` keeps its connection and SID cookie
+    alive across calls, so the runner holds one instance for many ticks and
+    only re-authenticates when qBittorrent rejects the session.
+    """
+
     def __init__(self, base_url: str, username: str, password: str) -> None:
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
+        self._logged_in = False
         # Add Host header for qBittorrent CSRF protection when using port mapping
         headers = {"Host": "localhost:8080"}
         self.client = httpx.Client(
@@ -196,52 +271,55 @@ class QbittorrentAPI:
         response.raise_for_status()
         if response.text.strip() != "Ok.":
             raise RuntimeError("qBittorrent authentication failed")
+        self._logged_in = True
+
+    def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send an authenticated request, logging in again if the SID expired."""
+        if not self._logged_in:
+            self.login()
+        response = self.client.request(method, f"{self.base_url}{path}", **kwargs)
+        # qBittorrent answers 403 (older builds 401) once the session is gone
+        if response.status_code in (401, 403):
+            self._logged_in = False
+            self.login()
+            response = self.client.request(
+                method, f"{self.base_url}{path}", **kwargs
+            )
+        response.raise_for_status()
+        return response
 
     def list_completed(self) -> List[TorrentRecord]:
-        response = self.client.get(
-            f"{self.base_url}/api/v2/torrents/info",
-            params={"filter": "completed"},
+        response = self._request(
+            "GET", "/api/v2/torrents/info", params={"filter": "completed"},
         )
-        response.raise_for_status()
-        items = response.json() or []
-        records: List[TorrentRecord] = []
-        for item in items:
-            records.append(
-                TorrentRecord(
-                    hash=item.get("hash", ""),
-                    name=item.get("name", ""),
-                    category=item.get("category") or "",
-                    save_path=Path(item.get("save_path") or ""),
-                    content_path=Path(item.get("content_path") or ""),
-                    size=item.get("size") or 0,
-                    completion_on=item.get("completion_on") or 0,
-                )
+        items = _QB_TORRENT_LIST.validate_json(response.content) or []
+        return [
+            TorrentRecord(
+                hash=item.hash,
+                name=item.name,
+                category=item.category or "",
+                save_path=Path(item.save_path or ""),
+                content_path=Path(item.content_path or ""),
+                size=item.size or 0,
+                completion_on=item.completion_on or 0,
             )
-        return [record for record in records if record.hash and record.save_path]
+            for item in items
+            if item.hash
+        ]
 
     def list_all_names(self) -> Set[str]:
         """Return the names of ALL torrents (any state) in qBittorrent."""
-        response = self.client.get(
-            f"{self.base_url}/api/v2/torrents/info",
-        )
-        response.raise_for_status()
-        items = response.json() or []
-        return {item.get("name", "") for item in items if item.get("name")}
+        return {item.get("name", "") for item in self.list_all() if item.get("name")}
 
     def list_all(self) -> list[dict]:
         """Return full info for ALL torrents in qBittorrent."""
-        response = self.client.get(
-            f"{self.base_url}/api/v2/torrents/info",
-        )
-        response.raise_for_status()
+        response = self._request("GET", "/api/v2/torrents/info")
         return response.json() or []
 
     def list_files(self, torrent_hash: str) -> List[Path]:
-        response = self.client.get(
-            f"{self.base_url}/api/v2/torrents/files",
-            params={"hash": torrent_hash},
+        response = self._request(
+            "GET", "/api/v2/torrents/files", params={"hash": torrent_hash},
         )
-        response.raise_for_status()
         files = response.json() or []
         return [Path(entry.get("name", "")) for entry in files if entry.get("name")]
 
@@ -251,14 +329,14 @@ class QbittorrentAPI:
         hashes = "|".join(torrent_hashes)
         if not hashes:
             return
-        response = self.client.post(
-            f"{self.base_url}/api/v2/torrents/delete",
+        self._request(
+            "POST",
+            "/api/v2/torrents/delete",
             data={
                 "hashes": hashes,
                 "deleteFiles": "true" if delete_files else "false",
             },
         )
-        response.raise_for_status()
 
 
 class PipelineRunner:
@@ -270,9 +348,33 @@ class PipelineRunner:
         self._fallback = ProwlarrDirectGrab(repo)
         from .enrichment import EnrichmentEngine
         self._enrichment = EnrichmentEngine(repo)
-
-    def run_forever(self, interval: float = 60.0) -> None:
-        log.info("starting worker loop (interval=%ss)", interval)
+        self._qb_api: Optional[QbittorrentAPI] = None
+        # Snapshot of pipeline["processed"] held for the duration of a tick;
+        # _mark_processed/_clear_processed write through to disk and to it.
+        self._processed_cache: Optional[dict] = None
+        self._tracked_source: object = None
+        self._tracked_categories: frozenset[str] = frozenset()
+        self._trash_in_flight: Set[Path] = set()  # dirs being deleted in background
+        # File-watch wakeups: _run_tick records the complete/ dir to watch
+        self._watch_dir: Optional[Path] = None
+        self._watching: Optional[Path] = None
+        self._watch_stop = threading.Event()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        # Let the watcher leave its native wait before interpreter teardown
+        atexit.register(self._stop_watcher)
+
+    def run_forever(self, interval: float = 60.0, heartbeat: float = 900.0) -> None:
+        """Tick forever.
+
+        While the downloads ``complete/`` dir can be watched, the runner
+        sleeps until a new download lands there (or ``heartbeat`` seconds
+        pass, for the time-based phases); otherwise it polls every
+        ``interval`` seconds.
+        """
+        log.info(
+            "starting worker loop (interval=%ss, heartbeat=%ss)", interval, heartbeat,
+        )
         while True:
             try:
                 self._tick()
@@ -280,7 +382,64 @@ class PipelineRunner:
             except Exception as exc:  # pragma: no cover - runtime safety net
                 log.error("error: %s", exc)
                 self._save_tick_health(error=str(exc))
-            time.sleep(interval)
+            self._ensure_watcher()
+            timeout = heartbeat if self._watching else interval
+            if self._wake.wait(timeout):
+                self._wake.clear()
+
+    def _ensure_watcher(self) -> None:
+        """Start (or retarget) the background watch on the complete/ dir."""
+        if watch is None or self._watch_dir == self._watching:
+            return
+        if self._watching is not None:
+            self._watch_stop.set()
+        self._watching = self._watch_dir
+        if self._watch_dir is None:
+            return
+        self._watch_stop = stop = threading.Event()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop, args=(self._watch_dir, stop),
+            name="pipeline-watch", daemon=True,
+        )
+        self._watch_thread.start()
+
+    def _stop_watcher(self) -> None:
+        """Stop the current watch thread, waiting briefly for it to exit."""
+        self._watch_stop.set()
+        thread = self._watch_thread
+        if thread is not None:
+            thread.join(timeout=1)
+
+    def _watch_loop(self, directory: Path, stop: threading.Event) -> None:
+        try:
+            for changes in watch(
+                directory, watch_filter=_is_new_download,
+                debounce=2000, stop_event=stop,
+            ):
+                log.debug("woke on %d new download(s) in %s", len(changes), directory)
+                self._wake.set()
+        except Exception as exc:
+            log.warning("file watch on %s stopped: %s — polling instead", directory, exc)
+        if not stop.is_set():
+            # Watch died on its own; fall back to interval polling
+            self._watching = None
+            self._watch_dir = None
+
+    def _qbittorrent_api(
+        self, base_url: str, username: str, password: str,
+    ) -> QbittorrentAPI:
+        """Return the long-lived qBittorrent client, rebuilt if settings changed."""
+        api = self._qb_api
+        if api is not None and (
+            api.base_url == base_url.rstrip("/")
+            and api.username == username
+            and api.password == password
+        ):
+            return api
+        if api is not None:
+            api.close()
+        self._qb_api = QbittorrentAPI(base_url, username, password)
+        return self._qb_api
 
     def _save_tick_health(self, error: str | None) -> None:
         """Persist last_tick timestamp and optional error to pipeline state."""
@@ -296,11 +455,18 @@ class PipelineRunner:
         if not config.services.pipeline.enabled:
             return
 
+        self._processed_cache = self._processed_entries()
+        try:
+            self._run_tick(config)
+        finally:
+            self._processed_cache = None
+
+    def _run_tick(self, config: StackConfig) -> None:
+        self._watch_dir = self._resolve_complete_dir(config)
         self._cleanup_stale_staging(config)
         self._cleanup_stale_orphan_sources(config)
 
-        state = self.repo.load_state()
-        qb_secrets = state.get("secrets", {}).get("qbittorrent", {})
+        qb_secrets = self.repo.load_secrets().get("qbittorrent", {})
 
         qb_cfg = config.services.qbittorrent
         # When VPN is active, qBittorrent shares gluetun's network namespace
@@ -308,10 +474,10 @@ class PipelineRunner:
         vpn_active = config.services.gluetun.enabled
         qb_host = "gluetun" if vpn_active else "qbittorrent"
         base_url = f"http://{qb_host}:8080"
-        api = QbittorrentAPI(
-            base_url=base_url,
-            username=qb_secrets.get("username") or qb_cfg.username,
-            password=qb_secrets.get("password") or qb_cfg.password,
+        api = self._qbittorrent_api(
+            base_url,
+            qb_secrets.get("username") or qb_cfg.username,
+            qb_secrets.get("password") or qb_cfg.password,
         )
 
         needs_refresh: dict[str, bool] = {}  # category -> True
@@ -319,7 +485,6 @@ class PipelineRunner:
 
         # ── Phase 1: Process torrents tracked by qBittorrent ──────────
         try:
-            api.login()
             qbt_all_names = api.list_all_names()
             torrents = api.list_completed()
 
@@ -400,6 +565,19 @@ class PipelineRunner:
                 ]
                 pending.sort(key=lambda t: t.size)
 
+                # Probe every pending video file in one concurrent batch
+                # instead of one blocking ffprobe per file during planning.
+                # Torrents that cannot fit on the pool right now are skipped
+                # below, so their files are not probed.
+                files_by_hash = {t.hash: api.list_files(t.hash) for t in pending}
+                dest_free = self._get_dest_free(config)
+                stream_infos = self._probe_all([
+                    source
+                    for t in pending
+                    if t.size <= 0 or t.size <= dest_free
+                    for source in self._batch_probe_sources(t, files_by_hash[t.hash])
+                ])
+
                 for torrent in pending:
                     dest_free = self._get_dest_free(config)
                     needed = torrent.size
@@ -410,14 +588,16 @@ class PipelineRunner:
                             dest_free / (1024**3),
                         )
                         continue
-                    ok = self._process_torrent(api, config, torrent)
+                    ok = self._process_torrent(
+                        api, config, torrent,
+                        files=files_by_hash[torrent.hash],
+                        stream_infos=stream_infos,
+                    )
                     if ok:
                         needs_refresh[torrent.category] = True
 
         except Exception as exc:
             log.error("qBittorrent error: %s", exc)
-        finally:
-            api.close()
 
         # ── Phase 1.5: Download health / stall detection ─────────────────
         try:
@@ -436,8 +616,7 @@ class PipelineRunner:
         # Expire old orphan hashes (7 days)
         ORPHAN_EXPIRY = 7 * 86400
         now = time.time()
-        pipeline = self.repo.load_pipeline_state()
-        processed = pipeline.get("processed", {})
+        processed = self._processed_entries()
         expired = [
             h for h, entry in processed.items()
             if h.startswith("orphan_")
@@ -445,7 +624,7 @@ class PipelineRunner:
             and now - entry.get("timestamp", now) > ORPHAN_EXPIRY
         ]
         for h in expired:
-            self.repo.delete_pipeline_entry(h)
+            self._clear_processed(h)
         if expired:
             log.info("expired %d orphan hash(es)", len(expired))
 
@@ -505,7 +684,7 @@ class PipelineRunner:
         if now - last_nightly < self._NIGHTLY_SEARCH_INTERVAL:
             return
 
-        secrets = self.repo.load_state().get("secrets", {})
+        secrets = self.repo.load_secrets()
         vpn = config.services.gluetun.enabled
         timeout = httpx.Timeout(30.0, connect=10.0)
 
@@ -740,13 +919,17 @@ class PipelineRunner:
         """
         # Normalize category to strip *arr suffixes
         normalized = category
-        for suffix in ["-sonarr", "-radarr"]:
+        for suffix in ("-sonarr", "-radarr"):
             if category.endswith(suffix):
                 normalized = category[: -len(suffix)]
                 break
 
+        # Config sections are frozen, so the set only changes with the object
         categories = config.download_policy.categories
-        return normalized in {categories.radarr, categories.sonarr}
+        if self._tracked_source is not categories:
+            self._tracked_categories = frozenset((categories.radarr, categories.sonarr))
+            self._tracked_source = categories
+        return normalized in self._tracked_categories
 
     # ------------------------------------------------------------------
     # Processed-source cleanup — delete source files that were already
@@ -774,8 +957,7 @@ class PipelineRunner:
         if complete_dir is None:
             return
 
-        pipeline = self.repo.load_pipeline_state()
-        processed = pipeline.get("processed", {})
+        processed = self._processed_entries()
         now = time.time()
         cleaned = 0
 
@@ -1064,8 +1246,7 @@ class PipelineRunner:
 
     def _sonarr_recognizes(self, name: str, config: StackConfig) -> bool:
         """Check if Sonarr has a local series matching this name."""
-        state = self.repo.load_state()
-        api_key = state.get("secrets", {}).get("sonarr", {}).get("api_key")
+        api_key = self.repo.load_secrets().get("sonarr", {}).get("api_key")
         if not api_key:
             return False
 
@@ -1220,7 +1401,7 @@ class PipelineRunner:
                     failed += 1
                     continue
 
-            shutil.move(str(plan.staging_output), str(plan.final_output))
+            _move_into_place(plan.staging_output, plan.final_output)
             # Verify the file actually landed
             if not plan.final_output.exists():
                 log.error(
@@ -1295,12 +1476,7 @@ class PipelineRunner:
         max_age = 2 * 3600  # 2 hours
         now = time.time()
 
-        # Same resolution as PipelineWorker._resolve_pool_root
-        pool_root: Path | None = None
-        for candidate in (Path("/data"), Path(config.paths.pool)):
-            if candidate.exists():
-                pool_root = candidate
-                break
+        pool_root = find_pool_root(config.paths.pool)
         if pool_root is None:
             return
 
@@ -1345,10 +1521,12 @@ class PipelineRunner:
 
         # Collect all items (top-level + inside category subdirs)
         items: list[Path] = []
+        self._purge_trash(complete_dir)
         for item in sorted(complete_dir.iterdir()):
             if item.name.startswith("."):
                 continue
             if item.is_dir() and item.name in category_dirs:
+                self._purge_trash(item)
                 for child in sorted(item.iterdir()):
                     if not child.name.startswith("."):
                         items.append(child)
@@ -1364,8 +1542,7 @@ class PipelineRunner:
             orphan_hash = "orphan_" + hashlib.sha256(
                 item.name.encode()
             ).hexdigest()[:16]
-            processed = self.repo.load_pipeline_state().get("processed", {})
-            entry = processed.get(orphan_hash)
+            entry = self._processed_entries().get(orphan_hash)
             if not entry:
                 continue  # Not yet processed — leave it for the orphan scanner
 
@@ -1410,21 +1587,19 @@ class PipelineRunner:
         Since the pipeline now writes directly to pool, we check
         pool free space instead of scratch.
         """
-        # Same resolution as PipelineWorker._resolve_pool_root
-        for candidate in (Path("/data"), Path(config.paths.pool)):
-            if candidate.exists():
-                return shutil.disk_usage(candidate).free
-        return shutil.disk_usage("/").free
+        pool_root = find_pool_root(config.paths.pool)
+        return shutil.disk_usage(pool_root or "/").free
 
     def _normalize_category(self, category: str) -> str:
         """Strip *arr suffixes from a category name."""
-        for suffix in ["-sonarr", "-radarr"]:
-            if category.endswith(suffix):
-                return category[: -len(suffix)]
-        return category
+        if not category.endswith(_ARR_SUFFIXES):
+            return category
+        return category.rpartition("-")[0]
 
     # Statuses that represent permanent outcomes — the item is done.
-    _TERMINAL_STATUSES = frozenset({"ok", "partial", "skipped_no_files"})
+    _TERMINAL_STATUSES = frozenset({
+        "ok", "partial", "skipped_no_files", "skipped_no_video",
+    })
     # Failed statuses eligible for retry after a cooldown.
     _RETRYABLE_STATUSES = frozenset({"plan_failed", "ffmpeg_failed"})
     # How long before a failed orphan is retried (30 minutes).
@@ -1432,10 +1607,14 @@ class PipelineRunner:
     # Maximum retry attempts before giving up permanently.
     _ORPHAN_MAX_RETRIES = 5
 
+    def _processed_entries(self) -> dict:
+        """Return pipeline["processed"], from the tick snapshot when one is held."""
+        if self._processed_cache is not None:
+            return self._processed_cache
+        return self.repo.load_pipeline_state().get("processed", {})
+
     def _is_processed(self, torrent_hash: str) -> bool:
-        pipeline = self.repo.load_pipeline_state()
-        processed = pipeline.get("processed", {})
-        entry = processed.get(torrent_hash)
+        entry = self._processed_entries().get(torrent_hash)
         if entry is None:
             return False
         if not isinstance(entry, dict):
@@ -1468,9 +1647,7 @@ class PipelineRunner:
 
     def _processed_entry(self, torrent_hash: str) -> Optional[dict]:
         """Return the full pipeline entry dict for a torrent, or None."""
-        pipeline = self.repo.load_pipeline_state()
-        processed = pipeline.get("processed", {})
-        entry = processed.get(torrent_hash)
+        entry = self._processed_entries().get(torrent_hash)
         return entry if isinstance(entry, dict) else None
 
     def _mark_processed(
@@ -1490,6 +1667,8 @@ class PipelineRunner:
             else:
                 entry["retries"] = 0
         self.repo.update_pipeline_entry(torrent_hash, entry)
+        if self._processed_cache is not None:
+            self._processed_cache[torrent_hash] = entry
 
         # Also write an orphan-keyed alias so the Phase 2 orphan scanner
         # recognises source files that were already processed by Phase 1.
@@ -1505,10 +1684,14 @@ class PipelineRunner:
                 "alias_of": torrent_hash,
             }
             self.repo.update_pipeline_entry(orphan_alias, alias_entry)
+            if self._processed_cache is not None:
+                self._processed_cache[orphan_alias] = alias_entry
 
     def _clear_processed(self, torrent_hash: str) -> None:
         """Remove a torrent from the processed set so it can be reprocessed."""
         self.repo.delete_pipeline_entry(torrent_hash)
+        if self._processed_cache is not None:
+            self._processed_cache.pop(torrent_hash, None)
 
     def _lookup_arr_metadata(
         self, config: StackConfig, torrent: TorrentRecord
@@ -1539,8 +1722,7 @@ class PipelineRunner:
         if fallback_meta is not None:
             return fallback_meta
 
-        state = self.repo.load_state()
-        secrets_state = state.get("secrets", {})
+        secrets_state = self.repo.load_secrets()
         cat_config = config.download_policy.categories
         normalized = self._normalize_category(torrent.category)
 
@@ -1769,8 +1951,7 @@ class PipelineRunner:
         Returns ``{absolute_ep: {"season": N, "episode": N}}`` or None
         if the series doesn't use absolute numbering.
         """
-        state = self.repo.load_state()
-        api_key = state.get("secrets", {}).get("sonarr", {}).get("api_key")
+        api_key = self.repo.load_secrets().get("sonarr", {}).get("api_key")
         if not api_key:
             return None
 
@@ -1840,8 +2021,7 @@ class PipelineRunner:
             torrent.name[:50], service_name, media_id,
         )
 
-        state = self.repo.load_state()
-        api_key = state.get("secrets", {}).get(service_name, {}).get("api_key")
+        api_key = self.repo.load_secrets().get(service_name, {}).get("api_key")
         if not api_key:
             return None
 
@@ -1878,18 +2058,36 @@ class PipelineRunner:
         api: QbittorrentAPI,
         config: StackConfig,
         torrent: TorrentRecord,
+        *,
+        files: Optional[List[Path]] = None,
+        stream_infos: Optional[Dict[Path, StreamInfo]] = None,
     ) -> bool:
         """Process a completed torrent through the remux pipeline.
 
+        ``files`` and ``stream_infos`` let ``_tick()`` hand over the file
+        list and batch probe results it already fetched.
+
         Returns True if ALL files were processed successfully.
         """
         log.info("processing: %s (%s...)", torrent.name, torrent.hash[:8])
-        files = api.list_files(torrent.hash)
+        if files is None:
+            files = api.list_files(torrent.hash)
         if not files:
             log.warning("no files for %s, skipping", torrent.name)
             self._mark_processed(torrent.hash, "skipped_no_files", torrent_name=torrent.name)
             return False
 
+        # Nothing to remux without a video file or disc image: skip the
+        # Radarr/Sonarr lookups and planning, which would only fail.  Clean
+        # up like the plan_failed path does so the payload isn't kept forever.
+        if not any(f.suffix.lower() in _REMUXABLE_EXTENSIONS for f in files):
+            log.warning("no video files in %s, skipping", torrent.name)
+            self._cleanup_path(torrent.content_path)
+            self._cleanup_empty_parent(torrent.content_path)
+            api.remove_torrents([torrent.hash])
+            self._mark_processed(torrent.hash, "skipped_no_video", torrent_name=torrent.name)
+            return False
+
         download_path = torrent.save_path
         full_paths = [download_path / file for file in files]
         info = TorrentInfo(
@@ -1914,11 +2112,40 @@ class PipelineRunner:
         try:
             return self._execute_pipeline(
                 api, config, torrent, info, iso_mount_dir=iso_dir,
+                stream_infos=stream_infos,
             )
         finally:
             if iso_dir:
                 self._close_iso(iso_dir)
 
+    @staticmethod
+    def _batch_probe_sources(torrent: TorrentRecord, files: List[Path]) -> List[Path]:
+        """Video files of *torrent* whose probe results planning will use.
+
+        Disc torrents are planned from their structure rather than the file
+        list: BDMV folders from the playlist's feature clips and ISO images
+        from the mounted disc.  Probing their hundreds of ``BDMV/STREAM``
+        clips up front would only produce results nobody reads.
+        """
+        sources: List[Path] = []
+        for f in files:
+            if f.suffix.lower() == ".iso":
+                return []
+            if f.suffix.lower() in VIDEO_EXTENSIONS and "BDMV" not in f.parts:
+                sources.append(torrent.save_path / f)
+        return sources
+
+    def _probe_all(self, sources: List[Path]) -> Dict[Path, StreamInfo]:
+        """Probe *sources* concurrently; failures are left for planning to retry."""
+        sources = [p for p in sources if p.exists()]
+        if not sources:
+            return {}
+        try:
+            return asyncio.run(probe_streams_many(sources))
+        except Exception as exc:
+            log.warning("batch probe failed: %s", exc)
+            return {}
+
     def _execute_pipeline(
         self,
         api: QbittorrentAPI,
@@ -1927,6 +2154,7 @@ class PipelineRunner:
         info: TorrentInfo,
         *,
         iso_mount_dir: Optional[Path] = None,
+        stream_infos: Optional[Dict[Path, StreamInfo]] = None,
     ) -> bool:
         """Run the remux pipeline for a torrent.
 
@@ -1954,6 +2182,7 @@ class PipelineRunner:
                 library_path=metadata.library_path if metadata else None,
                 iso_mount_dir=iso_mount_dir,
                 absolute_episode_map=abs_map,
+                stream_infos=stream_infos,
             )
         except ValueError as exc:
             log.error("plan failed for %s: %s", torrent.name, exc)
@@ -2029,7 +2258,7 @@ class PipelineRunner:
                         existing_size / (1024**3), new_size / (1024**3),
                     )
 
-            shutil.move(str(plan.staging_output), str(plan.final_output))
+            _move_into_place(plan.staging_output, plan.final_output)
             # Verify the file actually landed
             if not plan.final_output.exists():
                 log.error(
@@ -2264,12 +2493,12 @@ class PipelineRunner:
         try:
             probe = subprocess.run(
                 [
-                    "ffprobe", "-v", "quiet",
+                    FFPROBE, "-v", "quiet",
                     "-print_format", "json",
                     "-show_format", "-show_streams",
                     str(staging_output),
                 ],
-                capture_output=True, text=True, timeout=30,
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=30,
             )
             if probe.returncode != 0:
                 log.error("VALIDATION FAILED: ffprobe failed on output — cannot verify file integrity")
@@ -2452,18 +2681,47 @@ class PipelineRunner:
         except Exception as exc:
             log.warning("failed to clean up %s: %s", iso_dir, exc)
 
+    _TRASH_PREFIX = ".trash-"
+
     def _cleanup_path(self, path: Path) -> None:
-        """Remove a file or directory. Silently ignores missing paths."""
+        """Remove a file or directory. Silently ignores missing paths.
+
+        Directories are renamed to a hidden ``.trash-*`` sibling (which every
+        scanner skips) and deleted on a background thread, so a torrent with
+        thousands of small files doesn't stall the tick.
+        """
         if not str(path):
             return
         try:
             if path.is_dir():
-                shutil.rmtree(path)
+                trash = path.with_name(f"{self._TRASH_PREFIX}{uuid.uuid4().hex}")
+                try:
+                    path.rename(trash)
+                except OSError:
+                    shutil.rmtree(path)
+                else:
+                    self._trash_in_flight.add(trash)
+                    threading.Thread(
+                        target=self._delete_trash, args=(trash,),
+                        name="pipeline-trash", daemon=True,
+                    ).start()
             elif path.exists():
                 path.unlink()
         except OSError as exc:
             log.warning("cleanup failed for %s: %s", path, exc)
 
+    def _delete_trash(self, trash: Path) -> None:
+        try:
+            shutil.rmtree(trash, ignore_errors=True)
+        finally:
+            self._trash_in_flight.discard(trash)
+
+    def _purge_trash(self, directory: Path) -> None:
+        """Delete ``.trash-*`` dirs left behind if the worker exited mid-delete."""
+        for trash in directory.glob(f"{self._TRASH_PREFIX}*"):
+            if trash not in self._trash_in_flight:
+                shutil.rmtree(trash, ignore_errors=True)
+
     # Directories that must never be removed by cleanup.  These are the
     # structural directories that qBittorrent and the pipeline rely on.
     _PROTECTED_DIRS = frozenset({
@@ -2515,8 +2773,7 @@ class PipelineRunner:
         if not service_name or media_id is None:
             return
 
-        state = self.repo.load_state()
-        api_key = state.get("secrets", {}).get(service_name, {}).get("api_key")
+        api_key = self.repo.load_secrets().get(service_name, {}).get("api_key")
         if not api_key:
             return
 
@@ -2581,8 +2838,7 @@ class PipelineRunner:
         After the pipeline places remuxed files into the library directories,
         Sonarr/Radarr need to rescan to discover and import them.
         """
-        state = self.repo.load_state()
-        secrets_state = state.get("secrets", {})
+        secrets_state = self.repo.load_secrets()
         cat_config = config.download_policy.categories
 
         for raw_category in categories:
@@ -2643,9 +2899,12 @@ def main() -> None:
     # Pipeline worker runs with read-only config access
     repo = ConfigRepository(root, read_only=True)
     interval = float(os.getenv("PIPELINE_INTERVAL", "60"))
+    heartbeat = float(os.getenv("PIPELINE_HEARTBEAT", "900"))
     log.info("config root: %s", root)
+    # Skip re-probing unchanged files across ticks (e.g. retries after failures)
+    configure_probe_cache(root / "probe_cache.sqlite")
     runner = PipelineRunner(repo)
-    runner.run_forever(interval=interval)
+    runner.run_forever(interval=interval, heartbeat=heartbeat)
 
 
 if __name__ == "__main__":
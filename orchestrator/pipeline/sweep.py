@@ -20,7 +20,15 @@ import httpx
 from ..models import StackConfig
 from ..storage import ConfigRepository
 from .languages import arr_language_to_iso
-from .remux import TrackSelection, StreamInfo, build_ffmpeg_command, probe_streams
+from .remux import (
+    TrackSelection,
+    StreamInfo,
+    _language_sets,
+    _normalize_lang,
+    build_ffmpeg_command,
+    build_ffmpeg_command_negative,
+    probe_streams,
+)
 from .worker import VIDEO_EXTENSIONS, PipelineWorker
 
 
@@ -38,6 +46,11 @@ class SweepAction:
     unwanted_audio: List[str]
     unwanted_subtitles: List[str]
     selection: TrackSelection
+    kept_audio: List[str] = field(default_factory=list)  # audio langs left after stripping
+    # Every audio/subtitle stream carries an explicit lowercase language tag,
+    # so ffmpeg's case-sensitive language:xxx stream specifiers see the same
+    # codes the scan reported
+    exact_language_tags: bool = False
 
 
 @dataclass
@@ -148,6 +161,12 @@ class LibrarySweeper:
                     unwanted_audio=unwanted_audio,
                     unwanted_subtitles=unwanted_subs,
                     selection=selection,
+                    kept_audio=sorted(
+                        stream_info.audio_languages - set(unwanted_audio)
+                    ),
+                    exact_language_tags=self._has_exact_language_tags(
+                        stream_info.raw_streams
+                    ),
                 ))
 
         # Estimate time based on throughput
@@ -197,10 +216,16 @@ class LibrarySweeper:
                 )
 
                 # Build and run ffmpeg
-                cmd = build_ffmpeg_command(
-                    action.path, staging_path, action.selection,
-                    original_language=original_language,
-                )
+                if self._can_skip_probe(action, original_language):
+                    cmd = build_ffmpeg_command_negative(
+                        action.path, staging_path,
+                        action.unwanted_audio, action.unwanted_subtitles,
+                    )
+                else:
+                    cmd = build_ffmpeg_command(
+                        action.path, staging_path, action.selection,
+                        original_language=original_language,
+                    )
                 success = self._run_ffmpeg(cmd)
 
                 if not success:
@@ -254,6 +279,42 @@ class LibrarySweeper:
     # Detection logic
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _can_skip_probe(
+        action: SweepAction, original_language: Optional[str],
+    ) -> bool:
+        """Whether the scan's drop lists are enough to build the ffmpeg command.
+
+        When True, ``build_ffmpeg_command_negative()`` strips the unwanted
+        languages without a second ffprobe.  Non-MKV containers may carry
+        MKV-incompatible codecs, forced subtitles in dropped languages must
+        survive, "und" audio needs language tag injection, and stripping every
+        audio track must never happen — those go through the full builder.
+        The scan reports untagged streams as "und" and lowercases every code,
+        but ``-map -0:s:m:language:und`` only matches a literal lowercase tag,
+        so dropping "und" or any stream without an exact tag does too.
+        """
+        if action.path.suffix.lower() != ".mkv" or not action.kept_audio:
+            return False
+        if "und" in action.unwanted_audio or "und" in action.unwanted_subtitles:
+            return False
+        if not action.exact_language_tags:
+            return False
+        if action.unwanted_subtitles and "forced" in action.selection.subtitles:
+            return False
+        return not (original_language and "und" in action.kept_audio)
+
+    @staticmethod
+    def _has_exact_language_tags(streams: List[dict]) -> bool:
+        """Whether every audio/subtitle stream has a lowercase language tag."""
+        for stream in streams:
+            if stream.get("codec_type") not in ("audio", "subtitle"):
+                continue
+            lang = stream.get("tags", {}).get("language")
+            if not lang or lang != lang.lower():
+                return False
+        return True
+
     def _detect_unwanted(
         self,
         info: StreamInfo,
@@ -272,26 +333,30 @@ class LibrarySweeper:
 
         Returns (unwanted_audio, unwanted_subtitles).
         """
-        keep_audio: Set[str] = set(lang.lower() for lang in selection.audio)
+        # Compare normalised codes exactly like build_ffmpeg_command() does,
+        # so e.g. a "fra" track is kept when the policy says "fre".  The
+        # returned lists still hold the raw tags, which is what ffmpeg's
+        # language:xxx stream specifiers match against.
+        # ("forced" is a disposition flag, not a language; it is dropped here.)
+        policy_audio, keep_subs, _ = _language_sets(
+            tuple(selection.audio), tuple(selection.subtitles),
+        )
+        keep_audio: Set[str] = set(policy_audio)
         keep_audio.add("und")  # Always keep undetermined
 
         # Use API-provided original language (reliable) if available,
         # fall back to probe_streams heuristic (unreliable) otherwise
         orig = original_language or info.original_language
         if orig:
-            keep_audio.add(orig.lower())
-
-        keep_subs: Set[str] = set(lang.lower() for lang in selection.subtitles)
-        # "forced" is a disposition flag, not a language — remove from set
-        keep_subs.discard("forced")
+            keep_audio.add(_normalize_lang(orig))
 
         unwanted_audio = [
             lang for lang in sorted(info.audio_languages)
-            if lang.lower() not in keep_audio
+            if _normalize_lang(lang) not in keep_audio
         ]
         unwanted_subs = [
             lang for lang in sorted(info.subtitle_languages)
-            if lang.lower() not in keep_subs
+            if _normalize_lang(lang) not in keep_subs
         ]
 
         return unwanted_audio, unwanted_subs
@@ -1,10 +1,12 @@
 """Media pipeline worker skeleton for post-processing downloads."""
 from __future__ import annotations
 
+import os
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from .bdmv import (
     detect_bdmv,
@@ -13,7 +15,7 @@ from .bdmv import (
     get_bdmv_stream_languages,
     map_clpi_to_ffprobe_indices,
 )
-from .remux import TrackSelection, build_ffmpeg_command
+from .remux import FFMPEG, StreamInfo, TrackSelection, build_ffmpeg_command
 from ..models import StackConfig
 
 
@@ -27,7 +29,132 @@ def _sanitize_filename(name: str) -> str:
     return name or "Unknown"
 
 
-VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".mov", ".ts", ".m2ts"}
+VIDEO_EXTENSIONS = frozenset({".mkv", ".mp4", ".avi", ".mov", ".ts", ".m2ts"})
+
+
+# Service suffixes Sonarr/Radarr may append to a download category
+_ARR_SUFFIXES = ("-sonarr", "-radarr")
+
+
+def _is_video_name(name: str) -> bool:
+    """``Path(name).suffix.lower() in VIDEO_EXTENSIONS`` without building a Path."""
+    base = name.rstrip("/").rpartition("/")[2]
+    dot = base.rfind(".")
+    return dot > 0 and base[dot:].lower() in VIDEO_EXTENSIONS
+
+# Resolved pool roots keyed by the configured pool path.  Mount points do
+# not move while the orchestrator runs, so each is stat'ed only once.
+_PoolPath = Union[str, "os.PathLike[str]"]
+_POOL_ROOTS: Dict[_PoolPath, Path] = {}
+
+
+def find_pool_root(pool: _PoolPath) -> Optional[Path]:
+    """Return the media pool root as seen by this process, or None.
+
+    The config stores host paths (e.g. /mnt/pool/data), but inside the
+    container the pool is mounted at /data.  Prefer the container mount if
+    present and fall back to the configured path.  Misses are not cached so
+    a pool that appears later is still picked up.
+    """
+    root = _POOL_ROOTS.get(pool)
+    if root is None:
+        for candidate in (Path("/data"), Path(pool)):
+            if candidate.exists():
+                root = _POOL_ROOTS[pool] = candidate
+                break
+    return root
+
+
+def resolve_pool_root(pool: _PoolPath) -> Path:
+    """Like ``find_pool_root()`` but falls back to the configured path."""
+    return find_pool_root(pool) or Path(pool)
+
+
+def reset_path_cache() -> None:
+    """Forget resolved pool roots (for tests and remounts)."""
+    _POOL_ROOTS.clear()
+
+
+def _has_digit(text: str) -> bool:
+    """True if *text* contains a character matched by the regex ``\\d``."""
+    return any(map(str.isdecimal, text))
+
+
+def _join_path(base: Path, *parts: str) -> Path:
+    """``base / part / ...`` with a single Path construction."""
+    return Path(os.path.join(base, *parts))
+
+
+def _staging_path(final_output: Path) -> Path:
+    """Hidden temp file next to *final_output* (same filesystem) for staging."""
+    head, tail = os.path.split(final_output)
+    return Path(os.path.join(head, f".tmp_{tail}"))
+
+
+def _file_size(path: Path) -> int:
+    """Size of *path* in bytes (one stat call), or 0 if it is missing."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+# ── Name parsing patterns (compiled once, shared by every torrent) ──────
+_BRACKETED = re.compile(r'\[.*?\]')
+# Scene names use dots/underscores as word separators
+_SEPARATORS_TO_SPACE = str.maketrans('._', '  ')
+
+# Quality/source info truncates the name (everything after the keyword).
+# These patterns MUST match as complete words to avoid false positives
+# (e.g. "MA" inside "Master").
+# All alternatives are fused into one pattern so a single leftmost scan
+# finds the earliest truncation point.
+_MOVIE_TRUNCATE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in (
+        r'\b(1080p|720p|2160p|4K|UHD)\b.*$',
+        r'\b(BluRay|Blu-ray|WEBRip|WEB-DL|REMUX|HDTV)\b.*$',
+        r'\b(BD-?DISK|BD-?REMUX|BDRip|BDRemux|DVDRip)\b.*$',
+        r'\b(x264|x265|HEVC|H 264|H 265)\b.*$',
+        # Codec patterns: require dash-prefix or standalone to avoid "Master"
+        r'\bDTS-HD\b.*$',
+        r'\bDTS\b[\s\-].*$',  # DTS followed by space/dash (not "DTSomeword")
+        r'\b(AAC|FLAC|TrueHD|Atmos)\b.*$',
+    )),
+    re.IGNORECASE,
+)
+_YEAR = re.compile(r'\b(19\d{2}|20\d{2})\b')
+_SCENE_TAGS = re.compile(
+    r'\b(REMASTERED|COMPLETE|REPACK|EXTENDED|UNRATED|UNCUT|'
+    r'DIRECTORS\s*CUT|JAPANESE|RUSSIAN|MULTi|DUAL|PROPER|INTERNAL|LIMITED|'
+    r'CEE|EUR|HDR|BD|CRITERION|SAMPLE|'
+    # Common scene group names that appear as suffixes
+    r'FU|HDCLUB|NAHOM|GUHZER|FGT|EATDIK|SharpHD|MassModz|'
+    r'FraMeSToR|MkvCage|YTS|YIFY|RARBG|SPARKS|AMIABLE|EVO|FLAME)\b',
+    re.IGNORECASE,
+)
+_TRAILING_PUNCT = re.compile(r'[\-\(\)\s]+$')
+_TRAILING_GROUP = re.compile(r'\s+[A-Z]{1,8}$')
+
+_LEADING_GROUP = re.compile(r'^\[[^\]]*\]\s*')
+# S01E01-E02, S01E01E02, S01E01-E03
+_TV_MULTI_EPISODE = re.compile(
+    r'^(.+?)\s*[.\-_ ]+S(\d{1,2})E(\d{1,3})\s*[-.]?\s*E(\d{1,3})', re.IGNORECASE,
+)
+_TV_STANDARD_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'^(.+?)\s*[.\-_ ]+S(\d{1,2})E(\d{1,3})',    # S01E01, S01E148
+        r'^(.+?)\s*[.\-_ ]+S(\d{1,2})EP(\d{1,3})',    # S01EP03
+        r'^(.+?)\s+(\d{1,2})x(\d{1,3})',               # 1x01, 1x148
+        r'^(.+?)\s+Season\s*(\d+).*?Episode\s*(\d+)',   # Season 1 Episode 1
+    )
+]
+_TV_BARE_EPISODE = re.compile(r'^S(\d{1,2})E(\d{1,3})\b', re.IGNORECASE)
+_ANIME_SEASON = re.compile(r'^(.+?)\s+S(\d{1,2})\s*-\s*(\d{1,4})(?:\s|[.\-_\(\[]|$)')
+_ANIME_NUM_SEASON = re.compile(r'^(.+?)\s+(\d)\s*-\s*(\d{2,4})(?:\s|[.\-_\(\[]|$)')
+_ANIME_ABSOLUTE = re.compile(r'^(.+?)\s*-\s*(\d{2,4})(?:\s|[.\-_\(\[]|$)')
+_ANIME_NO_DASH = re.compile(r'^(.+?)[.\s]+(\d{2,4})(?:\s*(?:v\d)?[.\s\[\(]|$)')
+_TRAILING_DASHES = re.compile(r'[\-]+$')
 
 
 def parse_movie_name(torrent_name: str) -> Tuple[str, Optional[str]]:
@@ -44,29 +171,16 @@ def parse_movie_name(torrent_name: str) -> Tuple[str, Optional[str]]:
     name = torrent_name
 
     # Step 1: Remove bracketed content first (e.g. [JAPANESE] [YTS.MX])
-    name = re.sub(r'\[.*?\]', ' ', name)
+    name = _BRACKETED.sub(' ', name)
 
     # Step 2: Replace dots/underscores with spaces early so patterns work on words
-    name = re.sub(r'[._]', ' ', name)
+    name = name.translate(_SEPARATORS_TO_SPACE)
 
     # Step 3: Remove quality/source info (everything after resolution or keywords).
-    # These patterns MUST match as complete words to avoid false positives
-    # (e.g. "MA" inside "Master").
-    truncate_patterns = [
-        r'\b(1080p|720p|2160p|4K|UHD)\b.*$',
-        r'\b(BluRay|Blu-ray|WEBRip|WEB-DL|REMUX|HDTV)\b.*$',
-        r'\b(BD-?DISK|BD-?REMUX|BDRip|BDRemux|DVDRip)\b.*$',
-        r'\b(x264|x265|HEVC|H 264|H 265)\b.*$',
-        # Codec patterns: require dash-prefix or standalone to avoid "Master"
-        r'\bDTS-HD\b.*$',
-        r'\bDTS\b[\s\-].*$',  # DTS followed by space/dash (not "DTSomeword")
-        r'\b(AAC|FLAC|TrueHD|Atmos)\b.*$',
-    ]
-    for pattern in truncate_patterns:
-        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
+    name = _MOVIE_TRUNCATE.sub('', name, count=1)
 
     # Step 4: Extract year (4 digits between 1900-2099)
-    year_match = re.search(r'\b(19\d{2}|20\d{2})\b', name)
+    year_match = _YEAR.search(name)
     year = year_match.group(1) if year_match else None
 
     # Remove year from title
@@ -74,30 +188,21 @@ def parse_movie_name(torrent_name: str) -> Tuple[str, Optional[str]]:
         name = name.replace(year, '')
 
     # Step 5: Remove scene/release tags
-    scene_tags = re.compile(
-        r'\b(REMASTERED|COMPLETE|REPACK|EXTENDED|UNRATED|UNCUT|'
-        r'DIRECTORS\s*CUT|JAPANESE|RUSSIAN|MULTi|DUAL|PROPER|INTERNAL|LIMITED|'
-        r'CEE|EUR|HDR|BD|CRITERION|SAMPLE|'
-        # Common scene group names that appear as suffixes
-        r'FU|HDCLUB|NAHOM|GUHZER|FGT|EATDIK|SharpHD|MassModz|'
-        r'FraMeSToR|MkvCage|YTS|YIFY|RARBG|SPARKS|AMIABLE|EVO|FLAME)\b',
-        re.IGNORECASE,
-    )
-    name = scene_tags.sub('', name)
+    name = _SCENE_TAGS.sub('', name)
 
     # Step 6: Collapse spaces, strip trailing punctuation
-    title = re.sub(r'\s+', ' ', name).strip()
-    title = re.sub(r'[\-\(\)\s]+$', '', title).strip()
+    title = ' '.join(name.split())
+    title = _TRAILING_PUNCT.sub('', title).strip()
 
     # Step 7: Remove trailing scene group names (short ALL-CAPS at end of title)
     # e.g. "Ice Age 3 FU" -> "Ice Age 3", "Leon BD" -> "Leon"
     # But don't strip if the ENTIRE title is all-caps (e.g. "THE ROYAL TENENBAUMS")
     if not title.isupper():
-        title = re.sub(r'\s+[A-Z]{1,8}$', '', title).strip()
+        title = _TRAILING_GROUP.sub('', title).strip()
 
     # Step 8: Final cleanup
-    title = re.sub(r'[\-\(\)\s]+$', '', title).strip()
-    title = re.sub(r'\s+', ' ', title).strip()
+    title = _TRAILING_PUNCT.sub('', title).strip()
+    title = ' '.join(title.split())
 
     return (title, year)
 
@@ -121,15 +226,15 @@ def parse_tv_episode(name: str) -> Optional[Tuple[str, int, int, Optional[int]]]
         "Show.53.v2.1080p.BluRay"                     -> ("Show", 1, 53, None)
     """
     # Strip leading [Group] tag for all patterns
-    stripped = re.sub(r'^\[[^\]]*\]\s*', '', name)
+    stripped = _LEADING_GROUP.sub('', name)
+
+    # Every pattern below needs a season/episode number; most movie names
+    # reaching this function have none, so skip the regex scans entirely.
+    if not _has_digit(stripped):
+        return None
 
     # ── Multi-episode patterns (most specific first) ─────────────────
-    # S01E01-E02, S01E01E02, S01E01-E03
-    multi_ep = re.search(
-        r'^(.+?)\s*[.\-_ ]+S(\d{1,2})E(\d{1,3})\s*[-.]?\s*E(\d{1,3})',
-        stripped,
-        re.IGNORECASE,
-    )
+    multi_ep = _TV_MULTI_EPISODE.search(stripped)
     if multi_ep:
         show_name = _clean_show_name(multi_ep.group(1).strip())
         season = int(multi_ep.group(2))
@@ -138,15 +243,8 @@ def parse_tv_episode(name: str) -> Optional[Tuple[str, int, int, Optional[int]]]
         return (show_name, season, ep_start, ep_end)
 
     # ── Standard patterns (most specific first) ──────────────────────
-    standard_patterns = [
-        r'^(.+?)\s*[.\-_ ]+S(\d{1,2})E(\d{1,3})',    # S01E01, S01E148
-        r'^(.+?)\s*[.\-_ ]+S(\d{1,2})EP(\d{1,3})',    # S01EP03
-        r'^(.+?)\s+(\d{1,2})x(\d{1,3})',               # 1x01, 1x148
-        r'^(.+?)\s+Season\s*(\d+).*?Episode\s*(\d+)',   # Season 1 Episode 1
-    ]
-
-    for pattern in standard_patterns:
-        match = re.search(pattern, stripped, re.IGNORECASE)
+    for pattern in _TV_STANDARD_PATTERNS:
+        match = pattern.search(stripped)
         if match:
             show_name = match.group(1).strip()
             season = int(match.group(2))
@@ -158,19 +256,14 @@ def parse_tv_episode(name: str) -> Optional[Tuple[str, int, int, Optional[int]]]
     # Files named just "S07E01.mkv" without a show name.
     # Return a placeholder show name; the caller should use the parent
     # directory or library_path to determine the actual show name.
-    bare_ep = re.search(
-        r'^S(\d{1,2})E(\d{1,3})\b', stripped, re.IGNORECASE,
-    )
+    bare_ep = _TV_BARE_EPISODE.search(stripped)
     if bare_ep:
         season = int(bare_ep.group(1))
         episode = int(bare_ep.group(2))
         return ("_bare_episode_", season, episode, None)
 
     # ── Anime with season indicator: "Show Name S2 - 01" ─────────────
-    anime_season = re.search(
-        r'^(.+?)\s+S(\d{1,2})\s*-\s*(\d{1,4})(?:\s|[.\-_\(\[]|$)',
-        stripped,
-    )
+    anime_season = _ANIME_SEASON.search(stripped)
     if anime_season:
         show_name = anime_season.group(1).strip()
         season = int(anime_season.group(2))
@@ -181,10 +274,7 @@ def parse_tv_episode(name: str) -> Optional[Tuple[str, int, int, Optional[int]]]
 
     # ── Anime with numeric season: "Show Name 2 - 01" ────────────────
     # A small number (1-9) right before " - Episode" is likely a season.
-    anime_num_season = re.search(
-        r'^(.+?)\s+(\d)\s*-\s*(\d{2,4})(?:\s|[.\-_\(\[]|$)',
-        stripped,
-    )
+    anime_num_season = _ANIME_NUM_SEASON.search(stripped)
     if anime_num_season:
         show_name = anime_num_season.group(1).strip()
         season = int(anime_num_season.group(2))
@@ -194,10 +284,7 @@ def parse_tv_episode(name: str) -> Optional[Tuple[str, int, int, Optional[int]]]
             return (show_name, season, episode, None)
 
     # ── Anime absolute numbering: "Show Name - 015 (quality)" ────────
-    anime_abs = re.search(
-        r'^(.+?)\s*-\s*(\d{2,4})(?:\s|[.\-_\(\[]|$)',
-        stripped,
-    )
+    anime_abs = _ANIME_ABSOLUTE.search(stripped)
     if anime_abs:
         show_name = anime_abs.group(1).strip()
         episode = int(anime_abs.group(2))
@@ -207,10 +294,7 @@ def parse_tv_episode(name: str) -> Optional[Tuple[str, int, int, Optional[int]]]
 
     # ── Anime no-dash: "[Group] Show Name 01 [quality]" ──────────────
     # or "Show.Name.53.v2.1080p"
-    anime_nodash = re.search(
-        r'^(.+?)[.\s]+(\d{2,4})(?:\s*(?:v\d)?[.\s\[\(]|$)',
-        stripped,
-    )
+    anime_nodash = _ANIME_NO_DASH.search(stripped)
     if anime_nodash:
         show_name = anime_nodash.group(1).strip()
         episode = int(anime_nodash.group(2))
@@ -225,9 +309,8 @@ def parse_tv_episode(name: str) -> Optional[Tuple[str, int, int, Optional[int]]]
 
 def _clean_show_name(name: str) -> str:
     """Normalize a parsed show name: dots/underscores to spaces, trim junk."""
-    name = re.sub(r'[._]', ' ', name)
-    name = re.sub(r'\s+', ' ', name).strip()
-    name = re.sub(r'[\-]+$', '', name).strip()
+    name = ' '.join(name.translate(_SEPARATORS_TO_SPACE).split())
+    name = _TRAILING_DASHES.sub('', name).strip()
     return name
 
 
@@ -239,6 +322,8 @@ def parse_tv_season(name: str) -> Optional[Tuple[str, int]]:
         "The.Legend.of.Korra.S04.1080p.BluRay" -> ("The Legend of Korra", 4)
         "Breaking Bad Season 2" -> ("Breaking Bad", 2)
     """
+    if not _has_digit(name):
+        return None
     patterns = [
         r'^(.+?)\s*[.\-_ ]+S(\d{1,2})(?!\d|E)',  # S04 (not followed by E)
         r'^(.+?)\s+Season\s*(\d+)',                 # Season 4
@@ -280,9 +365,15 @@ class PipelinePlan:
     is_bdmv: bool = False
 
 
+_PlanKey = Tuple[str, str, str, Tuple[Path, ...]]
+
+
 class PipelineWorker:
     """Derives remux/move plans for completed torrents."""
 
+    # Bound on the number of replayable build_plan() results kept per worker
+    plan_cache_size = 256
+
     def __init__(self, config: StackConfig) -> None:
         self.config = config
         # The stack config generally stores *host* paths (e.g. /mnt/pool/data),
@@ -297,6 +388,26 @@ class PipelineWorker:
             categories.radarr: self.pool_root / "movies",
             categories.sonarr: self.pool_root / "tv",
         }
+        self._plan_cache: OrderedDict[_PlanKey, PipelinePlan] = OrderedDict()
+        # Output directories already created by this worker (season packs
+        # put every episode in the same folder)
+        self._known_dirs: set[Path] = set()
+        self._selection: Optional[TrackSelection] = None
+
+    def _destination_for(self, category: str) -> Path:
+        """Library root for *category*; other categories go to pool/<category>."""
+        try:
+            return self.destinations[category]
+        except KeyError:
+            # Built once per custom category instead of on every lookup
+            destination = self.destinations[category] = self.pool_root / category
+            return destination
+
+    def _ensure_dir(self, path: Path) -> None:
+        """``mkdir -p`` *path* unless this worker already created it."""
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
 
     def _normalize_category(self, category: str) -> str:
         """Normalize category names to handle *arr service suffixes.
@@ -304,10 +415,10 @@ class PipelineWorker:
         Sonarr/Radarr may append service names to categories (e.g., 'tv-sonarr').
         This strips common suffixes to match against configured categories.
         """
-        for suffix in ["-sonarr", "-radarr"]:
-            if category.endswith(suffix):
-                return category[: -len(suffix)]
-        return category
+        if not category.endswith(_ARR_SUFFIXES):
+            return category
+        # Both suffixes start at their only "-", so one rpartition strips it
+        return category.rpartition("-")[0]
 
     def build_plans(
         self,
@@ -317,6 +428,7 @@ class PipelineWorker:
         library_path: Optional[Path] = None,
         iso_mount_dir: Optional[Path] = None,
         absolute_episode_map: Optional[dict] = None,
+        stream_infos: Optional[Dict[Path, StreamInfo]] = None,
     ) -> List[PipelinePlan]:
         """Produce remux + move plans for ALL video files in a torrent.
 
@@ -336,12 +448,13 @@ class PipelineWorker:
             iso_mount_dir: Path to a mounted ISO image.  When provided,
                 the mount point is scanned for BDMV structure instead
                 of using the torrent's file list.
+            stream_infos: Pre-probed stream info keyed by source path (see
+                ``remux.probe_streams_many()``).  Sources missing from the
+                mapping are probed by ``build_ffmpeg_command()``.
         """
         selection = self._policy_for_category(torrent.category)
         normalized_category = self._normalize_category(torrent.category)
-        base_dir = self.destinations.get(
-            normalized_category, self.pool_root / normalized_category
-        )
+        base_dir = self._destination_for(normalized_category)
         categories = self.config.download_policy.categories
         # --- ISO: treat mounted ISO as BDMV ---
         if iso_mount_dir:
@@ -426,7 +539,7 @@ class PipelineWorker:
                 )
                 continue
 
-            final_output.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(final_output.parent)
 
             # ── Multi-episode overlap detection ────────────────────────
             # When a season pack has both combined (S01E01-E02.mkv) AND
@@ -480,11 +593,12 @@ class PipelineWorker:
 
             # Stage as a temp file next to the final output (same filesystem)
             # so the final move is an atomic rename, not a cross-device copy.
-            staging_output = final_output.parent / f".tmp_{final_output.name}"
+            staging_output = _staging_path(final_output)
 
             command = build_ffmpeg_command(
                 source, staging_output, selection,
                 original_language=original_language,
+                stream_info=stream_infos.get(source) if stream_infos else None,
             )
             plans.append(PipelinePlan(
                 torrent=torrent,
@@ -609,9 +723,9 @@ class PipelineWorker:
             library_path=library_path,
             absolute_episode_map=None,  # BDMVs are typically movies, no abs mapping
         )
-        final_output.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(final_output.parent)
         # Stage as a temp file next to the final output (same filesystem)
-        staging_output = final_output.parent / f".tmp_{final_output.name}"
+        staging_output = _staging_path(final_output)
 
         if feature.is_playlist and len(feature.clips) > 1:
             # Multi-clip: create a concat file list and use concat demuxer
@@ -662,7 +776,7 @@ class PipelineWorker:
         stream selection logic as build_ffmpeg_command.
         """
         args: List[str] = [
-            "ffmpeg",
+            FFMPEG,
             "-hide_banner",
             "-y",
         ]
@@ -732,10 +846,23 @@ class PipelineWorker:
 
     # Keep backward compat — returns plan for the largest file only
     def build_plan(self, torrent: TorrentInfo) -> PipelinePlan:
-        """Produce a remux + move plan for the primary video file."""
+        """Produce a remux + move plan for the primary video file.
+
+        Results are cached per torrent payload, so a re-notified or retried
+        torrent gets the same plan back without re-parsing and re-probing.
+        """
+        key = (torrent.hash, torrent.name, torrent.category, tuple(map(Path, torrent.files)))
+        plan = self._plan_cache.get(key)
+        if plan is not None:
+            self._plan_cache.move_to_end(key)
+            return plan
         plans = self.build_plans(torrent)
         # Return the plan for the largest source file
-        return max(plans, key=lambda p: p.source.stat().st_size if p.source.exists() else 0)
+        plan = max(plans, key=lambda p: _file_size(p.source))
+        self._plan_cache[key] = plan
+        if len(self._plan_cache) > self.plan_cache_size:
+            self._plan_cache.popitem(last=False)
+        return plan
 
     def _compute_final_path(
         self,
@@ -775,7 +902,7 @@ class PipelineWorker:
             else:
                 folder_name = _sanitize_filename(title)
                 file_name = f"{folder_name}.mkv"
-            return base_dir / folder_name / file_name
+            return _join_path(base_dir, folder_name, file_name)
 
         elif normalized_category == categories.sonarr:
             # TV: try parsing episode info from the FILE name first
@@ -824,13 +951,12 @@ class PipelineWorker:
                                                         if ".S" in torrent.name
                                                         else torrent.name)
                 show_name = library_path.name if library_path else _sanitize_filename(parsed_name)
-                show_dir = library_path if library_path else base_dir / show_name
-                season_dir = show_dir / f"Season {season}"
+                show_dir = library_path if library_path else _join_path(base_dir, show_name)
                 if end_episode and end_episode > episode:
                     file_name = f"{show_name} - S{season:02d}E{episode:02d}-E{end_episode:02d}.mkv"
                 else:
                     file_name = f"{show_name} - S{season:02d}E{episode:02d}.mkv"
-                return season_dir / file_name
+                return _join_path(show_dir, f"Season {season}", file_name)
 
             # Couldn't parse episode — try season-level info for directory,
             # keep original filename
@@ -838,9 +964,8 @@ class PipelineWorker:
             if season_info:
                 parsed_show_name, season = season_info
                 show_name = library_path.name if library_path else _sanitize_filename(parsed_show_name)
-                show_dir = library_path if library_path else base_dir / show_name
-                season_dir = show_dir / f"Season {season}"
-                return season_dir / f"{source.stem}.mkv"
+                show_dir = library_path if library_path else _join_path(base_dir, show_name)
+                return _join_path(show_dir, f"Season {season}", f"{source.stem}.mkv")
 
             # Total fallback — use API show name if available
             if library_path:
@@ -853,22 +978,24 @@ class PipelineWorker:
     def _policy_for_category(self, _category: str) -> TrackSelection:
         # Use the same media policy for all categories
         # Original language detection ensures foreign content keeps native audio
-        policy = self.config.media_policy.movies
-        return TrackSelection(
-            audio=list(policy.keep_audio),
-            subtitles=list(policy.keep_subs),
-        )
+        # The config is fixed for the worker's lifetime, so build it once;
+        # tuples keep the shared selection immutable.
+        if self._selection is None:
+            policy = self.config.media_policy.movies
+            self._selection = TrackSelection(
+                audio=tuple(policy.keep_audio),
+                subtitles=tuple(policy.keep_subs),
+            )
+        return self._selection
 
     def _select_video_files(self, files: Iterable[Path]) -> List[Path]:
         """Return all video files from the torrent, sorted largest first."""
+        # Filter on the raw strings; only the matches become Path objects
         candidates = [
-            Path(f) for f in files if Path(f).suffix.lower() in VIDEO_EXTENSIONS
+            Path(name) for name in map(os.fspath, files) if _is_video_name(name)
         ]
         # Sort largest first so the caller can prioritize if needed
-        candidates.sort(
-            key=lambda p: p.stat().st_size if p.exists() else 0,
-            reverse=True,
-        )
+        candidates.sort(key=_file_size, reverse=True)
         return candidates
 
     # Keep backward compat
@@ -879,8 +1006,5 @@ class PipelineWorker:
         return candidates[0]
 
     def _resolve_pool_root(self, config: StackConfig) -> Path:
-        for candidate in (Path("/data"), Path(config.paths.pool)):
-            if candidate.exists():
-                return candidate
-        return Path(config.paths.pool)
+        return resolve_pool_root(config.paths.pool)
 
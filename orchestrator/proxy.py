@@ -36,7 +36,9 @@ def ensure_traefik_assets(
 
     changed = False
 
-    if _ensure_self_signed_cert(cert_path, key_path, metadata_path, hostnames):
+    if _ensure_self_signed_cert(
+        cert_path, key_path, metadata_path, hostnames, config.proxy.key_algorithm
+    ):
         changed = True
 
     if _ensure_tls_config(tls_config_path, cert_path, key_path):
@@ -59,31 +61,45 @@ def _collect_proxy_hostnames(config: StackConfig) -> List[str]:
         services.pipeline.proxy_url,
     )
     hostnames = {
-        value.strip()
+        hostname
         for value in candidates
-        if isinstance(value, str) and value.strip()
+        if isinstance(value, str) and (hostname := value.strip())
     }
     return sorted(hostnames)
 
 
+# openssl req -newkey arguments per TraefikConfig.key_algorithm
+_NEWKEY_ARGS = {
+    "ec": ("ec", "-pkeyopt", "ec_paramgen_curve:P-256"),
+    "rsa": ("rsa:4096",),
+}
+
+
 def _ensure_self_signed_cert(
     cert_path: Path,
     key_path: Path,
     metadata_path: Path,
     hostnames: List[str],
+    key_algorithm: str = "ec",
 ) -> bool:
-    metadata = {"hostnames": hostnames}
-    if (
-        cert_path.exists()
-        and key_path.exists()
-        and metadata_path.exists()
-    ):
-        try:
-            current = json.loads(metadata_path.read_text())
-        except json.JSONDecodeError:
-            current = {}
-        if current.get("hostnames") == hostnames:
+    metadata = {"hostnames": hostnames, "key_algorithm": key_algorithm}
+    metadata_text = json.dumps(metadata, indent=2)
+    if cert_path.exists() and key_path.exists():
+        # Steady state: the file is byte-identical to what we last wrote
+        if _file_matches(metadata_path, metadata_text):
             return False
+        if metadata_path.exists():
+            try:
+                current = json.loads(metadata_path.read_text())
+            except json.JSONDecodeError:
+                current = {}
+            # Metadata written before key_algorithm existed matches any
+            # algorithm so upgrading does not replace a trusted certificate.
+            if (
+                current.get("hostnames") == hostnames
+                and current.get("key_algorithm", key_algorithm) == key_algorithm
+            ):
+                return False
 
     openssl = shutil.which("openssl")
     if not openssl:
@@ -97,7 +113,7 @@ def _ensure_self_signed_cert(
         "req",
         "-x509",
         "-newkey",
-        "rsa:4096",
+        *_NEWKEY_ARGS[key_algorithm],
         "-sha256",
         "-days",
         "825",
@@ -122,7 +138,7 @@ def _ensure_self_signed_cert(
         stderr = result.stderr.strip()
         raise RuntimeError(f"openssl failed ({stderr or 'unknown error'})")
 
-    metadata_path.write_text(json.dumps(metadata, indent=2))
+    metadata_path.write_text(metadata_text)
     return True
 
 
@@ -138,8 +154,18 @@ def _ensure_tls_config(tls_path: Path, cert_path: Path, key_path: Path) -> bool:
         "        certFile: /config/certs/local.crt\n"
         "        keyFile: /config/certs/local.key\n"
     )
-    if tls_path.exists() and tls_path.read_text() == config_text:
+    if _file_matches(tls_path, config_text):
         return False
     tls_path.write_text(config_text)
     return True
 
+
+def _file_matches(path: Path, expected: str) -> bool:
+    """Return True if *path* holds exactly *expected* (size checked before reading)."""
+    data = expected.encode("utf-8")
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
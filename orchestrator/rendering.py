@@ -1,14 +1,17 @@
 """Rendering helpers for docker compose and environment files."""
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from .models import RenderResult, StackConfig
 
@@ -63,6 +66,54 @@ def parse_wireguard_config(raw: str) -> Dict[str, str]:
     return result
 
 
+def _walk_templates(root: str) -> List[Path]:
+    """Return every ``*.j2`` file below *root* (``rglob`` without the per-entry Paths).
+
+    Symlinked directories are not descended into, matching ``Path.rglob``.
+    """
+    found: List[Path] = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".j2"):
+                    found.append(Path(entry.path))
+    return found
+
+
+@lru_cache(maxsize=16)
+def _environment_for(template_dir: str) -> Environment:
+    """Return the Jinja environment shared by renderers of *template_dir*.
+
+    Compiled templates are kept in a bytecode cache under the temp dir so
+    they survive restarts, and mtime checks are skipped (``auto_reload``)
+    because templates only change with the image.  Edited templates are
+    therefore only picked up after restarting the orchestrator.
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
+
+
+def _write_file(path: Path, content: str, mode: int = 0o666) -> None:
+    """Write *content* to *path* as UTF-8 through a raw file descriptor.
+
+    *mode* only applies when the file is created (subject to the umask);
+    existing files keep their permissions, as with ``Path.write_text``.
+    """
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
 @dataclass
 class SecretTemplate:
     """Represents a single secret file template."""
@@ -83,7 +134,12 @@ class ComposeRenderer:
 
     def __init__(self, template_dir: Path) -> None:
         self.template_dir = template_dir
-        self.env = Environment(loader=FileSystemLoader(str(template_dir)))
+        self.env = _environment_for(str(template_dir))
+        # Templates ship with the image, so discovery runs once per renderer
+        self._bundle: Optional[TemplateBundle] = None
+        # (config, dumped config, config hash) for the last config rendered;
+        # a converge run renders the same config object more than once.
+        self._dumped: Optional[Tuple[StackConfig, dict, str]] = None
 
     @staticmethod
     def _get_config_host_path() -> Optional[str]:
@@ -124,6 +180,11 @@ class ComposeRenderer:
             return None
 
     def load_templates(self) -> TemplateBundle:
+        if self._bundle is None:
+            self._bundle = self._discover_bundle()
+        return self._bundle
+
+    def _discover_bundle(self) -> TemplateBundle:
         compose_template = self.env.get_template("docker-compose.yml.j2")
         env_template = self.env.get_template("env.j2")
 
@@ -131,7 +192,7 @@ class ComposeRenderer:
         secret_templates: List[SecretTemplate] = []
 
         if secrets_dir.exists():
-            for template_path in sorted(secrets_dir.rglob("*.j2")):
+            for template_path in sorted(_walk_templates(str(secrets_dir))):
                 relative_template = template_path.relative_to(self.template_dir).as_posix()
                 template = self.env.get_template(relative_template)
                 output_rel_path = template_path.relative_to(secrets_dir).with_suffix("")
@@ -152,15 +213,26 @@ class ComposeRenderer:
     ) -> dict:
         config_host_path = self._get_config_host_path()
         wg_parsed = parse_wireguard_config(config.services.gluetun.wireguard_config)
+        dumped, config_hash = self._dump_config(config)
         return {
-            "config": config.model_dump(mode="json"),
+            "config": dumped,
             "config_obj": config,
-            "config_hash": config.model_dump_json(),
+            "config_hash": config_hash,
             "secrets": secrets or {},
             "config_host_path": config_host_path,
             "wg": wg_parsed,
         }
 
+    def _dump_config(self, config: StackConfig) -> Tuple[dict, str]:
+        """Return the JSON-mode dump of *config* and a short digest of it."""
+        if self._dumped is not None and self._dumped[0] is config:
+            return self._dumped[1], self._dumped[2]
+        dumped = config.model_dump(mode="json")
+        canonical = json.dumps(dumped, sort_keys=True, separators=(",", ":"))
+        config_hash = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+        self._dumped = (config, dumped, config_hash)
+        return dumped, config_hash
+
     def _write_secrets(
         self,
         templates: TemplateBundle,
@@ -173,11 +245,16 @@ class ComposeRenderer:
         if templates.secrets:
             secrets_dir_path = output_dir / ".secrets"
             secrets_dir_path.mkdir(parents=True, exist_ok=True)
-            for secret in templates.secrets:
-                target_path = secrets_dir_path / secret.relative_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                rendered_secret = secret.template.render(**context)
-                target_path.write_text(rendered_secret)
+            # Render everything first, then create each directory once and
+            # write the files back to back.
+            rendered = [
+                (secrets_dir_path / secret.relative_path, secret.template.render(**context))
+                for secret in templates.secrets
+            ]
+            for parent in {target_path.parent for target_path, _ in rendered}:
+                parent.mkdir(parents=True, exist_ok=True)
+            for secret, (target_path, rendered_secret) in zip(templates.secrets, rendered):
+                _write_file(target_path, rendered_secret, 0o600)
                 secret_paths[secret.relative_path.as_posix()] = target_path
 
         return secrets_dir_path, secret_paths
@@ -195,8 +272,8 @@ class ComposeRenderer:
         env_content = templates.env.render(**context)
         compose_path = output_dir / "docker-compose.yml"
         env_path = output_dir / ".env"
-        compose_path.write_text(compose_content)
-        env_path.write_text(env_content)
+        _write_file(compose_path, compose_content)
+        _write_file(env_path, env_content)
         secrets_dir_path, secret_paths = self._write_secrets(templates, context, output_dir)
 
         return RenderResult(
@@ -5,11 +5,15 @@ import logging
 import os
 import socket
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 log = logging.getLogger(__name__)
 
+# States plain `docker ps` (without -a) lists; anything else is stopped
+_ACTIVE_STATES = frozenset({"running", "paused", "restarting"})
+
 
 class DockerComposeRunner:
     """Wrapper around docker compose for bringing the stack up or down."""
@@ -135,6 +139,74 @@ class DockerComposeRunner:
             detail = "ok" if success else "failed"
         return success, detail
 
+    @staticmethod
+    def _container_states() -> Dict[str, str]:
+        """Map every container name, running or stopped, to its state.
+
+        Empty on error.
+        """
+        result = subprocess.run(
+            ["docker", "ps", "-a", "--format", "{{.Names}}\t{{.State}}"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return {}
+        states: Dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            name, _, state = line.partition("\t")
+            if name:
+                states[name] = state.strip()
+        return states
+
+    @staticmethod
+    def _wait_and_remove(container: str) -> bool:
+        """Block until *container* has exited, then remove it.
+
+        Returns True once the container is gone.  Removing it frees the name
+        for the new compose project; without this, `docker compose up` fails
+        with "container name already in use".
+        """
+        try:
+            subprocess.run(
+                ["docker", "wait", container],
+                capture_output=True,
+                text=True,
+                timeout=15,
+            )
+        except subprocess.TimeoutExpired:
+            return False
+        result = subprocess.run(
+            ["docker", "rm", container],
+            capture_output=True,
+            text=True,
+        )
+        return result.returncode == 0
+
+    @staticmethod
+    def _stop_and_remove(container: str) -> Tuple[Optional[str], bool]:
+        """Stop (or kill) *container* and remove it.
+
+        Returns ``(error, removed)``: the stop error (None on success) and
+        whether the container is confirmed gone.
+        """
+        # Stop with a 10 second timeout
+        result = subprocess.run(
+            ["docker", "stop", "--time", "10", container],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            # If stop fails, try kill + rm as a last resort
+            kill_result = subprocess.run(
+                ["docker", "kill", container],
+                capture_output=True,
+                text=True,
+            )
+            if kill_result.returncode != 0:
+                return result.stderr.strip() or "unknown error", False
+        return None, DockerComposeRunner._wait_and_remove(container)
+
     @staticmethod
     def stop_conflicting_dev_services(
         enabled_services: List[str], project_root: Path | None = None
@@ -167,32 +239,27 @@ class DockerComposeRunner:
             "pipeline": "pipeline-worker",  # Old pipeline-worker container
         }
         
+        candidates = [
+            (service, service_to_dev_container[service])
+            for service in enabled_services
+            if service in service_to_dev_container
+        ]
+        if not candidates:
+            return True, "no conflicting dev services running", []
+
         # Find which dev containers exist (running or stopped).
         # A stopped container still blocks the name from being reused.
+        # A single `docker ps -a` covers every service and both states.
+        states = DockerComposeRunner._container_states()
         running_containers: List[tuple[str, str]] = []  # (service_name, container_name)
         stopped_only: List[tuple[str, str]] = []  # exist but not running
-        for service in enabled_services:
-            dev_container = service_to_dev_container.get(service)
-            if not dev_container:
+        for service, dev_container in candidates:
+            state = states.get(dev_container)
+            if state is None:
                 continue
-
-            # Check if the dev container is running
-            result = subprocess.run(
-                ["docker", "ps", "--format", "{{.Names}}", "--filter", f"name=^{dev_container}$"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0 and result.stdout.strip():
+            if state in _ACTIVE_STATES:
                 running_containers.append((service, dev_container))
-                continue
-
-            # Check if it exists but is stopped (still blocks the name)
-            result = subprocess.run(
-                ["docker", "ps", "-a", "--format", "{{.Names}}", "--filter", f"name=^{dev_container}$"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0 and result.stdout.strip():
+            else:
                 stopped_only.append((service, dev_container))
 
         # Remove any stopped containers that would block the name
@@ -214,6 +281,7 @@ class DockerComposeRunner:
         # Try to use docker compose stop if we can find the compose file (local dev)
         # Otherwise, stop containers directly (containerized orchestrator)
         stopped_services: List[str] = []
+        still_running: List[str] = []  # stopped but not confirmed gone
         
         if project_root is not None:
             dev_compose_path = project_root / "docker-compose.dev.yml"
@@ -238,71 +306,36 @@ class DockerComposeRunner:
                 if process.returncode == 0:
                     stopped_services = service_names
                     # Also remove stopped containers so names are freed
-                    for _, container in running_containers:
-                        subprocess.run(
-                            ["docker", "rm", container],
-                            capture_output=True,
-                            text=True,
-                        )
+                    containers = [container for _, container in running_containers]
+                    with ThreadPoolExecutor(max_workers=min(8, len(containers))) as pool:
+                        removals = list(pool.map(DockerComposeRunner._wait_and_remove, containers))
+                    still_running = [
+                        service
+                        for (service, _), ok in zip(running_containers, removals)
+                        if not ok
+                    ]
                 # If compose stop fails, fall through to direct container stop
         
         # Stop containers directly by name (works in both local and containerized scenarios)
         # Use docker stop with a timeout to ensure containers stop even if they're hanging
         if not stopped_services:
-            for service, container in running_containers:
-                # Stop with a 10 second timeout
-                result = subprocess.run(
-                    ["docker", "stop", "--time", "10", container],
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    # Remove the container so the name is freed for the new
-                    # compose project.  Without this, `docker compose up` fails
-                    # with "container name already in use".
-                    subprocess.run(
-                        ["docker", "rm", container],
-                        capture_output=True,
-                        text=True,
-                    )
+            # Each stop blocks on the daemon independently, so run them
+            # concurrently: K hung containers cost one timeout, not K.
+            containers = [container for _, container in running_containers]
+            with ThreadPoolExecutor(max_workers=min(8, len(containers))) as pool:
+                outcomes = list(pool.map(DockerComposeRunner._stop_and_remove, containers))
+            for (service, container), (error, removed) in zip(running_containers, outcomes):
+                if error is None:
                     stopped_services.append(service)
+                    if not removed:
+                        still_running.append(service)
                 else:
-                    # If stop fails, try kill + rm as a last resort
-                    kill_result = subprocess.run(
-                        ["docker", "kill", container],
-                        capture_output=True,
-                        text=True,
-                    )
-                    if kill_result.returncode == 0:
-                        subprocess.run(
-                            ["docker", "rm", container],
-                            capture_output=True,
-                            text=True,
-                        )
-                        stopped_services.append(service)
-                    else:
-                        # Log but continue with other containers
-                        error = result.stderr.strip() or "unknown error"
-                        print(f"Warning: failed to stop {container}: {error}")
+                    # Log but continue with other containers
+                    print(f"Warning: failed to stop {container}: {error}")
         
-        # Verify containers are actually stopped (wait a moment for ports to be released)
+        # `docker wait` + `docker rm` above already confirmed which containers
+        # are gone, so there is no need to pause and poll `docker ps`.
         if stopped_services:
-            import time
-            time.sleep(1)  # Brief pause to ensure ports are released
-            
-            # Double-check that containers are stopped
-            still_running: List[str] = []
-            for service, container in running_containers:
-                if service in stopped_services:
-                    # Verify it's actually stopped
-                    result = subprocess.run(
-                        ["docker", "ps", "--format", "{{.Names}}", "--filter", f"name=^{container}$"],
-                        capture_output=True,
-                        text=True,
-                    )
-                    if result.returncode == 0 and result.stdout.strip():
-                        still_running.append(service)
-            
             if still_running:
                 detail = f"stopped {len(stopped_services)} dev service(s): {', '.join(stopped_services)} (warning: {', '.join(still_running)} may still be running)"
             else:
@@ -25,7 +25,15 @@ from typing import Any, Callable, Optional
 
 import yaml
 
-from .models import RunRecord, StageEvent, StackConfig, UserRole
+from .models import RunRecord, StageEvent, StackConfig, UserRole, validate_as
+
+try:  # orjson serialises straight to bytes, several times faster than json
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+_json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+_JSON_DECODER = json.JSONDecoder()
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +43,30 @@ MAX_RUN_HISTORY = 20
 # State section names → filenames
 _STATE_SECTIONS = ("auth", "secrets", "services", "runs", "pipeline")
 
+# Identifies one on-disk version of a section file: (st_ino, st_mtime_ns,
+# st_size).  Every save goes through os.replace, so each write gets a new inode.
+_Stamp = tuple[int, int, int]
+
+# High-churn sections rewritten on every run event / pipeline tick; these are
+# stored compact rather than pretty-printed.
+_HIGH_CHURN_SECTIONS = frozenset({"runs", "pipeline"})
+
+# Sections written without fsync.  Run history is diagnostic only, so a crash
+# costing the last few stage events is not worth a disk flush per event.
+# pipeline is excluded: its processed/swept records and orphan aliases are
+# not regenerated, and losing them would reprocess finished downloads.
+_UNSYNCED_SECTIONS = frozenset({"runs"})
+
+
+def _dump_section(section: str, data: Any) -> bytes:
+    """Serialise a state section to UTF-8 JSON bytes."""
+    compact = section in _HIGH_CHURN_SECTIONS
+    if orjson is not None:
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(data, separators=(",", ":")).encode()
+    return json.dumps(data, indent=2).encode()
+
 
 class ConfigRepository:
     """File-backed persistence for stack configuration and runtime state.
@@ -62,7 +94,17 @@ class ConfigRepository:
             section: root / f"{section}.json" for section in _STATE_SECTIONS
         }
 
-        self._migrated = False
+        # Without a legacy state.json there is nothing to migrate, so the
+        # per-access check in _ensure_migrated() collapses to a flag test.
+        self._migrated = not self._legacy_state_path.exists()
+
+        # Raw bytes of each section file as last read or written, keyed by
+        # its stat stamp so writes from other processes invalidate it.
+        self._section_cache: dict[str, tuple[_Stamp, bytes]] = {}
+        # Validated RunRecords (oldest first) for the cached runs section
+        self._run_records: tuple[_Stamp, list[RunRecord]] | None = None
+        # has_users() answer for the cached auth section
+        self._has_users: tuple[_Stamp, bool] | None = None
 
         if not read_only:
             try:
@@ -89,8 +131,9 @@ class ConfigRepository:
     def _ensure_migrated(self) -> None:
         """Migrate legacy state.json to section files if needed.
 
-        Only runs once per process. If section files already exist,
-        this is a no-op. If state.json exists but sections don't,
+        Only runs once per instance, and is skipped entirely when no
+        state.json existed at construction time. If section files already
+        exist, this is a no-op. If state.json exists but sections don't,
         it splits the monolithic file into per-section files.
         """
         if self._migrated:
@@ -107,11 +150,11 @@ class ConfigRepository:
             return
 
         # Read and migrate
+        content = self._legacy_state_path.read_text()
         try:
-            legacy_data = json.loads(self._legacy_state_path.read_text())
+            legacy_data = json.loads(content)
         except json.JSONDecodeError as e:
             logger.warning(f"Corrupted legacy state.json during migration: {e}")
-            content = self._legacy_state_path.read_text()
             legacy_data = self._try_recover_json(content)
             if legacy_data is None:
                 logger.error("Cannot recover legacy state.json — starting fresh")
@@ -139,7 +182,7 @@ class ConfigRepository:
         if not self.stack_path.exists():
             raise FileNotFoundError(f"Missing stack configuration at {self.stack_path}")
         data = yaml.safe_load(self.stack_path.read_text())
-        return StackConfig.model_validate(data)
+        return validate_as(StackConfig, data)
 
     def save_stack(self, config: StackConfig) -> None:
         payload = config.model_dump(mode="json")
@@ -184,17 +227,35 @@ class ConfigRepository:
 
     # ------------------------------------------------------------------ Section-level I/O
 
+    def _section_stamp(self, section: str) -> _Stamp | None:
+        """Return the stat stamp of a section file, or None if it doesn't exist."""
+        try:
+            st = os.stat(self._section_paths[section])
+        except FileNotFoundError:
+            self._section_cache.pop(section, None)
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
     def _load_section(self, section: str) -> Any | None:
-        """Load a single section file, returning None if it doesn't exist."""
+        """Load a single section file, returning None if it doesn't exist.
+
+        The file is only re-read when its stat stamp changes; otherwise the
+        cached bytes are decoded again, so every caller still gets its own
+        mutable copy of the data.
+        """
         path = self._section_paths[section]
-        if not path.exists():
+        stamp = self._section_stamp(section)
+        if stamp is None:
             return None
+        cached = self._section_cache.get(section)
+        if cached is not None and cached[0] == stamp:
+            return _json_loads(cached[1])
+        content = path.read_bytes()
         try:
-            return json.loads(path.read_text())
+            data = _json_loads(content)
         except json.JSONDecodeError as e:
             logger.warning(f"Corrupted {path.name}: {e}. Attempting recovery...")
-            content = path.read_text()
-            recovered = self._try_recover_json(content)
+            recovered = self._try_recover_json(content.decode("utf-8", errors="replace"))
             if recovered is not None:
                 backup = path.with_suffix(".json.corrupted")
                 path.rename(backup)
@@ -203,11 +264,17 @@ class ConfigRepository:
                 return recovered
             logger.warning(f"Could not recover {path.name}. Starting with empty section.")
             return None
+        self._section_cache[section] = (stamp, content)
+        return data
 
     def _save_section(self, section: str, data: Any) -> None:
         """Write a single section file atomically."""
         path = self._section_paths[section]
-        self._atomic_write(path, json.dumps(data, indent=2))
+        content = _dump_section(section, data)
+        self._atomic_write(path, content, fsync=section not in _UNSYNCED_SECTIONS)
+        stamp = self._section_stamp(section)
+        if stamp is not None:
+            self._section_cache[section] = (stamp, content)
 
     # ------------------------------------------------------------------ Section accessors
     # Direct access to individual sections — more efficient than load_state()
@@ -332,24 +399,44 @@ class ConfigRepository:
             self._save_section(section="pipeline", data=data)
 
     def has_users(self) -> bool:
-        """Check if any users exist in auth state."""
-        auth = self.get_auth_state()
-        return len(auth.get("users", [])) > 0
+        """Check if any users exist in auth state.
+
+        The answer is memoized against auth.json's stat stamp, so repeated
+        checks cost a single stat until the file changes.
+        """
+        self._ensure_migrated()
+        stamp = self._section_stamp("auth")
+        if stamp is None:
+            return False
+        if self._has_users is not None and self._has_users[0] == stamp:
+            return self._has_users[1]
+        auth = self._load_section("auth") or {}
+        result = len(auth.get("users", [])) > 0
+        cached = self._section_cache.get("auth")
+        self._has_users = (cached[0], result) if cached is not None else None
+        return result
 
     # ------------------------------------------------------------------ Atomic I/O
 
-    def _atomic_write(self, path: Path, content: str) -> None:
-        """Write content to path atomically using tmp + rename."""
+    def _atomic_write(self, path: Path, content: bytes | str, fsync: bool = True) -> None:
+        """Write content to path atomically using tmp + rename.
+
+        With fsync=False the rename is still atomic, but a crash may lose the
+        most recent write.
+        """
+        if isinstance(content, str):
+            content = content.encode()
         fd, tmp_path = tempfile.mkstemp(
             dir=path.parent,
             prefix=f".{path.stem}_",
             suffix=".tmp",
         )
         try:
-            with os.fdopen(fd, "w") as f:
+            with os.fdopen(fd, "wb") as f:
                 f.write(content)
-                f.flush()
-                os.fsync(f.fileno())
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
             os.replace(tmp_path, path)
         except Exception:
             try:
@@ -358,30 +445,18 @@ class ConfigRepository:
                 pass
             raise
 
-    def _try_recover_json(self, content: str) -> dict[str, Any] | None:
+    def _try_recover_json(self, content: str) -> Any | None:
         """Try to extract valid JSON from potentially corrupted content.
 
-        Works by finding the last '}' and iteratively truncating backwards
-        until json.loads succeeds. This handles cases where corruption
-        appended garbage after a valid JSON object.
+        Decodes the longest valid JSON document at the start of the content
+        with JSONDecoder.raw_decode, which handles cases where corruption
+        appended garbage after a valid object or list.
         """
-        # First, try the full content
         try:
-            return json.loads(content)
+            data, _ = _JSON_DECODER.raw_decode(content.lstrip())
         except json.JSONDecodeError:
-            pass
-
-        # Find each '}' from the end and try truncating there
-        pos = len(content)
-        while pos > 0:
-            pos = content.rfind("}", 0, pos)
-            if pos < 0:
-                break
-            try:
-                return json.loads(content[: pos + 1])
-            except json.JSONDecodeError:
-                pass
-        return None
+            return None
+        return data
 
     # ------------------------------------------------------------------ Filesystem helpers
 
@@ -397,15 +472,17 @@ class ConfigRepository:
         created: list[str] = []
         uid = config.runtime.user_id
         gid = config.runtime.group_id
+        current_uid = os.getuid()
 
         def _ensure(path: Path) -> None:
             """Create a directory and verify it's writable."""
             if path.exists():
+                # Mode bits can't see read-only mounts or ACLs; ask access()
                 if not os.access(path, os.W_OK | os.X_OK):
                     # Try to fix permissions
                     try:
                         os.chmod(str(path), 0o775)
-                        if os.getuid() == 0:
+                        if current_uid == 0:
                             os.chown(str(path), uid, gid)
                     except OSError:
                         pass  # Will be caught by the re-check below
@@ -416,7 +493,7 @@ class ConfigRepository:
                 try:
                     path.mkdir(parents=True, exist_ok=True)
                     path.chmod(0o775)
-                    if os.getuid() == 0:
+                    if current_uid == 0:
                         os.chown(str(path), uid, gid)
                     created.append(str(path))
                 except PermissionError:
@@ -463,6 +540,11 @@ class ConfigRepository:
         for base in base_dirs:
             _ensure(base)
 
+        # Everything else is collected first and created in one pass, so
+        # paths reached more than once (scratch_root is also download_root)
+        # are only checked once.
+        targets: list[Path] = []
+
         # Per-service appdata
         service_dirs = {
             "gluetun": appdata / "gluetun",
@@ -481,39 +563,41 @@ class ConfigRepository:
                 continue
             target = service_dirs.get(name)
             if target:
-                _ensure(target)
+                targets.append(target)
 
         # Traefik
         if config.proxy.enabled:
             traefik_dir = appdata / "traefik"
-            _ensure(traefik_dir)
-            _ensure(traefik_dir / "certs")
+            targets.append(traefik_dir)
+            targets.append(traefik_dir / "certs")
 
         # Download & processing directories
         # When scratch is configured (e.g. /mnt/scratch), Docker maps it
         # directly to /downloads in the container, so complete/incomplete
         # live at /mnt/scratch/complete, not /mnt/scratch/downloads/complete.
         download_root = scratch_root
-        for directory in (
+        targets.extend((
             scratch_root,
             download_root,
             download_root / "complete",
             download_root / "incomplete",
             scratch_root / "postproc",
             scratch_root / "transcode",
-        ):
-            _ensure(directory)
+        ))
 
         # Category sub-dirs
         categories = config.download_policy.categories
         complete = download_root / "complete"
         for suffix in (categories.radarr, categories.sonarr, "enrichment"):
-            _ensure(complete / suffix)
+            targets.append(complete / suffix)
 
         # Media library
         media_root = pool / "media"
         for section in ("movies", "tv"):
-            _ensure(media_root / section)
+            targets.append(media_root / section)
+
+        for directory in dict.fromkeys(targets):
+            _ensure(directory)
 
         return created
 
@@ -552,7 +636,7 @@ class ConfigRepository:
         runs = state.get("runs", [])
         if len(runs) > MAX_RUN_HISTORY:
             # Keep only the last MAX_RUN_HISTORY entries
-            state["runs"] = runs[-MAX_RUN_HISTORY:]
+            del runs[:-MAX_RUN_HISTORY]
 
     def start_run(self, run_id: str) -> None:
         state = self.load_state()
@@ -562,21 +646,23 @@ class ConfigRepository:
         self.save_state(state)
 
     def append_run_event(self, run_id: str, event: StageEvent) -> None:
-        state = self.load_state()
-        runs = state.setdefault("runs", [])
-        for record in runs:
-            if record["run_id"] == run_id:
-                record.setdefault("events", []).append(event.model_dump(mode="json"))
-                break
-        else:
-            runs.append(
-                {
-                    "run_id": run_id,
-                    "ok": None,
-                    "events": [event.model_dump(mode="json")],
-                }
-            )
-        self.save_state(state)
+        """Locked read-modify-write of the runs section only.
+
+        Called for every stage event, so it avoids the full
+        load_state()/save_state() round trip over all section files.
+        """
+        self._ensure_migrated()
+        payload = event.model_dump(mode="json")
+        with self._section_lock("runs"):
+            runs = self._load_section("runs") or []
+            # The active run is almost always the most recent one
+            for record in reversed(runs):
+                if record["run_id"] == run_id:
+                    record.setdefault("events", []).append(payload)
+                    break
+            else:
+                runs.append({"run_id": run_id, "ok": None, "events": [payload]})
+            self._save_section("runs", runs)
 
     def finalize_run(self, run_id: str, ok: bool, summary: str | None = None) -> None:
         state = self.load_state()
@@ -591,43 +677,47 @@ class ConfigRepository:
             runs.append({"run_id": run_id, "ok": ok, "events": [], "summary": summary})
         self.save_state(state)
 
-    def get_run(self, run_id: str) -> RunRecord | None:
-        state = self.load_state()
-        for record in state.get("runs", []):
-            if record.get("run_id") == run_id:
-                events = [
-                    StageEvent.model_validate(event)
+    def _load_run_records(self) -> list[RunRecord]:
+        """Return validated run records, oldest first.
+
+        Memoized against the runs section's stat stamp so repeated dashboard
+        polls skip re-validating every StageEvent while runs.json is unchanged.
+        """
+        self._ensure_migrated()
+        stamp = self._section_stamp("runs")
+        if self._run_records is not None and self._run_records[0] == stamp:
+            return self._run_records[1]
+        raw_runs = self._load_section("runs") or []
+        records = [
+            RunRecord(
+                run_id=record.get("run_id", ""),
+                ok=record.get("ok"),
+                events=[
+                    validate_as(StageEvent, event)
                     for event in record.get("events", [])
-                ]
-                return RunRecord(
-                    run_id=run_id,
-                    ok=record.get("ok"),
-                    events=events,
-                    summary=record.get("summary"),
-                )
+                ],
+                summary=record.get("summary"),
+            )
+            for record in raw_runs
+        ]
+        # Loading may have rewritten a corrupted file, so take the stamp of
+        # what was actually parsed.
+        cached = self._section_cache.get("runs")
+        self._run_records = (cached[0], records) if cached is not None else None
+        return records
+
+    def get_run(self, run_id: str) -> RunRecord | None:
+        for record in self._load_run_records():
+            if record.run_id == run_id:
+                return record
         return None
 
     def list_runs(self, limit: int = 10) -> list[RunRecord]:
         """Return the most recent runs, newest first."""
-        state = self.load_state()
-        raw_runs = state.get("runs", [])
+        records = self._load_run_records()
         # Runs are stored oldest-first; reverse for newest-first
-        recent = raw_runs[-limit:] if limit else raw_runs
-        result: list[RunRecord] = []
-        for record in reversed(recent):
-            events = [
-                StageEvent.model_validate(event)
-                for event in record.get("events", [])
-            ]
-            result.append(
-                RunRecord(
-                    run_id=record.get("run_id", ""),
-                    ok=record.get("ok"),
-                    events=events,
-                    summary=record.get("summary"),
-                )
-            )
-        return result
+        recent = records[-limit:] if limit else records
+        return recent[::-1]
 
     # ------------------------------------------------------------------ Admin bootstrap
 
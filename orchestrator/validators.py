@@ -9,7 +9,7 @@ import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from .models import StackConfig, ValidationResult
+from .models import ServiceBaseConfig, StackConfig, ValidationResult
 
 # Container names that belong to our managed stack.
 _STACK_CONTAINER_NAMES = {
@@ -378,6 +378,7 @@ def resolve_port_conflicts(config: StackConfig) -> tuple[StackConfig, list[str]]
         "flaresolverr": config.services.flaresolverr,
     }
 
+    reassigned: dict[str, ServiceBaseConfig] = {}
     for name, svc in service_map.items():
         if not svc.enabled or not svc.port:
             continue
@@ -387,19 +388,24 @@ def resolve_port_conflicts(config: StackConfig) -> tuple[StackConfig, list[str]]
         if original in claimed:
             # Internal conflict: two services trying to use the same port
             new_port = find_available_port(original + 1, exclude=claimed)
-            svc.port = new_port
+            reassigned[name] = svc.model_copy(update={"port": new_port})
             changes.append(f"{name}: {original} → {new_port} (internal conflict)")
             claimed.add(new_port)
         elif not _port_available(original) and not _port_owned_by_stack(original):
             # External conflict: some other process is using this port
             user = _identify_port_user(original)
             new_port = find_available_port(original + 1, exclude=claimed)
-            svc.port = new_port
+            reassigned[name] = svc.model_copy(update={"port": new_port})
             changes.append(f"{name}: {original} → {new_port} (was {user})")
             claimed.add(new_port)
         else:
             claimed.add(original)
 
+    if reassigned:
+        # Config models are frozen; swap in copies carrying the new ports
+        services = config.services.model_copy(update=reassigned)
+        config = config.model_copy(update={"services": services})
+
     return config, changes
 
 
@@ -1,3 +1,5 @@
+import asyncio
+import httpx
 import pytest
 import tempfile
 import os
@@ -6,10 +8,13 @@ from pathlib import Path
 from orchestrator.converge.verification_engine import VerificationEngine
 from orchestrator.converge.validators.path_validator import PathValidator
 from orchestrator.converge.validators.port_validator import PortValidator
+from orchestrator.converge.validators.service_validator import ServiceValidator
 from orchestrator.converge.verification_models import (
+    STANDARD_ERROR_CODES,
     ValidationResult,
     ValidationError,
     create_validation_error,
+    validation_clock,
 )
 
 
@@ -158,6 +163,65 @@ class TestVerificationEngine:
         ]
         assert len(partial_warnings) > 0
 
+    @pytest.mark.asyncio
+    async def test_repeat_verification_is_cached(self, temp_dirs):
+        """Test repeat calls with the same config reuse the cached result"""
+        config = {
+            "media_path": temp_dirs["media"],
+            "downloads_path": temp_dirs["downloads"],
+            "appdata_path": temp_dirs["appdata"],
+        }
+
+        engine = VerificationEngine()
+        first = await engine.verify_configuration(
+            config=config, skip_service_checks=True
+        )
+        second = await engine.verify_configuration(
+            config=config, skip_service_checks=True
+        )
+
+        assert second == first
+        assert second is not first
+        assert len(engine._cache) == 1
+
+        await engine.verify_configuration(
+            config=config, partial=True, skip_service_checks=True
+        )
+        assert len(engine._cache) == 2
+
+    def test_estimate_uses_configured_service_count(self):
+        """Test the setup estimate follows the validator's service count"""
+        engine = VerificationEngine()
+
+        fresh = ValidationResult(success=True)
+        assert engine._estimate_setup_time(fresh, {"media_path": "/m"}) == "~5 minutes"
+
+        existing = ValidationResult(success=True, configured_service_count=2)
+        assert engine._estimate_setup_time(existing, {}) == "~9 minutes"
+
+    @pytest.mark.asyncio
+    async def test_fresh_service_snapshot_is_reused(self, temp_dirs):
+        """Test a fresh background snapshot stands in for live probes"""
+        config = {"media_path": temp_dirs["media"]}
+        engine = VerificationEngine(cache_ttl=0)
+
+        calls = []
+
+        async def fake_validate_all_services():
+            calls.append(1)
+            return ValidationResult(success=True, duration_ms=0.0)
+
+        engine.service_validator.validate_all_services = fake_validate_all_services
+
+        await engine.verify_configuration(config=config)
+        await engine.verify_configuration(config=config)
+        assert len(calls) == 1
+
+        engine._service_snapshot = None
+        await engine.verify_configuration(config=config)
+        assert len(calls) == 2
+        await engine.stop()
+
 
 class TestPathValidator:
     """Test the path validator"""
@@ -248,6 +312,58 @@ class TestValidationModels:
         assert "/test/path" in error.message
         assert len(error.suggestions) > 0
 
+    def test_results_in_one_run_share_a_timestamp(self):
+        """Test results built under one validation clock carry the same time"""
+        with validation_clock():
+            first = ValidationResult(success=True)
+            second = ValidationResult(success=True)
+        assert first.timestamp == second.timestamp
+        assert first.timestamp.tzinfo is not None
+
+    def test_field_lookups_follow_appends(self):
+        """Test per-field lookups pick up errors added after the first call"""
+        result = ValidationResult(success=True)
+        assert result.get_field_errors("media_path") == []
+
+        error = create_validation_error("PATH_NOT_FOUND", "media_path")
+        result.errors.append(error)
+        assert result.get_field_errors("media_path") == [error]
+        assert result.get_field_errors("downloads_path") == []
+
+    @pytest.mark.parametrize("code", sorted(STANDARD_ERROR_CODES))
+    def test_every_standard_code_builds(self, code):
+        """Test each standard code yields its template with context filled in"""
+        context = {
+            "port": 8080,
+            "service": "Radarr",
+            "endpoint": "http://localhost:7878",
+            "dependency": "FFmpeg",
+            "field": "Port",
+            "min": 1,
+            "max": 65535,
+        }
+        error = create_validation_error(code, "some_field", context)
+        info = STANDARD_ERROR_CODES[code]
+
+        assert error.code == code
+        assert error.field == "some_field"
+        assert error.severity == info["severity"]
+        assert error.message == info["message"].format(**context)
+        assert error.suggestions == [s.format(**context) for s in info["suggestions"]]
+
+    def test_error_templates_render_context(self):
+        """Test placeholders are filled from context and missing ones left blank"""
+        error = create_validation_error(
+            "VALUE_OUT_OF_RANGE", "port", {"field": "Port", "min": 1, "max": 65535}
+        )
+        assert error.message == "Port must be between 1 and 65535"
+
+        error = create_validation_error("PORT_IN_USE", "port")
+        assert error.message == "Port  is already in use"
+
+        error = create_validation_error("NOT_A_CODE", "port")
+        assert error.message == "Unknown error: NOT_A_CODE"
+
     def test_validation_result_helper_methods(self):
         """Test ValidationResult helper methods"""
         result = ValidationResult(success=True)
@@ -349,3 +465,148 @@ class TestPortValidator:
             e for e in result.errors if "DUPLICATE_PORT_ASSIGNMENT" in e.code
         ]
         assert len(duplicate_errors) == 1
+
+
+class TestServiceValidator:
+    """Test the service validator"""
+
+    @pytest.fixture(autouse=True)
+    def reset_breakers(self):
+        """Circuit breakers are class-level; isolate each test"""
+        ServiceValidator.breakers.clear()
+        yield
+        ServiceValidator.breakers.clear()
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_services_keep_priority_order(self):
+        """Concurrent probes still report services in priority order"""
+        validator = ServiceValidator({})
+        try:
+            result = await validator.validate_all_services()
+        finally:
+            await validator.aclose()
+
+        missing = [
+            w.field for w in result.warnings if w.code == "SERVICE_NOT_CONFIGURED"
+        ]
+        assert missing == [
+            "qbittorrent",
+            "prowlarr",
+            "radarr",
+            "sonarr",
+            "jellyfin",
+            "jellyseerr",
+            "remux_agent",
+        ]
+        assert result.success is True
+
+    @pytest.mark.asyncio
+    async def test_probe_status_codes_map_to_findings(self):
+        """Auth failures are errors; unreachable web UIs are only warnings"""
+        statuses = {9696: 401, 8096: 503}
+
+        def handler(request):
+            return httpx.Response(statuses.get(request.url.port, 200))
+
+        validator = ServiceValidator(
+            {
+                "prowlarr": {"port": 9696, "api_key": "key"},
+                "jellyfin": {"port": 8096},
+            }
+        )
+        await validator.aclose()
+        validator._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            result = await validator.validate_all_services()
+        finally:
+            await validator.aclose()
+
+        assert result.success is False
+        assert [e.field for e in result.errors] == ["prowlarr.api_key"]
+        assert "jellyfin.endpoint" in [w.field for w in result.warnings]
+
+    @pytest.mark.asyncio
+    async def test_breaker_skips_endpoint_after_repeated_failures(self):
+        """An endpoint that keeps refusing connections stops being probed"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            raise httpx.ConnectError("refused", request=request)
+
+        config = {"radarr": {"port": 7878, "api_key": "key"}}
+        for _ in range(5):
+            validator = ServiceValidator(config)
+            await validator.aclose()
+            validator._client = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            try:
+                await validator.validate_service("radarr")
+            finally:
+                await validator.aclose()
+
+        # Three failed probes, each retried once, then the breaker opens
+        assert len(calls) == 6
+        breaker = ServiceValidator.breakers["http://localhost:7878/api/v3/status"]
+        assert breaker.state == breaker.OPEN
+
+    @pytest.mark.asyncio
+    async def test_head_probe_falls_back_to_get(self):
+        """Web UIs are probed with HEAD, retrying with GET when it is refused"""
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return httpx.Response(405 if request.method == "HEAD" else 200)
+
+        validator = ServiceValidator({"jellyfin": {"port": 8096}})
+        await validator.aclose()
+        validator._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            result = await validator.validate_all_services()
+        finally:
+            await validator.aclose()
+
+        assert methods == ["HEAD", "GET"]
+        assert "jellyfin.endpoint" not in [w.field for w in result.warnings]
+
+    @pytest.mark.asyncio
+    async def test_client_is_created_lazily_and_reopens_after_close(self):
+        """No client exists until a probe runs, and a closed validator reopens"""
+        validator = ServiceValidator({"jellyfin": {"port": 8096}})
+        assert validator._client is None
+
+        validator.open()
+        first = validator._client
+        await validator.aclose()
+        assert validator._client is None and first.is_closed
+
+        validator.open()
+        try:
+            assert validator._client is not None and not validator._client.is_closed
+        finally:
+            await validator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_hung_ffmpeg_check_times_out(self, tmp_path):
+        """A binary that never exits is killed instead of blocking validation"""
+        script = tmp_path / "ffmpeg"
+        script.write_text("#!/bin/sh\nsleep 30\n")
+        script.chmod(0o755)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await ServiceValidator._run_version_check(str(script), timeout=0.1)
+
+    @pytest.mark.asyncio
+    async def test_missing_ffmpeg_is_dependency_error(self):
+        """A missing FFmpeg binary is reported without spawning a process"""
+        validator = ServiceValidator(
+            {"remux_agent": {"ffmpeg_path": "/nonexistent/ffmpeg"}}
+        )
+        try:
+            await validator._validate_remux_agent()
+        finally:
+            await validator.aclose()
+
+        assert [e.code for e in validator.results.errors] == ["DEPENDENCY_NOT_FOUND"]
@@ -187,3 +187,21 @@ class TestErrorHandling:
             headers={"Content-Type": "application/json"}
         )
         assert response.status_code == 422
+
+
+class TestLifespan:
+    """Tests for app startup/shutdown hooks."""
+
+    def test_verifier_reopens_after_restart(self, config_repo):
+        """A second lifespan in the same process gets a fresh probe client."""
+        from orchestrator.app import app, verifier
+
+        with patch("orchestrator.app.repo", config_repo):
+            with TestClient(app):
+                first = verifier.service_validator._client
+            assert first.is_closed
+            assert verifier.service_validator._client is None
+
+            with TestClient(app):
+                client = verifier.service_validator._client
+                assert client is not None and not client.is_closed
@@ -5,14 +5,17 @@ import json
 import pytest
 from pathlib import Path
 from typing import Any, Dict
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from orchestrator.pipeline.remux import (
+    FFMPEG,
     build_ffmpeg_command,
+    build_ffmpeg_command_negative,
     probe_streams,
+    probe_streams_many,
     TrackSelection,
     StreamInfo,
 )
@@ -78,6 +81,51 @@ class TestProbeStreams:
             assert result.audio_count == 0
             assert result.subtitle_count == 0
 
+    def test_probe_cache_skips_unchanged_files(
+        self, sample_media_info: Dict[str, Any], temp_dir: Path
+    ):
+        """A configured probe cache should serve unchanged files without ffprobe."""
+        from orchestrator.pipeline.remux import configure_probe_cache
+
+        media = temp_dir / "movie.mkv"
+        media.write_bytes(b"x")
+        configure_probe_cache(temp_dir / "probe_cache.sqlite")
+        try:
+            with patch("subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(
+                    returncode=0, stdout=json.dumps(sample_media_info)
+                )
+                first = probe_streams(media)
+                configure_probe_cache(temp_dir / "probe_cache.sqlite")  # cold memory
+                second = probe_streams(media)
+                media.write_bytes(b"changed")
+                probe_streams(media)
+
+            assert mock_run.call_count == 2
+            assert first is not None and second is not None
+            assert second.raw_streams == first.raw_streams
+            assert second.audio_languages == {"eng", "rus", "jpn"}
+        finally:
+            configure_probe_cache(None)
+
+    async def test_probe_many_skips_failures(self, sample_media_info: Dict[str, Any]):
+        """Batch probing should return info only for files that probed cleanly."""
+        async def fake_exec(*cmd, **kwargs):
+            proc = MagicMock()
+            ok = cmd[-1] == "/fake/good.mkv"
+            proc.returncode = 0 if ok else 1
+            payload = json.dumps(sample_media_info).encode() if ok else b""
+            proc.communicate = AsyncMock(return_value=(payload, b""))
+            return proc
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            result = await probe_streams_many(
+                [Path("/fake/good.mkv"), Path("/fake/bad.mkv")]
+            )
+
+        assert list(result) == [Path("/fake/good.mkv")]
+        assert result[Path("/fake/good.mkv")].audio_count == 3
+
 
 class TestBuildFFmpegCommand:
     """Tests for FFmpeg command building."""
@@ -101,7 +149,7 @@ class TestBuildFFmpegCommand:
                 selection
             )
 
-            assert "ffmpeg" in cmd
+            assert cmd[0] == FFMPEG
             assert "-i" in cmd
             assert "/input.mkv" in cmd
             assert "-c" in cmd
@@ -194,6 +242,149 @@ class TestBuildFFmpegCommand:
             assert "0:a" in cmd_str
             assert "0:s" in cmd_str
 
+    def test_reuses_probed_streams(self, sample_media_info: Dict[str, Any]):
+        """A supplied StreamInfo should be used without re-running ffprobe."""
+        selection = TrackSelection(audio=["eng"], subtitles=["eng"])
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout=json.dumps(sample_media_info),
+            )
+            info = probe_streams(Path("/input.mkv"))
+            assert info is not None
+            assert info.raw_streams == sample_media_info["streams"]
+
+            cmd = build_ffmpeg_command(
+                Path("/input.mkv"),
+                Path("/output.mkv"),
+                selection,
+                stream_info=info,
+            )
+
+            assert mock_run.call_count == 1
+            assert "0:1" in cmd
+
+    def test_subtitle_filtering(self):
+        """Subtitles keep wanted languages and forced tracks, never mov_text."""
+        selection = TrackSelection(audio=["eng"], subtitles=["eng", "forced"])
+        streams = [
+            {"index": 0, "codec_type": "video", "codec_name": "h264"},
+            {"index": 1, "codec_type": "subtitle", "codec_name": "subrip",
+             "tags": {"language": "eng"}},
+            {"index": 2, "codec_type": "subtitle", "codec_name": "subrip",
+             "tags": {"language": "rus"}},
+            {"index": 3, "codec_type": "subtitle", "codec_name": "subrip",
+             "tags": {"language": "jpn"}, "disposition": {"forced": 1}},
+            {"index": 4, "codec_type": "subtitle", "codec_name": "mov_text",
+             "tags": {"language": "eng"}},
+        ]
+        info = StreamInfo(
+            audio_languages=set(),
+            subtitle_languages={"eng", "rus", "jpn"},
+            has_video=True,
+            audio_count=0,
+            subtitle_count=4,
+            raw_streams=streams,
+        )
+
+        cmd = build_ffmpeg_command(
+            Path("/input.mkv"), Path("/output.mkv"), selection, stream_info=info,
+        )
+
+        mapped = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"]
+        assert mapped == ["0:v:0?", "0:1", "0:3"]
+
+    def test_negative_map_command(self):
+        """The probe-free builder keeps everything but the dropped languages."""
+        with patch("subprocess.run") as mock_run:
+            cmd = build_ffmpeg_command_negative(
+                Path("/input.mkv"), Path("/output.mkv"), ["RUS", "rus"], ["jpn"],
+            )
+
+        mock_run.assert_not_called()
+        mapped = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"]
+        assert mapped == [
+            "0", "-0:d", "-0:a:m:language:rus", "-0:s:m:language:jpn",
+        ]
+        assert cmd[-3:] == ["-c", "copy", "/output.mkv"]
+
+    def test_sweep_untagged_subtitle_uses_full_builder(
+        self, stack_config_with_temp_paths: StackConfig, config_repo, temp_dir: Path,
+    ):
+        """Untagged subtitles scan as "und", which a negative map can't match."""
+        from orchestrator.pipeline.remux import _stream_info_from_streams
+        from orchestrator.pipeline.sweep import LibrarySweeper
+
+        movie = temp_dir / "pool" / "movies" / "Film (2020)" / "Film.mkv"
+        movie.parent.mkdir(parents=True)
+        movie.write_bytes(b"\0" * 16)
+
+        def layout(subtitle_tags):
+            return _stream_info_from_streams([
+                {"codec_type": "video"},
+                {"codec_type": "audio", "tags": {"language": "eng"}},
+                {"codec_type": "subtitle", "tags": {"language": "eng"}},
+                {"codec_type": "subtitle", "tags": subtitle_tags},
+            ])
+
+        sweeper = LibrarySweeper(stack_config_with_temp_paths, config_repo)
+        sweeper.pool_root = temp_dir / "pool"
+        sweeper._arr_data_loaded = True
+
+        for tags, can_skip in (({}, False), ({"language": "RUS"}, False),
+                               ({"language": "rus"}, True)):
+            with patch("orchestrator.pipeline.sweep.probe_streams",
+                       return_value=layout(tags)):
+                [action] = sweeper.scan().actions
+            assert action.unwanted_subtitles == [tags.get("language", "und").lower()]
+            assert sweeper._can_skip_probe(action, None) is can_skip
+
+    def test_sweep_keeps_original_audio_with_terminology_code(
+        self, stack_config_with_temp_paths: StackConfig, config_repo, temp_dir: Path,
+    ):
+        """A "fra" track is the original language when the API says "fre"."""
+        from orchestrator.pipeline.remux import _stream_info_from_streams
+        from orchestrator.pipeline.sweep import LibrarySweeper
+
+        movie = temp_dir / "pool" / "movies" / "Film (2020)" / "Film.mkv"
+        movie.parent.mkdir(parents=True)
+        movie.write_bytes(b"\0" * 16)
+        info = _stream_info_from_streams([
+            {"codec_type": "video"},
+            {"codec_type": "audio", "tags": {"language": "eng"}},
+            {"codec_type": "audio", "tags": {"language": "fra"}},
+            {"codec_type": "audio", "tags": {"language": "ger"}},
+            {"codec_type": "subtitle", "tags": {"language": "eng"}},
+        ])
+
+        sweeper = LibrarySweeper(stack_config_with_temp_paths, config_repo)
+        sweeper.pool_root = temp_dir / "pool"
+        sweeper._arr_data_loaded = True
+        with patch("orchestrator.pipeline.sweep.probe_streams", return_value=info), \
+                patch.object(sweeper, "_get_original_language_for_file",
+                             return_value="fre"):
+            [action] = sweeper.scan().actions
+
+        assert action.unwanted_audio == ["ger"]
+        assert action.kept_audio == ["eng", "fra"]
+        assert sweeper._can_skip_probe(action, "fre")
+        cmd = build_ffmpeg_command_negative(
+            action.path, Path("/out.mkv"),
+            action.unwanted_audio, action.unwanted_subtitles,
+        )
+        assert "-0:a:m:language:fra" not in cmd
+
+    def test_language_sets_are_shared_per_policy(self):
+        """Allowlists are normalised once and reused for the same policy."""
+        from orchestrator.pipeline.remux import _language_sets
+
+        first = _language_sets(("ENG", "fra"), ("eng", "forced"))
+        second = _language_sets(("ENG", "fra"), ("eng", "forced"))
+
+        assert first is second
+        assert first == (frozenset({"eng", "fre"}), frozenset({"eng"}), True)
+
 
 class TestPipelineWorker:
     """Tests for the PipelineWorker class."""
@@ -230,6 +421,28 @@ class TestPipelineWorker:
             assert plan.final_output is not None
             assert len(plan.ffmpeg_command) > 0
 
+    def test_build_plan_replay_is_cached(self, stack_config_with_temp_paths: StackConfig, temp_dir: Path):
+        """Replaying the same torrent should return the cached plan."""
+        test_file = temp_dir / "test.mkv"
+        test_file.touch()
+
+        worker = PipelineWorker(stack_config_with_temp_paths)
+        torrent_info = TorrentInfo(
+            hash="abc123",
+            name="test",
+            category="movies",
+            download_path=temp_dir,
+            files=[test_file],
+        )
+
+        with patch("orchestrator.pipeline.remux.probe_streams") as mock_probe:
+            mock_probe.return_value = None
+            first = worker.build_plan(torrent_info)
+            second = worker.build_plan(torrent_info)
+
+        assert first is second
+        assert mock_probe.call_count == 1
+
     def test_category_to_destination(self, stack_config_with_temp_paths: StackConfig):
         """Categories should map to correct destinations."""
         worker = PipelineWorker(stack_config_with_temp_paths)
@@ -257,6 +470,21 @@ class TestPipelineWorker:
         assert "jpn" in policy.audio
         assert "eng" in policy.audio
 
+    def test_pool_root_is_resolved_once(self, temp_dir: Path):
+        """Pool roots are memoised per configured path."""
+        from orchestrator.pipeline import worker
+
+        pool = temp_dir / "pool"
+        pool.mkdir()
+        worker.reset_path_cache()
+        with patch.object(Path, "exists", autospec=True, side_effect=Path.exists) as mock_exists:
+            first = worker.resolve_pool_root(str(pool))
+            second = worker.resolve_pool_root(str(pool))
+        worker.reset_path_cache()
+
+        assert first == second
+        assert mock_exists.call_count <= 2  # /data and the pool, first call only
+
 
 class TestTorrentProcessing:
     """Tests for torrent processing logic."""
@@ -274,6 +502,20 @@ class TestTorrentProcessing:
         assert runner._is_processed("existing_hash")
         assert not runner._is_processed("new_hash")
 
+    def test_processed_snapshot_writes_through(self, config_repo):
+        """Updates during a tick should hit both the snapshot and disk."""
+        from orchestrator.pipeline.runner import PipelineRunner
+        runner = PipelineRunner(config_repo)
+        runner._processed_cache = runner._processed_entries()
+
+        runner._mark_processed("new_hash", "ok")
+        assert runner._is_processed("new_hash")
+        assert "new_hash" in config_repo.load_pipeline_state()["processed"]
+
+        runner._clear_processed("new_hash")
+        assert not runner._is_processed("new_hash")
+        assert "new_hash" not in config_repo.load_pipeline_state()["processed"]
+
     def test_category_filtering(self, stack_config_with_temp_paths: StackConfig):
         """Only tracked categories should be processed."""
         from orchestrator.pipeline.runner import PipelineRunner
@@ -292,6 +534,136 @@ class TestTorrentProcessing:
         assert not runner._should_process(config, "other")
         assert not runner._should_process(config, "")
 
+    def test_cleanup_path_moves_directory_aside(self, config_repo, temp_dir: Path):
+        """Directory cleanup should rename to a hidden trash dir, then delete it."""
+        import threading
+        from orchestrator.pipeline.runner import PipelineRunner
+
+        source = temp_dir / "Some.Torrent"
+        (source / "Subs").mkdir(parents=True)
+        (source / "Subs" / "eng.srt").write_text("1")
+
+        runner = PipelineRunner(config_repo)
+        runner._cleanup_path(source)
+        assert not source.exists()
+
+        for thread in threading.enumerate():
+            if thread.name == "pipeline-trash":
+                thread.join(timeout=5)
+        assert list(temp_dir.glob(".trash-*")) == []
+
+    def test_torrent_without_video_is_skipped(
+        self, stack_config_with_temp_paths: StackConfig, config_repo, temp_dir: Path
+    ):
+        """Torrents with no video or ISO files never reach metadata lookup."""
+        from orchestrator.pipeline.runner import PipelineRunner, TorrentRecord
+
+        runner = PipelineRunner(config_repo)
+        api = MagicMock()
+        torrent = TorrentRecord(
+            hash="novideo",
+            name="Some.Album",
+            category="movies",
+            save_path=temp_dir,
+            content_path=temp_dir / "Some.Album",
+        )
+
+        with patch.object(runner, "_lookup_arr_metadata") as lookup:
+            ok = runner._process_torrent(
+                api, stack_config_with_temp_paths, torrent,
+                files=[Path("Some.Album/cover.jpg"), Path("Some.Album/info.nfo")],
+            )
+
+        assert not ok
+        lookup.assert_not_called()
+        api.remove_torrents.assert_called_once_with(["novideo"])
+        assert runner._processed_status("novideo") == "skipped_no_video"
+        assert runner._is_processed("novideo")
+
+    def test_watch_filter_only_wakes_for_new_downloads(self):
+        """Only finished, visible entries added to complete/ should wake the runner."""
+        from watchfiles import Change
+        from orchestrator.pipeline.runner import _is_new_download
+
+        assert _is_new_download(Change.added, "/downloads/complete/Movie.2024")
+        assert not _is_new_download(Change.modified, "/downloads/complete/Movie.2024")
+        assert not _is_new_download(Change.added, "/downloads/complete/movie.mkv.!qB")
+        assert not _is_new_download(Change.added, "/downloads/complete/.trash-abc")
+
+    def test_qbittorrent_relogin_on_expired_session(self):
+        """The qBittorrent client should log in lazily and again after a 403."""
+        import httpx
+        from orchestrator.pipeline.runner import QbittorrentAPI
+
+        calls: list[str] = []
+        expired = {"files": True}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            if request.url.path.endswith("/auth/login"):
+                return httpx.Response(200, text="Ok.")
+            if expired["files"]:
+                expired["files"] = False
+                return httpx.Response(403)
+            return httpx.Response(200, json=[{"name": "movie.mkv"}])
+
+        api = QbittorrentAPI("http://qb:8080", "admin", "secret")
+        api.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        assert api.list_files("abc") == [Path("movie.mkv")]
+        assert api.list_files("abc") == [Path("movie.mkv")]
+        assert calls == [
+            "/api/v2/auth/login",
+            "/api/v2/torrents/files",
+            "/api/v2/auth/login",
+            "/api/v2/torrents/files",
+            "/api/v2/torrents/files",
+        ]
+
+    def test_list_completed_parses_torrent_rows(self):
+        """Completed torrents are validated straight from the response body."""
+        import httpx
+        from orchestrator.pipeline.runner import QbittorrentAPI
+
+        rows = [
+            {
+                "hash": "abc", "name": "Movie", "category": None,
+                "save_path": "/downloads/complete", "content_path": "/downloads/complete/Movie",
+                "size": 1024, "completion_on": 1700000000, "state": "uploading",
+            },
+            {"hash": "", "name": "broken"},
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/auth/login"):
+                return httpx.Response(200, text="Ok.")
+            return httpx.Response(200, json=rows)
+
+        api = QbittorrentAPI("http://qb:8080", "admin", "secret")
+        api.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        [record] = api.list_completed()
+        assert record.hash == "abc"
+        assert record.category == ""
+        assert record.content_path == Path("/downloads/complete/Movie")
+        assert (record.size, record.completion_on) == (1024, 1700000000)
+
+    def test_batch_probe_skips_disc_payloads(self):
+        """BDMV clips and ISO torrents are left out of the up-front probe."""
+        from orchestrator.pipeline.runner import PipelineRunner, TorrentRecord
+
+        save = Path("/downloads/complete")
+        torrent = TorrentRecord("abc", "Movie", "movies", save, save / "Movie")
+        sources = PipelineRunner._batch_probe_sources
+        assert sources(torrent, [
+            Path("Movie/BDMV/STREAM/00001.m2ts"),
+            Path("Movie/Extras/trailer.mkv"),
+            Path("Movie/movie.nfo"),
+        ]) == [save / "Movie/Extras/trailer.mkv"]
+        assert sources(torrent, [
+            Path("Movie/sample.mkv"), Path("Movie/disc.iso"),
+        ]) == []
+
 
 class TestEdgeCases:
     """Tests for edge cases and error handling."""